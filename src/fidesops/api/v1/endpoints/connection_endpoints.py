@@ -27,6 +27,8 @@ from fidesops.schemas.connection_configuration.connection_secrets import (
 )
 
 from fidesops.service.connectors import get_connector
+from fidesops.service.connector_registry import connector_registry
+from fidesops.service.dataset_graph_cache import dataset_graph_cache
 from fidesops.schemas.api import BulkUpdateFailed
 from fidesops.schemas.connection_configuration.connection_config import (
     ConnectionConfigurationResponse,
@@ -149,6 +151,10 @@ def patch_connections(
                 )
             )
 
+    if created_or_updated:
+        dataset_graph_cache.invalidate()
+    for connection_config in created_or_updated:
+        connector_registry.invalidate(connection_config.key)
     return BulkPutConnectionConfiguration(
         succeeded=created_or_updated,
         failed=failed,
@@ -167,6 +173,8 @@ def delete_connection(
     connection_config = get_connection_config_or_error(db, connection_key)
     logger.info(f"Deleting connection config with key '{connection_key}'.")
     connection_config.delete(db)
+    dataset_graph_cache.invalidate()
+    connector_registry.invalidate(connection_key)
 
 
 def validate_secrets(
@@ -254,6 +262,7 @@ async def put_connection_config_secrets(
     # Save validated secrets, regardless of whether they've been verified.
     logger.info(f"Updating connection config secrets for '{connection_key}'")
     connection_config.save(db=db)
+    connector_registry.invalidate(connection_key)
 
     msg = f"Secrets updated for ConnectionConfig with key: {connection_key}."
     if verify:
@@ -43,6 +43,7 @@ from fidesops.schemas.dataset import (
     BulkPutDataset,
 )
 from fidesops.schemas.shared_schemas import FidesOpsKey
+from fidesops.service.dataset_graph_cache import dataset_graph_cache
 from fidesops.util.oauth_util import verify_oauth_client
 
 logger = logging.getLogger(__name__)
@@ -189,6 +190,8 @@ def patch_datasets(
                 )
             )
 
+    if created_or_updated:
+        dataset_graph_cache.invalidate()
     return BulkPutDataset(
         succeeded=created_or_updated,
         failed=failed,
@@ -315,3 +318,4 @@ def delete_dataset(
         f"Deleting dataset '{fides_key}' for connection '{connection_config.key}'"
     )
     dataset_config.delete(db)
+    dataset_graph_cache.invalidate()
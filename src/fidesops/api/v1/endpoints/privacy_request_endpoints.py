@@ -27,6 +27,7 @@ from fidesops.common_exceptions import (
     TraversalError,
     ValidationError,
 )
+from fidesops.core.config import config
 from fidesops.graph.config import CollectionAddress
 from fidesops.graph.graph import DatasetGraph
 from fidesops.graph.traversal import Traversal
@@ -182,10 +183,12 @@ def create_privacy_request(
                     for masking_secret in masking_secrets:
                         privacy_request.cache_masking_secret(masking_secret)
 
-            PrivacyRequestRunner(
-                cache=cache,
-                privacy_request=privacy_request,
-            ).submit()
+            if not config.execution.REQUEST_BATCH_INTERVAL:
+                # Otherwise the request is left pending until the next batch is run
+                PrivacyRequestRunner(
+                    cache=cache,
+                    privacy_request=privacy_request,
+                ).submit()
 
         except common_exceptions.RedisConnectionError as exc:
             logger.error("RedisConnectionError: %s", exc)
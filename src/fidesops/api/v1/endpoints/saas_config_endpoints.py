@@ -25,6 +25,7 @@ from fidesops.schemas.saas.saas_config import (
     SaaSConfigValidationDetails,
     ValidateSaaSConfigResponse,
 )
+from fidesops.service.dataset_graph_cache import dataset_graph_cache
 from fidesops.util.oauth_util import verify_oauth_client
 
 
@@ -96,6 +97,7 @@ def patch_saas_config(
         f"Updating SaaS config '{saas_config.fides_key}' on connection config '{connection_config.key}'"
     )
     connection_config.update(db, data={"saas_config": saas_config.dict()})
+    dataset_graph_cache.invalidate()
     return connection_config.saas_config
 
 
@@ -170,3 +172,4 @@ def delete_saas_config(
 
     logger.info(f"Deleting SaaS config for connection '{connection_config.key}'")
     connection_config.update(db, data={"saas_config": None})
+    dataset_graph_cache.invalidate()
@@ -145,6 +145,7 @@ class ClientUnsuccessfulException(FidesopsException):
 
     def __init__(self, status_code: int):
         super().__init__(message=f"Client call failed with status code '{status_code}'")
+        self.status_code = status_code
 
 
 class NoSuchStrategyException(ValueError):
@@ -15,6 +15,7 @@ from pydantic import (
     validator,
 )
 from pydantic.env_settings import SettingsSourceCallable
+from pydantic.fields import ModelField
 
 from fidesops.common_exceptions import MissingConfig
 from fidesops.util.logger import NotPii
@@ -91,6 +92,78 @@ class ExecutionSettings(FidesSettings):
     TASK_RETRY_COUNT: int
     TASK_RETRY_DELAY: int  # In seconds
     TASK_RETRY_BACKOFF: int
+    TASK_EXECUTOR: str = "threads"
+    TASK_CONCURRENCY: int = 10  # Max collections run at once within a privacy request
+    STREAM_ACCESS_RESULTS: bool = False
+    STREAM_BATCH_SIZE: int = 1000  # Rows per batch passed between collections
+    STREAM_BUFFER_SIZE: int = 10  # Batches waiting to be read by a collection
+    MAX_QUERY_INPUT_VALUES: int = 10000  # Input values in a single query
+    QUERY_CHUNK_CONCURRENCY: int = 1  # Chunks of one oversized query run at once
+    ERASURE_BATCH_SIZE: int = 1000  # Updates sent to a datastore at once when masking
+    MAX_ROWS_PER_NODE: Optional[int] = None  # Rows kept per collection, if limited
+    CURSOR_BATCH_SIZE: int = 1000  # Rows fetched per round trip to a database
+    MONGO_MAX_TIME_MS: Optional[int] = None  # Server time limit for a MongoDB query
+    POOL_SIZE: int = 5  # Connections kept open to each SQL datastore
+    POOL_MAX_OVERFLOW: int = 10  # Connections a SQL pool can open beyond POOL_SIZE
+    POOL_RECYCLE: int = 3600  # Seconds a pooled connection is kept; -1 for no limit
+    POOL_PRE_PING: bool = True  # Check a pooled connection is alive before using it
+    POOL_OVERRIDES: Dict[str, Dict[str, Any]] = {}  # Pool settings by connection type
+    EXECUTION_LOG_BATCH_SIZE: int = 100  # Execution logs inserted in one transaction
+    EXECUTION_LOG_FLUSH_INTERVAL: float = 1.0  # Max seconds before logs are inserted
+    REQUEST_BATCH_INTERVAL: Optional[int] = None  # Seconds between batches of requests
+    REQUEST_BATCH_SIZE: int = 500  # Pending requests run in one batch
+
+    @validator("TASK_EXECUTOR")
+    def validate_task_executor(cls, v: str) -> str:
+        """Validate the task executor is one of the supported backends"""
+        allowed = ("threads", "synchronous", "asyncio")
+        if v not in allowed:
+            raise ValueError(f"TASK_EXECUTOR must be one of {', '.join(allowed)}")
+        return v
+
+    @validator("POOL_OVERRIDES")
+    def validate_pool_overrides(
+        cls, v: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Validate connection types only override the pool settings"""
+        allowed = {"POOL_SIZE", "POOL_MAX_OVERFLOW", "POOL_RECYCLE", "POOL_PRE_PING"}
+        for connection_type, overrides in v.items():
+            unknown = set(overrides) - allowed
+            if unknown:
+                raise ValueError(
+                    f"POOL_OVERRIDES for {connection_type} can only set {', '.join(sorted(allowed))}"
+                )
+        return v
+
+    @validator("EXECUTION_LOG_FLUSH_INTERVAL")
+    def validate_execution_log_flush_interval(cls, v: float) -> float:
+        """Validate the execution log writer waits between flushes, rather than spinning"""
+        if v <= 0:
+            raise ValueError("EXECUTION_LOG_FLUSH_INTERVAL must be greater than 0")
+        return v
+
+    @validator(
+        "TASK_CONCURRENCY",
+        "STREAM_BATCH_SIZE",
+        "STREAM_BUFFER_SIZE",
+        "MAX_QUERY_INPUT_VALUES",
+        "QUERY_CHUNK_CONCURRENCY",
+        "ERASURE_BATCH_SIZE",
+        "MAX_ROWS_PER_NODE",
+        "CURSOR_BATCH_SIZE",
+        "MONGO_MAX_TIME_MS",
+        "POOL_SIZE",
+        "EXECUTION_LOG_BATCH_SIZE",
+        "REQUEST_BATCH_INTERVAL",
+        "REQUEST_BATCH_SIZE",
+    )
+    def validate_at_least_one(
+        cls, v: Optional[int], field: ModelField
+    ) -> Optional[int]:
+        """Validate sizes, limits and concurrency settings are at least 1, where they are set"""
+        if v is not None and v < 1:
+            raise ValueError(f"{field.name} must be at least 1")
+        return v
 
     class Config:
         env_prefix = "FIDESOPS__EXECUTION__"
@@ -277,6 +350,26 @@ CONFIG_KEY_ALLOWLIST = {
         "TASK_RETRY_COUNT",
         "TASK_RETRY_DELAY",
         "TASK_RETRY_BACKOFF",
+        "TASK_EXECUTOR",
+        "TASK_CONCURRENCY",
+        "STREAM_ACCESS_RESULTS",
+        "STREAM_BATCH_SIZE",
+        "STREAM_BUFFER_SIZE",
+        "MAX_QUERY_INPUT_VALUES",
+        "QUERY_CHUNK_CONCURRENCY",
+        "ERASURE_BATCH_SIZE",
+        "MAX_ROWS_PER_NODE",
+        "CURSOR_BATCH_SIZE",
+        "MONGO_MAX_TIME_MS",
+        "POOL_SIZE",
+        "POOL_MAX_OVERFLOW",
+        "POOL_RECYCLE",
+        "POOL_PRE_PING",
+        "POOL_OVERRIDES",
+        "EXECUTION_LOG_BATCH_SIZE",
+        "EXECUTION_LOG_FLUSH_INTERVAL",
+        "REQUEST_BATCH_INTERVAL",
+        "REQUEST_BATCH_SIZE",
     ],
 }
 
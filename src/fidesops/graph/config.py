@@ -81,7 +81,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import List, Literal, Optional, Tuple, Set, Dict, Any, Callable
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from fidesops.common_exceptions import FidesopsException
 from fidesops.graph.data_type import (
@@ -388,25 +388,49 @@ class MaskingOverride:
 
 
 class Collection(BaseModel):
-    """A single grouping of individual data points that are accessed together"""
+    """A single grouping of individual data points that are accessed together
+
+    The field indexes (`field_dict`, `references()`, `identities()`, `field_paths_by_category`,
+    ...) are each built on first use and then reused, so a Collection's fields shouldn't be
+    changed once they've been read through one of them.
+    """
 
     name: str
     fields: List[Field]
     # an optional list of collections that this collection must run after
     after: Set[CollectionAddress] = set()
 
+    _field_dict: Optional[Dict[FieldPath, Field]] = PrivateAttr(default=None)
+    _top_level_field_dict: Optional[Dict[FieldPath, Field]] = PrivateAttr(default=None)
+    _references: Optional[
+        Dict[FieldPath, List[Tuple[FieldAddress, Optional[EdgeDirection]]]]
+    ] = PrivateAttr(default=None)
+    _identities: Optional[Dict[FieldPath, Tuple[str, ...]]] = PrivateAttr(default=None)
+    _field_paths_by_category: Optional[
+        Dict[FidesOpsKey, List[FieldPath]]
+    ] = PrivateAttr(default=None)
+    _primary_key_field_paths: Optional[Dict[FieldPath, Field]] = PrivateAttr(
+        default=None
+    )
+
     @property
     def field_dict(self) -> Dict[FieldPath, Field]:
         """Maps FieldPaths to Fields
 
         Flattens all the Fields so they are on one level: all nested fields are brought to the top.
         """
-        return self.recursively_collect_matches(lambda f: True)
+        if self._field_dict is None:
+            self._field_dict = self.recursively_collect_matches(lambda f: True)
+        return self._field_dict
 
     @property
     def top_level_field_dict(self) -> Dict[FieldPath, Field]:
         """Returns a map of top-level FieldPaths mapped to fields"""
-        return {FieldPath(field.name): field for field in self.fields}
+        if self._top_level_field_dict is None:
+            self._top_level_field_dict = {
+                FieldPath(field.name): field for field in self.fields
+            }
+        return self._top_level_field_dict
 
     def recursively_collect_matches(
         self, func: Callable[[Field], bool]
@@ -423,23 +447,38 @@ class Collection(BaseModel):
 
         A nested field can be a reference.
         """
-        return {
-            field_path: field.references
-            for field_path, field in self.field_dict.items()
-            if field.references
-        }
+        if self._references is None:
+            self._references = {
+                field_path: field.references
+                for field_path, field in self.field_dict.items()
+                if field.references
+            }
+        return self._references
 
     def identities(self) -> Dict[FieldPath, Tuple[str, ...]]:
         """return identity pointers included in the table"""
-        return {
-            field_path: field.identity
-            for field_path, field in self.field_dict.items()
-            if field.identity
-        }
+        if self._identities is None:
+            self._identities = {
+                field_path: field.identity
+                for field_path, field in self.field_dict.items()
+                if field.identity
+            }
+        return self._identities
 
     def field(self, field_path: FieldPath) -> Optional[Field]:
         """Return Field (looked up by FieldPath) if on Collection or None if not found"""
-        return self.field_dict[field_path] if field_path in self.field_dict else None
+        return self.field_dict.get(field_path)
+
+    @property
+    def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
+        """Mapping of FieldPaths to Fields that are marked as PK's"""
+        if self._primary_key_field_paths is None:
+            self._primary_key_field_paths = {
+                field_path: field
+                for field_path, field in self.field_dict.items()
+                if field.primary_key
+            }
+        return self._primary_key_field_paths
 
     @property
     def field_paths_by_category(self) -> Dict[FidesOpsKey, List[FieldPath]]:
@@ -455,11 +494,13 @@ class Collection(BaseModel):
                 "user.provided.identifiable.contact.postal_code": ["zip"]
             }
         """
-        categories = defaultdict(list)
-        for field_path, field in self.field_dict.items():
-            for category in field.data_categories or []:
-                categories[category].append(field_path)
-        return categories
+        if self._field_paths_by_category is None:
+            categories = defaultdict(list)
+            for field_path, field in self.field_dict.items():
+                for category in field.data_categories or []:
+                    categories[category].append(field_path)
+            self._field_paths_by_category = categories
+        return self._field_paths_by_category
 
     class Config:
         """for pydantic incorporation of custom non-pydantic types"""
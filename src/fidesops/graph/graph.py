@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Tuple, Set, Dict, Optional, List, Callable
+from typing import Tuple, Set, Dict, Optional, List, Callable, Hashable
 
 from fidesops.common_exceptions import ValidationError
 from fidesops.graph.config import (
@@ -52,7 +52,7 @@ class Node:
         Currently used to assert at least one field in the collection contains a primary
         key before erasing
         """
-        return any(self.collection.recursively_collect_matches(func))
+        return any(func(field) for field in self.collection.field_dict.values())
 
 
 class Edge:
@@ -188,6 +188,10 @@ class DatasetGraph:
         this is a destructive operation on the input datasets, as it
         will alter references within them"""
 
+        self.version: Optional[Hashable] = None
+        """Identifies the configuration this graph was built from, if known. Traversals of graphs
+        with the same version share their TraversalPlans."""
+
         # build nodes
         nodes = [Node(dr, ds) for dr in datasets for ds in dr.collections]
         self.nodes: dict[CollectionAddress, Node] = {
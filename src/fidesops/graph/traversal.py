@@ -1,7 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Any, Tuple, Set, Dict, Callable, cast
+from collections import Counter, defaultdict
+from typing import (
+    List,
+    Any,
+    Tuple,
+    Set,
+    Dict,
+    Callable,
+    Optional,
+    Hashable,
+    FrozenSet,
+    cast,
+)
 
 import pydash.collections
 
@@ -15,10 +27,11 @@ from fidesops.graph.config import (
     FieldPath,
     Field,
 )
-from fidesops.graph.graph import Node, Edge, DatasetGraph
+from fidesops.graph.graph import Node, Edge, BidirectionalEdge, DatasetGraph
 from fidesops.util.logger import NotPii
+from fidesops.util.lru_cache import LRUCache
 from fidesops.util.matching_queue import MatchingQueue
-from fidesops.util.collection_util import append, Row
+from fidesops.util.collection_util import append, partition, unique, Row
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +42,12 @@ Datastore = Dict[CollectionAddress, List[Row]]
 
 
 class TraversalNode:
-    """Base traversal traversal_node type. This type will never be used directly."""
+    """Base traversal traversal_node type. This type will never be used directly.
+
+    The edge sets, query field paths and incoming field path map are derived from `parents`
+    and `children` on first use and then frozen, so the per-node hot paths don't rebuild them.
+    They are recomputed if another child is added.
+    """
 
     def __init__(self, node: Node):
         self.node = node
@@ -43,6 +61,12 @@ class TraversalNode:
             CollectionAddress, List[Tuple[TraversalNode, FieldPath, FieldPath]]
         ] = {}
         self.is_terminal_node = False
+        # the derived edge data, by name of the method or property that derives it
+        self._frozen: Dict[str, Any] = {}
+
+    def _unfreeze(self) -> None:
+        """Drop the derived edge data, after this traversal_node's parents or children change"""
+        self._frozen.clear()
 
     def add_child(self, child_node: TraversalNode, edge: Edge) -> None:
         """Add other as a child to this traversal_node along the provided edge."""
@@ -63,50 +87,78 @@ class TraversalNode:
                 self_field_address.collection_address(),
                 (self, self_field_address.field_path, other_field_address.field_path),
             )
+            self._unfreeze()
+            child_node._unfreeze()  # pylint: disable=protected-access
 
-    def incoming_edges(self) -> Set[Edge]:
+    def incoming_edges(self) -> FrozenSet[Edge]:
         """Return the incoming edges to this traversal_node,in (other.address -> self.address) order."""
-        return {
-            Edge(
-                p_collection_address.field_address(parent_field_path),
-                self.address.field_address(self_field_path),
+        if "incoming_edges" not in self._frozen:
+            self._frozen["incoming_edges"] = frozenset(
+                Edge(
+                    p_collection_address.field_address(parent_field_path),
+                    self.address.field_address(self_field_path),
+                )
+                for p_collection_address, tuples in self.parents.items()
+                for _, parent_field_path, self_field_path in tuples
             )
-            for p_collection_address, tuples in self.parents.items()
-            for _, parent_field_path, self_field_path in tuples
-        }
+        return self._frozen["incoming_edges"]
 
-    def outgoing_edges(self) -> Set[Edge]:
+    def outgoing_edges(self) -> FrozenSet[Edge]:
         """Return the outgoing edges to this traversal_node,in (self.address -> other.address) order."""
-        return {
-            Edge(
-                self.address.field_address(self_field_path),
-                c_collection_address.field_address(child_field_path),
+        if "outgoing_edges" not in self._frozen:
+            self._frozen["outgoing_edges"] = frozenset(
+                Edge(
+                    self.address.field_address(self_field_path),
+                    c_collection_address.field_address(child_field_path),
+                )
+                for c_collection_address, tuples in self.children.items()
+                for _, self_field_path, child_field_path in tuples
             )
-            for c_collection_address, tuples in self.children.items()
-            for _, self_field_path, child_field_path in tuples
-        }
+        return self._frozen["outgoing_edges"]
 
     @property
-    def query_field_paths(self) -> Set[FieldPath]:
+    def query_field_paths(self) -> FrozenSet[FieldPath]:
         """
         All of the possible field paths that we can query for possible filter values.
         These are field paths that are the ends of incoming edges.
         """
-        return {edge.f2.field_path for edge in self.incoming_edges()}
+        if "query_field_paths" not in self._frozen:
+            self._frozen["query_field_paths"] = frozenset(
+                edge.f2.field_path for edge in self.incoming_edges()
+            )
+        return self._frozen["query_field_paths"]
+
+    @property
+    def incoming_field_path_map(
+        self,
+    ) -> Dict[CollectionAddress, List[Tuple[FieldPath, FieldPath]]]:
+        """The incoming edges grouped by parent, in the form {parent address: [(parent field path, local field path)]}"""
+        if "incoming_field_path_map" not in self._frozen:
+            edges_by_parent: Dict[CollectionAddress, List[Edge]] = partition(
+                self.incoming_edges(), lambda e: e.f1.collection_address()
+            )
+            self._frozen["incoming_field_path_map"] = {
+                col_addr: [
+                    (edge.f1.field_path, edge.f2.field_path) for edge in edge_list
+                ]
+                for col_addr, edge_list in edges_by_parent.items()
+            }
+        return self._frozen["incoming_field_path_map"]
 
     def typed_filtered_values(self, input_data: Dict[str, List[Any]]) -> Dict[str, Any]:
         """
         Return a filtered list of key/value sets of data items that are both in
         the list of incoming edge fields, and contain data in the input data set.
 
-        The values are cast based on field types, if those types are specified.
+        The values are cast based on field types, if those types are specified. Values that are
+        the same once cast are only returned once, in the order they first appear.
         """
         out = {}
         for key, values in input_data.items():
             path: FieldPath = FieldPath.parse(key)
             field: Field = self.node.collection.field(path)
             if field and path in self.query_field_paths and isinstance(values, list):
-                cast_values = [field.cast(v) for v in values]
+                cast_values = unique(field.cast(v) for v in values)
                 filtered = list(filter(lambda x: x is not None, cast_values))
                 if filtered:
                     out[key] = filtered
@@ -165,8 +217,79 @@ def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     return TraversalNode(node)
 
 
+class TraversalPlan:
+    """The shape of a traversal, worked out once and then replayed.
+
+    A traversal depends only on the graph and on which identity keys are seeded, not on the
+    identity values. So the order the nodes run in, the edges wired between them and the end
+    nodes can be shared by every traversal of the same graph version with the same identity keys.
+    """
+
+    def __init__(
+        self,
+        traversal: Traversal,
+        order: List[CollectionAddress],
+        end_nodes: List[CollectionAddress],
+    ):
+        self.order = order
+        self.end_nodes = end_nodes
+        # (parent address, child address, parent field path, child field path)
+        self.edges: List[
+            Tuple[CollectionAddress, CollectionAddress, FieldPath, FieldPath]
+        ] = [
+            (tn.address, child.address, parent_field_path, child_field_path)
+            for tn in traversal.all_traversal_nodes()
+            for tuples in tn.children.values()
+            for child, parent_field_path, child_field_path in tuples
+        ]
+
+    def apply(self, traversal: Traversal) -> None:
+        """Wire the (fresh) traversal nodes of the given traversal as this plan describes"""
+        nodes: Dict[CollectionAddress, TraversalNode] = {
+            tn.address: tn for tn in traversal.all_traversal_nodes()
+        }
+        for parent, child, parent_field_path, child_field_path in self.edges:
+            append(
+                nodes[parent].children,
+                child,
+                (nodes[child], parent_field_path, child_field_path),
+            )
+            append(
+                nodes[child].parents,
+                parent,
+                (nodes[parent], parent_field_path, child_field_path),
+            )
+        for address in self.end_nodes:
+            nodes[address].is_terminal_node = True
+
+    def run(
+        self,
+        traversal: Traversal,
+        environment: Dict[CollectionAddress, Any],
+        node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
+    ) -> List[CollectionAddress]:
+        """Call node_run_fn on each traversal_node of the given traversal in the planned order,
+        returning the end node addresses"""
+        nodes: Dict[CollectionAddress, TraversalNode] = {
+            tn.address: tn for tn in traversal.all_traversal_nodes()
+        }
+        for address in self.order:
+            node_run_fn(nodes[address], environment)
+        return list(self.end_nodes)
+
+
+# process-wide cache of TraversalPlans, keyed by graph version and seeded identity keys. Only
+# graphs with a `version` (see `DatasetGraph.version`) are cached.
+traversal_plan_cache: LRUCache[Hashable, TraversalPlan] = LRUCache(maxsize=256)
+
+
 class Traversal:
-    """Handling for a single reified traversal of a graph based on input (seed) data."""
+    """Handling for a single reified traversal of a graph based on input (seed) data.
+
+    The traversal is worked out (and verified) once, when it is created. Every later call to
+    `traverse` replays the resulting TraversalPlan, which is also shared with later Traversals
+    of the same graph version and identity keys.
+    """
 
     def extract_seed_field_addresses(
         self,
@@ -201,15 +324,38 @@ class Traversal:
                 )
             )
 
+        self.plan: Optional[TraversalPlan] = None
+        plan_key: Optional[Hashable] = (
+            (graph.version, frozenset(self.extract_seed_field_addresses().values()))
+            if graph.version is not None
+            else None
+        )
+        plan = traversal_plan_cache.get(plan_key) if plan_key is not None else None
+        if plan:
+            plan.apply(self)
+            self.plan = plan
+            return
+
         self.__verify_traversal()
+        if plan_key is not None:
+            traversal_plan_cache.set(plan_key, cast(TraversalPlan, self.plan))
 
     def __verify_traversal(self) -> None:
         """Verify that a valid traversal exists. This method simply assembles a traversal
-        and raises an error on any traversal failure conditions."""
-        self.traverse(
-            {self.root_node.address: [self.seed_data]},
-            lambda n, m: logger.info("Traverse %s", NotPii(n.address)),
-        )
+        and raises an error on any traversal failure conditions. The traversal is kept as
+        this Traversal's plan."""
+        order: List[CollectionAddress] = []
+
+        def record_fn(n: TraversalNode, _: Dict[CollectionAddress, Any]) -> None:
+            logger.info("Traverse %s", NotPii(n.address))
+            order.append(n.address)
+
+        end_nodes = self.traverse({self.root_node.address: [self.seed_data]}, record_fn)
+        self.plan = TraversalPlan(self, order, end_nodes)
+
+    def all_traversal_nodes(self) -> List[TraversalNode]:
+        """The root traversal_node followed by the traversal_node for each collection"""
+        return [self.root_node, *self.traversal_node_dict.values()]
 
     def traversal_map(
         self,
@@ -235,7 +381,7 @@ class Traversal:
 
         return {str(k): v for k, v in db.items()}, traversal_ends
 
-    def traverse(  # pylint: disable=R0914
+    def traverse(
         self,
         environment: Dict[CollectionAddress, Any],
         node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
@@ -267,66 +413,76 @@ class Traversal:
         We also raise a TraversalError if the queue is empty but some nodes have not been visited. In
         that case they are unreachable.
 
+        The remaining edges are indexed by the collections at either end, so each step only looks at
+        the edges of the traversal_node that just ran, and the work done scales with the size of
+        the graph rather than with nodes x edges.
         """
         if environment:
             logger.info(
                 "starting traversal",
             )
+        if self.plan:
+            # the traversal has already been worked out, so run the nodes in the same order
+            return self.plan.run(self, environment, node_run_fn)
+
         remaining_node_keys: Set[CollectionAddress] = set(
             self.traversal_node_dict.keys()
         )
+        # the number of remaining nodes in each dataset, for checking dataset "after" constraints
+        remaining_datasets: Dict[str, int] = Counter(
+            address.dataset for address in remaining_node_keys
+        )
         finished_nodes: dict[CollectionAddress, TraversalNode] = {}
+        # the order nodes first finished in
+        finish_order: Dict[CollectionAddress, int] = {}
         running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
-        remaining_edges: Set[Edge] = self.edges.copy()
+        # remaining edges indexed by the collections at either end
+        remaining_edges_by_address: Dict[
+            CollectionAddress, Set[Edge]
+        ] = index_edges_by_address(self.edges)
+
+        def waiting_for(tn: TraversalNode) -> List[Hashable]:
+            """The remaining nodes and datasets that this traversal_node has to run after; see `can_run_given`"""
+            return [
+                address
+                for address in tn.node.collection.after
+                if address in remaining_node_keys
+            ] + [
+                dataset
+                for dataset in tn.node.dataset.after
+                if dataset in remaining_datasets
+            ]
+
         while not running_node_queue.is_empty():
 
             # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
-            )
+            # queued nodes are blocked on any nodes or datasets they must run after (see `waiting_for`)
+            n = running_node_queue.pop_first_ready()
 
             if n:
                 node_run_fn(n, environment)
-                # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,
-                    )
-                    # append edges that end in this traversal_node
-                    for edge in filter(
-                        lambda _edge: _edge.ends_with_collection(
-                            cast(TraversalNode, n).address
-                        ),
-                        completed_edges,
-                    ):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
-                # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
-                # in the form (field_address_this, field_address_foreign)
-
-                edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
+                remove_completed_edges(
+                    n, remaining_edges_by_address, finished_nodes, finish_order
                 )
-                if not edges_to_children:
+                child_node_addresses = child_addresses(n, remaining_edges_by_address)
+                if not child_node_addresses:
                     n.is_terminal_node = True
-
-                # child traversal_node addresses are the address portion of the above
-                child_node_addresses = {
-                    a[1].collection_address() for a in edges_to_children if a
-                }
-                for nxt_address in child_node_addresses:
-                    # only add the next traversal_node to the queue if it is not already there (no duplicates)
-                    running_node_queue.push_if_new(
-                        self.traversal_node_dict[nxt_address]
-                    )
+                # queue children in a stable order, so traversals are the same from run to run.
+                # only add the next traversal_node to the queue if it is not already there (no duplicates)
+                for nxt in [
+                    self.traversal_node_dict[address]
+                    for address in sorted(child_node_addresses, key=str)
+                ]:
+                    running_node_queue.push_if_new(nxt, waiting_for(nxt))
                 finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+                finish_order.setdefault(n.address, len(finish_order))
+                if n.address in remaining_node_keys:
+                    release_finished_node(
+                        n.address,
+                        remaining_node_keys,
+                        remaining_datasets,
+                        running_node_queue,
+                    )
             else:
                 # traversal traversal_node dict diff finished nodes
                 logger.error(
@@ -346,6 +502,7 @@ class Traversal:
                 f"Some nodes were not reachable: {','.join([str(x) for x in remaining_node_keys])}"
             )
         # error if there are edges that have not been visited
+        remaining_edges: Set[Edge] = set().union(*remaining_edges_by_address.values())
         if remaining_edges:
             logger.error(
                 f"Some edges were not reachable: {','.join([str(x) for x in remaining_edges])}"
@@ -360,3 +517,74 @@ class Traversal:
         if environment:
             logger.debug(f"Found {len(end_nodes)} end nodes: {end_nodes}")
         return end_nodes
+
+
+def index_edges_by_address(edges: Set[Edge]) -> Dict[CollectionAddress, Set[Edge]]:
+    """The edges indexed by the collections at either end"""
+    edges_by_address: Dict[CollectionAddress, Set[Edge]] = defaultdict(set)
+    for edge in edges:
+        edges_by_address[edge.f1.collection_address()].add(edge)
+        edges_by_address[edge.f2.collection_address()].add(edge)
+    return edges_by_address
+
+
+def release_finished_node(
+    address: CollectionAddress,
+    remaining_node_keys: Set[CollectionAddress],
+    remaining_datasets: Dict[str, int],
+    running_node_queue: MatchingQueue[TraversalNode],
+) -> None:
+    """Mark a traversal_node as no longer remaining, along with its dataset once every node in
+    it has run, so that queued nodes waiting to run after them become ready."""
+    remaining_node_keys.remove(address)
+    running_node_queue.release(address)
+    remaining_datasets[address.dataset] -= 1
+    if not remaining_datasets[address.dataset]:
+        del remaining_datasets[address.dataset]
+        running_node_queue.release(address.dataset)
+
+
+def remove_completed_edges(
+    tn: TraversalNode,
+    remaining_edges_by_address: Dict[CollectionAddress, Set[Edge]],
+    finished_nodes: Dict[CollectionAddress, TraversalNode],
+    finish_order: Dict[CollectionAddress, int],
+) -> None:
+    """Delete all remaining edges between any finished nodes and the traversal_node that's just run
+    (edges from a finished node, or bidirectional edges), making it a child of those nodes.
+
+    Finished nodes are taken in the order they finished, so children are added in the same order
+    from run to run."""
+    completed_edges: Dict[CollectionAddress, List[Edge]] = {}
+    for edge in remaining_edges_by_address[tn.address]:
+        other_end: Optional[FieldAddress] = (
+            edge.f1
+            if edge.f2.collection_address() == tn.address
+            else edge.f2
+            if isinstance(edge, BidirectionalEdge)
+            else None
+        )
+        if other_end and other_end.collection_address() in finished_nodes:
+            append(completed_edges, other_end.collection_address(), edge)
+
+    for finished_node_address in sorted(
+        completed_edges, key=lambda address: finish_order[address]
+    ):
+        for edge in completed_edges[finished_node_address]:
+            remaining_edges_by_address[edge.f1.collection_address()].discard(edge)
+            remaining_edges_by_address[edge.f2.collection_address()].discard(edge)
+            # these edges all end in this traversal_node
+            # note, this will not work for self-reference
+            finished_nodes[finished_node_address].add_child(tn, edge)
+
+
+def child_addresses(
+    tn: TraversalNode,
+    remaining_edges_by_address: Dict[CollectionAddress, Set[Edge]],
+) -> Set[CollectionAddress]:
+    """The addresses of the collections at the other end of the remaining edges including tn"""
+    # in the form (field_address_this, field_address_foreign)
+    edges_to_children = pydash.collections.filter_(
+        [e.split_by_address(tn.address) for e in remaining_edges_by_address[tn.address]]
+    )
+    return {a[1].collection_address() for a in edges_to_children if a}
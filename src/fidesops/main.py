@@ -8,7 +8,10 @@ from fidesops.api.v1.urn_registry import V1_URL_PREFIX
 from fidesops.db.database import init_db
 from fidesops.core.config import config
 from fidesops.tasks.scheduled.scheduler import scheduler
-from fidesops.tasks.scheduled.tasks import initiate_scheduled_request_intake
+from fidesops.tasks.scheduled.tasks import (
+    initiate_scheduled_request_batches,
+    initiate_scheduled_request_intake,
+)
 from fidesops.util.logger import get_fides_log_record_factory
 
 logging.basicConfig(level=logging.INFO)
@@ -39,6 +42,7 @@ def start_webserver() -> None:
 
     logger.info("Starting scheduled request intake...")
     initiate_scheduled_request_intake()
+    initiate_scheduled_request_batches()
 
     logger.info("Starting web server...")
     uvicorn.run(
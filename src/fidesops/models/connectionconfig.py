@@ -10,6 +10,7 @@ from sqlalchemy import (
     String,
     DateTime,
     Boolean,
+    Integer,
 )
 
 from sqlalchemy.dialects.postgresql import JSONB
@@ -87,6 +88,12 @@ class ConnectionConfig(Base):
     )  # Type bytea in the db
     last_test_timestamp = Column(DateTime(timezone=True))
     last_test_succeeded = Column(Boolean)
+    # the max number of queries fidesops will run against this connection at once, across
+    # all in-flight privacy requests. Unlimited if not set.
+    concurrency_limit = Column(Integer, nullable=True)
+    # the max number of input values passed to a single query against this connection. Larger
+    # inputs are split into several queries. Defaults to a limit suited to the connection type.
+    max_in_values = Column(Integer, nullable=True)
 
     # only applicable to ConnectionConfigs of connection type saas
     saas_config = Column(
@@ -4,7 +4,7 @@ from datetime import datetime
 
 import json
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 from enum import Enum as EnumType
 from sqlalchemy.dialects.postgresql import JSONB
@@ -50,6 +50,9 @@ from fidesops.util.cache import (
 )
 from fidesops.util.oauth_util import generate_jwe
 
+if TYPE_CHECKING:
+    from fidesops.service.connectors import HTTPSConnector
+
 logger = logging.getLogger(__name__)
 
 
@@ -196,10 +199,38 @@ class PrivacyRequest(Base):
         Pre-Execution webhooks send headers to the webhook in case the service needs to send back instructions
         to halt.  To resume, they use send a request to the reply-to URL with the reply-to-token.
         """
+        https_connector, request_body, response_expected, headers = self._webhook_call(
+            webhook
+        )
+        response: Optional[Dict[str, Any]] = https_connector.execute(
+            request_body,
+            response_expected=response_expected,
+            additional_headers=headers,
+        )
+        self._handle_webhook_response(webhook, response)
+
+    async def atrigger_policy_webhook(self, webhook: WebhookTypes) -> None:
+        """Trigger a request to a single customer-defined policy webhook without blocking the event loop.
+        Raises the same exceptions as trigger_policy_webhook."""
+        https_connector, request_body, response_expected, headers = self._webhook_call(
+            webhook
+        )
+        response: Optional[Dict[str, Any]] = await https_connector.aexecute(
+            request_body,
+            response_expected=response_expected,
+            additional_headers=headers,
+        )
+        self._handle_webhook_response(webhook, response)
+
+    def _webhook_call(
+        self, webhook: WebhookTypes
+    ) -> Tuple["HTTPSConnector", Dict[str, Any], bool, Dict[str, Any]]:
+        """The connector, request body, whether a response is expected, and the headers
+        to call the webhook with"""
         # temp fix for circular dependency
-        from fidesops.service.connectors import HTTPSConnector, get_connector
+        from fidesops.service.connectors import get_connector
 
-        https_connector: HTTPSConnector = get_connector(webhook.connection_config)
+        https_connector: "HTTPSConnector" = get_connector(webhook.connection_config)
         request_body = SecondPartyRequestFormat(
             privacy_request_id=self.id,
             direction=webhook.direction.value,
@@ -217,11 +248,12 @@ class PrivacyRequest(Base):
             }
 
         logger.info(f"Calling webhook {webhook.key} for privacy_request {self.id}")
-        response: Optional[SecondPartyResponseFormat] = https_connector.execute(
-            request_body.dict(),
-            response_expected=response_expected,
-            additional_headers=headers,
-        )
+        return https_connector, request_body.dict(), response_expected, headers
+
+    def _handle_webhook_response(
+        self, webhook: WebhookTypes, response: Optional[Dict[str, Any]]
+    ) -> None:
+        """Cache any identities the webhook derived, and pause if it told us to halt"""
         if not response:
             return
 
@@ -237,13 +269,11 @@ class PrivacyRequest(Base):
             self.cache_identity(response_body.derived_identity)
 
         # Pause execution if instructed
-        if response_body.halt and is_pre_webhook:
+        if response_body.halt and webhook.__class__ == PolicyPreWebhook:
             raise PrivacyRequestPaused(
                 f"Halt instruction received on privacy request {self.id}."
             )
 
-        return
-
     def start_processing(self, db: Session) -> None:
         """Dispatches this PrivacyRequest throughout the Fidesops System"""
         if self.started_processing_at is None:
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import Extra, BaseModel
+from pydantic import Extra, BaseModel, conint
 
 from fidesops.schemas.api import BulkResponse, BulkUpdateFailed
 from fidesops.schemas.shared_schemas import FidesOpsKey
@@ -19,6 +19,8 @@ class CreateConnectionConfiguration(BaseModel):
     key: Optional[FidesOpsKey]
     connection_type: ConnectionType
     access: AccessLevel
+    concurrency_limit: Optional[conint(ge=1)]  # type: ignore
+    max_in_values: Optional[conint(ge=1)]  # type: ignore
 
     class Config:
         """Restrict adding other fields through this schema and set orm_mode to support mapping to ConnectionConfig"""
@@ -43,6 +45,8 @@ class ConnectionConfigurationResponse(BaseModel):
     updated_at: Optional[datetime]
     last_test_timestamp: Optional[datetime]
     last_test_succeeded: Optional[bool]
+    concurrency_limit: Optional[int]
+    max_in_values: Optional[int]
 
     class Config:
         """Set orm_mode to support mapping to ConnectionConfig"""
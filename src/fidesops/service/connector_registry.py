@@ -0,0 +1,180 @@
+import hashlib
+import json
+import logging
+from itertools import chain
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from fidesops.models.connectionconfig import ConnectionConfig
+from fidesops.service.connectors import BaseConnector
+from fidesops.util.logger import NotPii
+
+logger = logging.getLogger(__name__)
+
+
+def secrets_fingerprint(connection_config: ConnectionConfig) -> str:
+    """A hash of the connection type and secrets a connector's client is built from, so clients
+    can be matched to their secrets without the secrets themselves being held as a key."""
+    payload = json.dumps(
+        [connection_config.connection_type.value, connection_config.secrets],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SharedClient:
+    """A connector owning a client shared through the connector registry, along with the
+    fingerprint of the secrets the client was created with and the number of connectors using it.
+
+    A client that has been replaced (its secrets changed, or its connection was invalidated) is
+    `retired`, and closed once no connector is using it.
+    """
+
+    def __init__(self, fingerprint: str, owner: BaseConnector) -> None:
+        self.fingerprint = fingerprint
+        self.owner = owner
+        self.users = 0
+        self.retired = False
+
+
+class ConnectorRegistry:
+    """Holds the clients of connectors that pool their connections, such as SQLAlchemy engines and
+    MongoClients, for every privacy request run in this process.
+
+    Clients are keyed by ConnectionConfig.key along with a fingerprint of the connection's secrets, so
+    a privacy request reuses the open connections of earlier ones, and a connection whose secrets
+    have changed (through this or another worker) gets a new client. Endpoints that change a
+    connection also invalidate its client directly.
+
+    Clients are created while holding a lock for their connection only, so a slow connection
+    doesn't hold up the others. A replaced client is closed once every connector using it has
+    released it (see `release`), rather than under privacy requests that are still running.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        # connection key: the current shared client
+        self._clients: Dict[str, SharedClient] = {}
+        # replaced clients still in use
+        self._retired: List[SharedClient] = []
+        # connection key: lock held while creating its client
+        self._key_locks: Dict[str, Lock] = {}
+
+    def client(self, connector: BaseConnector) -> Any:
+        """Return the client for the connector's connection, creating it with the connector if there
+        isn't one for its current secrets. The connector should `release` it once done."""
+        return self._shared_client(connector, acquire=True).owner.db_client
+
+    def owner(self, connector: BaseConnector) -> BaseConnector:
+        """Return the connector that owns the client for the connector's connection, creating one
+        with a new client if there isn't one for its current secrets.
+
+        The owner lives as long as its client, so connectors keep state tied to the client, such
+        as reflected tables, on it.
+        """
+        return self._shared_client(connector, acquire=False).owner
+
+    def release(self, connector: BaseConnector) -> None:
+        """Stop counting the connector as a user of the client it got from `client`, closing the
+        client if it has since been replaced and this was its last user"""
+        db_client = connector.db_client
+        if db_client is None:
+            return
+        connector.db_client = None
+        with self._lock:
+            shared: Optional[SharedClient] = next(
+                (
+                    shared
+                    for shared in chain(self._clients.values(), self._retired)
+                    if shared.owner.db_client is db_client
+                ),
+                None,
+            )
+            if shared is None:
+                return
+            shared.users -= 1
+            if not shared.retired or shared.users > 0:
+                return
+            self._retired.remove(shared)
+        logger.info(
+            "Closing a replaced shared client for connection %s",
+            NotPii(connector.configuration.key),
+        )
+        shared.owner.close()
+
+    def invalidate(self, key: str) -> None:
+        """Retire the client for this connection key, so the next lookup creates a new one"""
+        with self._lock:
+            unused = self._retire(self._clients.pop(key, None))
+        if unused is not None:
+            logger.info("Closing the shared client for connection %s", NotPii(key))
+            unused.owner.close()
+
+    def close(self) -> None:
+        """Close every client, including any still in use"""
+        with self._lock:
+            clients = [*self._clients.values(), *self._retired]
+            self._clients.clear()
+            self._retired.clear()
+        for shared in clients:
+            shared.owner.close()
+
+    def _current(
+        self, key: str, fingerprint: str, acquire: bool
+    ) -> Optional[SharedClient]:
+        """The current shared client for this connection key, if it was created with these
+        secrets, counting a new user of it if `acquire`. Called holding the registry lock."""
+        shared = self._clients.get(key)
+        if shared is None or shared.fingerprint != fingerprint:
+            return None
+        if acquire:
+            shared.users += 1
+        return shared
+
+    def _retire(self, shared: Optional[SharedClient]) -> Optional[SharedClient]:
+        """Mark a replaced client as retired, returning it if nothing is using it and it can be
+        closed right away. Called holding the registry lock."""
+        if shared is None:
+            return None
+        shared.retired = True
+        if shared.users == 0:
+            return shared
+        self._retired.append(shared)
+        return None
+
+    def _shared_client(self, connector: BaseConnector, acquire: bool) -> SharedClient:
+        """The current shared client for the connector's connection, creating it if there isn't
+        one for its current secrets"""
+        connection_config: ConnectionConfig = connector.configuration
+        key = connection_config.key
+        fingerprint = secrets_fingerprint(connection_config)
+        with self._lock:
+            shared = self._current(key, fingerprint, acquire)
+            if shared is not None:
+                return shared
+            key_lock = self._key_locks.setdefault(key, Lock())
+
+        with key_lock:
+            # another connector may have created the client while this one waited
+            with self._lock:
+                shared = self._current(key, fingerprint, acquire)
+            if shared is not None:
+                return shared
+
+            logger.info("Creating a shared client for connection %s", NotPii(key))
+            owner = type(connector)(connection_config)
+            owner.db_client = connector.create_client()
+            shared = SharedClient(fingerprint, owner)
+            with self._lock:
+                if acquire:
+                    shared.users += 1
+                unused = self._retire(self._clients.get(key))
+                self._clients[key] = shared
+
+        if unused is not None:
+            unused.owner.close()
+        return shared
+
+
+connector_registry = ConnectorRegistry()
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod, ABC
-from typing import Any, Dict, List, Optional, TypeVar, Generic
+from typing import Any, Dict, Iterator, List, Optional, TypeVar, Generic, TYPE_CHECKING
 
 from fidesops.core.config import config
 from fidesops.graph.traversal import TraversalNode
@@ -8,8 +8,12 @@ from fidesops.models.connectionconfig import ConnectionConfig, ConnectionTestSta
 from fidesops.models.policy import Policy
 from fidesops.models.privacy_request import PrivacyRequest
 from fidesops.service.connectors.query_config import QueryConfig
+from fidesops.util.async_util import run_in_thread
 from fidesops.util.collection_util import Row
 
+if TYPE_CHECKING:
+    from fidesops.service.connector_registry import ConnectorRegistry
+
 logger = logging.getLogger(__name__)
 DB_CONNECTOR_TYPE = TypeVar("DB_CONNECTOR_TYPE")
 
@@ -30,6 +34,15 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     connector.test_connection()
     """
 
+    # whether the client holds a connection pool worth sharing between privacy requests. These
+    # clients are kept in the connector registry rather than closed with the connector.
+    shared_client: bool = False
+
+    # whether the datastore only matches query values that are equal in Python. Rows from one that
+    # matches values loosely, such as strings compared case-insensitively, can't be assigned to
+    # the input values that retrieved them, so they're queried again for each privacy request.
+    exact_match: bool = True
+
     def __init__(self, configuration: ConnectionConfig):
         self.configuration = configuration
         # If Fidesops is running in test mode, it's OK to show
@@ -38,6 +51,8 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         # mode.
         self.hide_parameters = not config.is_test_mode
         self.db_client: Optional[DB_CONNECTOR_TYPE] = None
+        # set when the client is shared with other privacy requests through the connector registry
+        self.client_registry: Optional["ConnectorRegistry"] = None
 
     @abstractmethod
     def query_config(self, node: TraversalNode) -> QueryConfig[Any]:
@@ -58,7 +73,11 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     def client(self) -> DB_CONNECTOR_TYPE:
         """Return connector appropriate to this resource"""
         if not self.db_client:
-            self.db_client = self.create_client()
+            self.db_client = (
+                self.client_registry.client(self)
+                if self.client_registry
+                else self.create_client()
+            )
         return self.db_client
 
     @abstractmethod
@@ -74,6 +93,36 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
         The input data is expected to include a key and list of values for
         each input key that may be queried on."""
 
+    def retrieve_data_batches(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+        batch_size: int,
+    ) -> Iterator[List[Row]]:
+        """Retrieve the same data as `retrieve_data`, yielding it in batches of up to `batch_size` rows
+        as it is read.
+
+        Connectors that can read results incrementally should override this. By default, all of
+        the rows are retrieved at once and yielded as a single batch."""
+        yield self.retrieve_data(node, policy, privacy_request, input_data)
+
+    async def aretrieve_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> List[Row]:
+        """Retrieve data like `retrieve_data`, for use on an event loop.
+
+        Connectors with an async client should override this. By default, `retrieve_data`
+        is run on a worker thread so that it doesn't block the event loop."""
+        return await run_in_thread(
+            self.retrieve_data, node, policy, privacy_request, input_data
+        )
+
     @abstractmethod
     def mask_data(
         self,
@@ -84,6 +133,19 @@ class BaseConnector(Generic[DB_CONNECTOR_TYPE], ABC):
     ) -> int:
         """Execute a masking request. Return the number of rows that have been updated"""
 
+    async def amask_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request like `mask_data`, for use on an event loop.
+
+        Connectors with an async client should override this. By default, `mask_data`
+        is run on a worker thread so that it doesn't block the event loop."""
+        return await run_in_thread(self.mask_data, node, policy, privacy_request, rows)
+
     def dry_run_query(self, node: TraversalNode) -> str:
         """Generate a dry-run query to display action that will be taken"""
         return self.query_config(node).dry_run_query()
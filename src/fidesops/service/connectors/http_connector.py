@@ -2,6 +2,8 @@ import json
 
 import logging
 from typing import Dict, Any, List, Optional
+
+import httpx
 import requests
 
 from fidesops.common_exceptions import ClientUnsuccessfulException
@@ -60,6 +62,34 @@ class HTTPSConnector(BaseConnector[None]):
             raise ClientUnsuccessfulException(status_code=response.status_code)
         return json.loads(response.text)
 
+    async def aexecute(
+        self,
+        request_body: Dict[str, Any],
+        response_expected: bool,
+        additional_headers: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Calls a client-defined endpoint without blocking the event loop and returns the data that it responds with"""
+        config = HttpsSchema(**self.configuration.secrets or {})
+        headers = self.build_authorization_header()
+        headers.update(additional_headers or {})
+
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    url=config.url, headers=headers, json=request_body
+                )
+        except httpx.TransportError:
+            logger.info("Requests connection error received.")
+            raise ClientUnsuccessfulException(status_code=500)
+
+        if not response_expected:
+            return {}
+
+        if response.is_error:
+            logger.error("Invalid response received from webhook.")
+            raise ClientUnsuccessfulException(status_code=response.status_code)
+        return json.loads(response.text)
+
     def test_connection(self) -> Optional[ConnectionTestStatus]:
         """
         Override to skip connection test
@@ -1,10 +1,12 @@
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Hashable, Iterator, List, Optional, Set, Tuple, Union
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateMany, UpdateOne
+from pymongo.cursor import Cursor
 from pymongo.errors import ServerSelectionTimeoutError, OperationFailure
 
 from fidesops.common_exceptions import ConnectionException
+from fidesops.core.config import config as fidesops_config
 from fidesops.graph.traversal import Row, TraversalNode
 from fidesops.models.connectionconfig import ConnectionTestStatus
 from fidesops.models.policy import Policy
@@ -16,6 +18,7 @@ from fidesops.service.connectors.base_connector import (
     BaseConnector,
 )
 from fidesops.service.connectors.query_config import QueryConfig, MongoQueryConfig
+from fidesops.util.collection_util import value_key
 from fidesops.util.logger import NotPii
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,8 @@ logger = logging.getLogger(__name__)
 class MongoDBConnector(BaseConnector[MongoClient]):
     """MongoDB Connector"""
 
+    shared_client = True
+
     def build_uri(self) -> str:
         """
         Builds URI of format mongodb://[username:password@]host1[:port1][,...hostN[:portN]][/[defaultauthdb][?options]]
@@ -82,6 +87,27 @@ class MongoDBConnector(BaseConnector[MongoClient]):
 
         return ConnectionTestStatus.succeeded
 
+    def find(
+        self,
+        node: TraversalNode,
+        query_data: Dict[str, Any],
+        fields: Dict[str, Any],
+        batch_size: int,
+    ) -> Cursor:
+        """A cursor over the documents matching the query, fetching batch_size documents from the
+        server at a time.
+
+        The query is aborted on the server after MONGO_MAX_TIME_MS. If the node's rows are limited
+        to MAX_ROWS_PER_NODE, one more document than that is read, so the node can tell it was
+        truncated without the rest of the collection being read."""
+        collection = self.client()[node.address.dataset][node.address.collection]
+        cursor: Cursor = collection.find(query_data, fields).batch_size(batch_size)
+        if fidesops_config.execution.MONGO_MAX_TIME_MS:
+            cursor = cursor.max_time_ms(fidesops_config.execution.MONGO_MAX_TIME_MS)
+        if fidesops_config.execution.MAX_ROWS_PER_NODE:
+            cursor = cursor.limit(fidesops_config.execution.MAX_ROWS_PER_NODE + 1)
+        return cursor
+
     def retrieve_data(
         self,
         node: TraversalNode,
@@ -90,27 +116,56 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
         """Retrieve mongo data"""
-        # pylint: disable = too-many-locals
         query_config = self.query_config(node)
-        client = self.client()
 
         query_components = query_config.generate_query(input_data, policy)
         if query_components is None:
             return []
         query_data, fields = query_components
 
-        db_name = node.address.dataset
-        collection_name = node.address.collection
-
-        db = client[db_name]
-        collection = db[collection_name]
-        rows = []
         logger.info(f"Starting data retrieval for {node.address}")
-        for row in collection.find(query_data, fields):
-            rows.append(row)
+        rows: List[Row] = list(
+            self.find(
+                node,
+                query_data,
+                fields,
+                fidesops_config.execution.CURSOR_BATCH_SIZE,
+            )
+        )
         logger.info(f"Found {len(rows)} rows on {node.address}")
         return rows
 
+    def retrieve_data_batches(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+        batch_size: int,
+    ) -> Iterator[List[Row]]:
+        """Retrieve mongo data, fetching batch_size documents from the server at a time"""
+        query_config = self.query_config(node)
+
+        query_components = query_config.generate_query(input_data, policy)
+        if query_components is None:
+            return
+        query_data, fields = query_components
+
+        logger.info(f"Starting batched data retrieval for {node.address}")
+        cursor = self.find(node, query_data, fields, batch_size)
+        try:
+            rows: List[Row] = []
+            for row in cursor:
+                rows.append(row)
+                if len(rows) >= batch_size:
+                    yield rows
+                    rows = []
+            if rows:
+                yield rows
+        finally:
+            # the node may stop reading early, once it has all the rows it can keep
+            cursor.close()
+
     def mask_data(
         self,
         node: TraversalNode,
@@ -118,32 +173,81 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         privacy_request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        # pylint: disable=too-many-locals
-        """Execute a masking request"""
-        query_config = self.query_config(node)
+        """Execute a masking request
+
+        Updates are sent as unordered bulk writes of up to ERASURE_BATCH_SIZE operations. Rows
+        with a single primary key that get the same update, as is common with the null_rewrite and
+        string_rewrite strategies, are masked together with one update_many on their keys.
+        """
         collection_name = node.address.collection
-        client = self.client()
+        collection = self.client()[node.address.dataset][collection_name]
+        batch_size: int = fidesops_config.execution.ERASURE_BATCH_SIZE
+        operations: List[Union[UpdateOne, UpdateMany]] = update_operations(
+            self.group_updates(node, policy, privacy_request, rows), batch_size
+        )
+
         update_ct = 0
+        for i in range(0, len(operations), batch_size):
+            batch = operations[i : i + batch_size]
+            result = collection.bulk_write(batch, ordered=False)
+            update_ct += result.modified_count
+            logger.info(
+                "db.%s.bulk_write(%s operations, ordered=False)",
+                NotPii(collection_name),
+                NotPii(len(batch)),
+            )
+        return update_ct
+
+    def group_updates(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Each distinct update that masks the rows, with the primary key queries of the rows that get it"""
+        query_config = self.query_config(node)
+        updates: Dict[Hashable, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
         for row in rows:
             update_stmt = query_config.generate_update_stmt(
                 row, policy, privacy_request
             )
             if update_stmt is not None:
                 query, update = update_stmt
-                db = client[node.address.dataset]
-                collection = db[collection_name]
-                update_result = collection.update_one(query, update, upsert=False)
-                update_ct += update_result.modified_count
-                logger.info(
-                    "db.%s.update_one(%s, %s, upsert=False)",
-                    NotPii(collection_name),
-                    query,
-                    update,
-                )
-
-        return update_ct
+                _, queries = updates.setdefault(value_key(update), (update, []))
+                queries.append(query)
+        return list(updates.values())
 
     def close(self) -> None:
         """Close any held resources"""
         if self.db_client:
             self.db_client.close()
+
+
+def update_operations(
+    updates: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]], batch_size: int
+) -> List[Union[UpdateOne, UpdateMany]]:
+    """The bulk write operations for the grouped updates (see `MongoDBConnector.group_updates`).
+
+    An update shared by rows with the same single primary key is made with update_many on their
+    keys, up to batch_size keys at a time. Any other update is made with update_one for each row.
+    """
+    operations: List[Union[UpdateOne, UpdateMany]] = []
+    for update, queries in updates:
+        keys: Set[str] = {key for query in queries for key in query}
+        if len(queries) > 1 and len(keys) == 1 and all(queries):
+            key = keys.pop()
+            values = [query[key] for query in queries]
+            for i in range(0, len(values), batch_size):
+                operations.append(
+                    UpdateMany(
+                        {key: {"$in": values[i : i + batch_size]}},
+                        update,
+                        upsert=False,
+                    )
+                )
+        else:
+            operations.extend(
+                UpdateOne(query, update, upsert=False) for query in queries
+            )
+    return operations
@@ -2,11 +2,20 @@ import logging
 import re
 import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Generic, TypeVar, Tuple, Literal
+from typing import (
+    Dict,
+    Any,
+    List,
+    Optional,
+    Generic,
+    TypeVar,
+    Tuple,
+    Literal,
+    Hashable,
+)
 
 import pydash
-from sqlalchemy import text, Table, MetaData
-from sqlalchemy.engine import Engine
+from sqlalchemy import text, Table
 from sqlalchemy.sql import Executable, Update
 from sqlalchemy.sql.elements import TextClause, ColumnElement
 
@@ -30,7 +39,8 @@ from fidesops.task.refine_target_path import (
     build_refined_target_paths,
     join_detailed_path,
 )
-from fidesops.util.collection_util import append, filter_nonempty_values
+from fidesops.util.collection_util import append, filter_nonempty_values, value_key
+from fidesops.util.lru_cache import LRUCache
 from fidesops.util.querytoken import QueryToken
 from fidesops.util.saas_util import unflatten_dict
 
@@ -84,11 +94,7 @@ class QueryConfig(Generic[T], ABC):
     @property
     def primary_key_field_paths(self) -> Dict[FieldPath, Field]:
         """Mapping of FieldPaths to Fields that are marked as PK's"""
-        return {
-            field_path: field
-            for field_path, field in self.field_map().items()
-            if field.primary_key
-        }
+        return self.node.node.collection.primary_key_field_paths
 
     def query_sources(self) -> Dict[str, List[CollectionAddress]]:
         """Display the input collection(s) for each query key for display purposes.
@@ -250,9 +256,21 @@ class QueryConfig(Generic[T], ABC):
         returns None"""
 
 
+# IN list sizes that statements are padded to, for connectors that bind each value separately
+IN_LIST_ARITY_BUCKETS = (1, 8, 64, 512)
+
+
+# process-wide cache of retrieval statement templates, keyed by query config type, traversal
+# node, queried fields and clause shape
+statement_template_cache: LRUCache[Hashable, TextClause] = LRUCache(maxsize=1024)
+
+
 class SQLQueryConfig(QueryConfig[Executable]):
     """Query config that translates parameters into SQL statements."""
 
+    # the most bind parameters a statement can have, if the database limits it
+    max_bind_params: Optional[int] = None
+
     def format_fields_for_query(
         self,
         field_paths: List[FieldPath],
@@ -293,35 +311,86 @@ class SQLQueryConfig(QueryConfig[Executable]):
         policy: Optional[Policy] = None,
     ) -> Optional[TextClause]:
         """Generate a retrieval query"""
+        return self.build_query(input_data, pad_in_lists=True)
+
+    def build_query(
+        self, input_data: Dict[str, List[Any]], pad_in_lists: bool
+    ) -> Optional[TextClause]:
+        """Generate a retrieval query from the statement template for its shape: the fields queried
+        and the number of bind parameters each is written with (see `in_list_arity`).
+
+        Templates are cached, so queries of the same shape share one statement string, both here
+        and in the database's plan cache.
+        """
         filtered_data: Dict[str, Any] = self.node.typed_filtered_values(input_data)
+        # values are already distinct, and kept in order so the same input gives the same statement
+        value_counts: Dict[str, int] = {
+            string_path: len(data)
+            for string_path, data in filtered_data.items()
+            if data
+        }
+        if pad_in_lists and self.max_bind_params:
+            # IN lists are only padded if the padded statement keeps within the parameter limit
+            pad_in_lists = (
+                sum(
+                    self.in_list_arity(count, pad=True) or 1
+                    for count in value_counts.values()
+                )
+                <= self.max_bind_params
+            )
+        shape: Tuple[Tuple[str, Optional[int]], ...] = tuple(
+            (string_path, self.in_list_arity(count, pad_in_lists))
+            for string_path, count in value_counts.items()
+        )
+        if not shape:
+            logger.warning(
+                f"There is not enough data to generate a valid query for {self.node.address}"
+            )
+            return None
 
-        if filtered_data:
-            clauses = []
-            query_data: Dict[str, Tuple[Any, ...]] = {}
+        template_key = (
+            type(self),
+            self.node.address,
+            tuple(self.field_map().keys()),
+            shape,
+        )
+        template: Optional[TextClause] = statement_template_cache.get(template_key)
+        if template is None:
             formatted_fields: List[str] = self.format_fields_for_query(
                 list(self.field_map().keys())
             )
-            field_list = ",".join(formatted_fields)
-            for string_path, data in filtered_data.items():
-                data = set(data)
-                if len(data) == 1:
-                    clauses.append(
-                        self.format_clause_for_query(string_path, "=", string_path)
-                    )
-                    query_data[string_path] = (data.pop(),)
-                elif len(data) > 1:
-                    clauses.append(
-                        self.format_clause_for_query(string_path, "IN", string_path)
-                    )
-                    query_data[string_path] = tuple(data)
-            if len(clauses) > 0:
-                query_str = self.get_formatted_query_string(field_list, clauses)
-                return text(query_str).params(query_data)
+            clauses = [
+                self.format_in_clause(string_path, arity)
+                for string_path, arity in shape
+            ]
+            template = text(
+                self.get_formatted_query_string(",".join(formatted_fields), clauses)
+            )
+            statement_template_cache.set(template_key, template)
 
-        logger.warning(
-            f"There is not enough data to generate a valid query for {self.node.address}"
-        )
-        return None
+        query_data: Dict[str, Any] = {}
+        for string_path, arity in shape:
+            query_data.update(
+                self.in_clause_params(string_path, filtered_data[string_path], arity)
+            )
+        return template.params(query_data)
+
+    def in_list_arity(self, value_count: int, pad: bool) -> Optional[int]:
+        """The number of bind parameters a field queried for `value_count` values is written with:
+        1 for a single value, otherwise None, as the values are bound together as one tuple."""
+        return 1 if value_count == 1 else None
+
+    def format_in_clause(self, string_path: str, arity: Optional[int]) -> str:
+        """Returns the clause matching a field to its input values"""
+        if arity == 1:
+            return self.format_clause_for_query(string_path, "=", string_path)
+        return self.format_clause_for_query(string_path, "IN", string_path)
+
+    def in_clause_params(
+        self, string_path: str, values: List[Any], arity: Optional[int]
+    ) -> Dict[str, Any]:
+        """Returns the bind parameters for a field's clause"""
+        return {string_path: tuple(values)}
 
     def format_key_map_for_update_stmt(self, fields: List[str]) -> List[str]:
         """Adds the appropriate formatting for update statements in this datastore."""
@@ -383,7 +452,7 @@ class SQLQueryConfig(QueryConfig[Executable]):
     def dry_run_query(self) -> Optional[str]:
         """Returns a text representation of the query."""
         query_data = self.display_query_data()
-        text_clause = self.generate_query(query_data, None)
+        text_clause = self.build_query(query_data, pad_in_lists=False)
         if text_clause is not None:
             return self.query_to_str(text_clause, query_data)
         return None
@@ -408,14 +477,24 @@ class QueryStringWithoutTuplesOverrideQueryConfig(SQLQueryConfig):
             return f"{string_path} IN ({operand})"
         return super().format_clause_for_query(string_path, operator, operand)
 
-    # Overrides SQLConnector.generate_query
-    def generate_query(  # pylint: disable=R0914
-        self,
-        input_data: Dict[str, List[Any]],
-        policy: Optional[Policy] = None,
-    ) -> Optional[TextClause]:
+    # Overrides SQLQueryConfig.in_list_arity
+    def in_list_arity(self, value_count: int, pad: bool) -> Optional[int]:
+        """
+        Each value is bound separately, so the number of values would otherwise change the statement.
+        IN lists are padded up to the next of IN_LIST_ARITY_BUCKETS, so queries for similar numbers
+        of values share a statement. Longer lists aren't padded, and neither are the lists of a statement
+        that padding would take over `max_bind_params`.
+        """
+        if pad:
+            for bucket in IN_LIST_ARITY_BUCKETS:
+                if value_count <= bucket:
+                    return bucket
+        return value_count
+
+    # Overrides SQLQueryConfig.format_in_clause
+    def format_in_clause(self, string_path: str, arity: Optional[int]) -> str:
         """
-        Generate a retrieval query. Generates distinct key/val pairs for building the query string instead of a tuple.
+        Generates distinct key/val pairs for building the query string instead of a tuple.
 
         E.g. The base SQLQueryConfig uses 1 key as a tuple:
         SELECT order_id,product_id,quantity FROM order_item WHERE order_id IN (:some-params-in-tuple)
@@ -424,48 +503,30 @@ class QueryStringWithoutTuplesOverrideQueryConfig(SQLQueryConfig):
         This override produces distinct keys for the query_str:
         SELECT order_id,product_id,quantity FROM order_item WHERE order_id IN (:_in_stmt_generated_0, :_in_stmt_generated_1, :_in_stmt_generated_2)
         """
+        if arity == 1:
+            return self.format_clause_for_query(string_path, "=", string_path)
+        operand = ", ".join(
+            ":" + self.in_param_name(string_path, i) for i in range(arity or 0)
+        )
+        return self.format_clause_for_query(string_path, "IN", operand)
 
-        filtered_data = self.node.typed_filtered_values(input_data)
-
-        if filtered_data:
-            clauses = []
-            query_data: Dict[str, Tuple[Any, ...]] = {}
-            formatted_fields = self.format_fields_for_query(
-                list(self.field_map().keys())
-            )
-            field_list = ",".join(formatted_fields)
-
-            for string_path, data in filtered_data.items():
-                data = set(data)
-                if len(data) == 1:
-                    clauses.append(
-                        self.format_clause_for_query(string_path, "=", string_path)
-                    )
-                    query_data[string_path] = data.pop()
-                elif len(data) > 1:
-                    data_vals = list(data)
-                    query_data_keys: List[str] = []
-                    for val in data_vals:
-                        # appending "_in_stmt_generated_" (can be any arbitrary str) so that this name has less change of conflicting with pre-existing column in table
-                        query_data_name = (
-                            string_path
-                            + "_in_stmt_generated_"
-                            + str(data_vals.index(val))
-                        )
-                        query_data[query_data_name] = val
-                        query_data_keys.append(":" + query_data_name)
-                    operand = ", ".join(query_data_keys)
-                    clauses.append(
-                        self.format_clause_for_query(string_path, "IN", operand)
-                    )
-            if len(clauses) > 0:
-                query_str = self.get_formatted_query_string(field_list, clauses)
-                return text(query_str).params(query_data)
+    # Overrides SQLQueryConfig.in_clause_params
+    def in_clause_params(
+        self, string_path: str, values: List[Any], arity: Optional[int]
+    ) -> Dict[str, Any]:
+        """Binds each value separately, repeating the last value to fill out a padded IN list"""
+        if arity == 1:
+            return {string_path: values[0]}
+        padded = values + [values[-1]] * ((arity or 0) - len(values))
+        return {
+            self.in_param_name(string_path, i): value for i, value in enumerate(padded)
+        }
 
-        logger.warning(
-            f"There is not enough data to generate a valid query for {self.node.address}"
-        )
-        return None
+    @staticmethod
+    def in_param_name(string_path: str, index: int) -> str:
+        """Bind parameter name for the value at `index` in an IN list"""
+        # appending "_in_stmt_generated_" (can be any arbitrary str) so that this name has less change of conflicting with pre-existing column in table
+        return f"{string_path}_in_stmt_generated_{index}"
 
 
 class MicrosoftSQLServerQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
@@ -473,6 +534,8 @@ class MicrosoftSQLServerQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig)
     Generates SQL valid for SQLServer.
     """
 
+    max_bind_params = 2100
+
 
 class SnowflakeQueryConfig(SQLQueryConfig):
     """Generates SQL in Snowflake's custom dialect."""
@@ -536,6 +599,8 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
     Generates SQL valid for BigQuery
     """
 
+    max_bind_params = 10000
+
     def get_formatted_query_string(
         self,
         field_list: str,
@@ -545,13 +610,11 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         BigQuery reserved words."""
         return f'SELECT {field_list} FROM `{self.node.node.collection.name}` WHERE {" OR ".join(clauses)}'
 
-    def generate_update(
-        self, row: Row, policy: Policy, request: PrivacyRequest, client: Engine
-    ) -> Optional[Update]:
-        """
-        Using TextClause to insert 'None' values into BigQuery throws an exception, so we use update clause instead.
-        Returns a SQLAlchemy Update object. Does not actually execute the update object.
-        """
+    def update_components(
+        self, row: Row, policy: Policy, request: PrivacyRequest
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """The masked values to set on a row, and the primary key values that identify it, or None
+        if the row can't be updated"""
         update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
         non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
             {
@@ -561,21 +624,90 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
             }
         )
 
-        valid = len(non_empty_primary_keys) > 0
+        valid = len(non_empty_primary_keys) > 0 and len(update_value_map) > 0
         if not valid:
             logger.warning(
                 f"There is not enough data to generate a valid update statement for {self.node.address}"
             )
             return None
+        return update_value_map, non_empty_primary_keys
 
-        table = Table(
-            self.node.address.collection, MetaData(bind=client), autoload=True
-        )
+    def generate_update(
+        self, row: Row, policy: Policy, request: PrivacyRequest, table: Table
+    ) -> Optional[Update]:
+        """
+        Using TextClause to insert 'None' values into BigQuery throws an exception, so we use update clause instead.
+        Returns a SQLAlchemy Update object on the given reflected table. Does not actually execute the update object.
+        """
+        components = self.update_components(row, policy, request)
+        if components is None:
+            return None
+        update_value_map, non_empty_primary_keys = components
         pk_clauses: List[ColumnElement] = [
             getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()
         ]
         return table.update().where(*pk_clauses).values(**update_value_map)
 
+    def generate_updates(  # pylint: disable=too-many-arguments
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        table: Table,
+        batch_size: int,
+    ) -> List[Update]:
+        """
+        Returns the Update objects that mask the given rows.
+
+        BigQuery limits how many DML statements can run against a table at once, so rows with a
+        single primary key that get the same masked values, as is common with the null_rewrite
+        and string_rewrite strategies, are updated together, `batch_size` at a time:
+        UPDATE `customer` SET `name`=NULL WHERE `customer`.`id` IN UNNEST(@keys)
+        Other rows are updated one at a time.
+        """
+        update_stmts: List[Update] = []
+        for pk_names, update_value_map, keys in self.group_updates(
+            rows, policy, request
+        ):
+            if len(pk_names) == 1 and len(keys) > 1:
+                column: ColumnElement = getattr(table.c, pk_names[0])
+                values = [primary_keys[pk_names[0]] for primary_keys in keys]
+                for i in range(0, len(values), batch_size):
+                    update_stmts.append(
+                        table.update()
+                        .where(column.in_(values[i : i + batch_size]))
+                        .values(**update_value_map)
+                    )
+            else:
+                update_stmts.extend(
+                    table.update()
+                    .where(*[getattr(table.c, k) == v for k, v in primary_keys.items()])
+                    .values(**update_value_map)
+                    for primary_keys in keys
+                )
+        return update_stmts
+
+    def group_updates(
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Tuple[Tuple[str, ...], Dict[str, Any], List[Dict[str, Any]]]]:
+        """Each distinct update that masks the rows, as its primary key names and masked values,
+        with the primary key values of the rows that get it"""
+        updates: Dict[
+            Tuple[Tuple[str, ...], Hashable],
+            Tuple[Dict[str, Any], List[Dict[str, Any]]],
+        ] = {}
+        for row in rows:
+            components = self.update_components(row, policy, request)
+            if components is not None:
+                update_value_map, primary_keys = components
+                key = (tuple(primary_keys), value_key(update_value_map))
+                _, keys = updates.setdefault(key, (update_value_map, []))
+                keys.append(primary_keys)
+        return [
+            (pk_names, update_value_map, keys)
+            for (pk_names, _), (update_value_map, keys) in updates.items()
+        ]
+
 
 MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
 """A mongo query is expressed in the form of 2 dicts, the first of which represents
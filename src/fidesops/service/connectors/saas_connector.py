@@ -1,8 +1,12 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union, cast
+
+import httpx
 import pydash
 from requests import Session, Request, PreparedRequest, Response
 
+from fidesops.core.config import config
 from fidesops.graph.config import CollectionAddress
 from fidesops.service.connectors.base_connector import BaseConnector
 from fidesops.graph.traversal import Row, TraversalNode
@@ -23,6 +27,7 @@ from fidesops.service.processors.post_processor_strategy.post_processor_strategy
     PostProcessorStrategy,
 )
 from fidesops.service.connectors.query_config import SaaSQueryConfig, SaaSRequestParams
+from fidesops.util.async_util import run_in_thread
 
 logger = logging.getLogger(__name__)
 
@@ -83,10 +88,37 @@ class AuthenticatedClient:
 
         return response
 
+    async def asend(
+        self, session: httpx.AsyncClient, request_params: SaaSRequestParams
+    ) -> httpx.Response:
+        """
+        Builds and executes an authenticated request on the given async session.
+        The HTTP method is determined by the request_params.
+        """
+        try:
+            prepared_request = self.get_authenticated_request(request_params)
+            # a prepared request always has a method and url, and its headers are strings
+            response = await session.request(
+                cast(str, prepared_request.method),
+                cast(str, prepared_request.url),
+                headers=cast(Dict[str, str], dict(prepared_request.headers)),
+                content=prepared_request.body,
+            )
+        except Exception:
+            raise ConnectionException(f"Operational Error connecting to '{self.key}'.")
+
+        if response.is_error:
+            raise ClientUnsuccessfulException(status_code=response.status_code)
+
+        return response
+
 
 class SaaSConnector(BaseConnector[AuthenticatedClient]):
     """A connector type to integrate with third-party SaaS APIs"""
 
+    # APIs may match the values they're given however they like
+    exact_match = False
+
     def __init__(self, configuration: ConnectionConfig):
         super().__init__(configuration)
         self.secrets = configuration.secrets
@@ -125,46 +157,75 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
     ) -> List[Row]:
         """Retrieve data from SaaS APIs"""
 
-        # get the corresponding read request for the given collection
-        collection_name: str = node.address.collection
-        read_request: SaaSRequest = self.endpoints[collection_name].requests["read"]
-
         query_config: SaaSQueryConfig = self.query_config(node)
         prepared_requests = query_config.generate_requests(input_data, policy)
 
         rows: List[Row] = []
         for prepared_request in prepared_requests:
             response: Response = self.client().send(prepared_request)
+            rows.extend(self.response_to_rows(node, privacy_request, response))
+        return rows
+
+    async def aretrieve_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+    ) -> List[Row]:
+        """Retrieve data from SaaS APIs, sending the node's requests concurrently"""
+        query_config: SaaSQueryConfig = self.query_config(node)
+        prepared_requests = query_config.generate_requests(input_data, policy)
 
-            if read_request.postprocessors is None:
-                rows.extend(response.json())
-                continue
-            data_to_be_processed: Any = self.post_process(
-                node.address,
-                privacy_request.get_cached_identity_data(),
-                read_request.postprocessors,
-                response,
+        responses: List[httpx.Response] = await self.asend_all(prepared_requests)
+
+        rows: List[Row] = []
+        for response in responses:
+            # post-processing reads the request's identity data from the cache
+            rows.extend(
+                await run_in_thread(
+                    self.response_to_rows, node, privacy_request, response
+                )
             )
-            if isinstance(data_to_be_processed, list):
-                if not all([isinstance(item, dict) for item in data_to_be_processed]):
-                    raise PostProcessingException(
-                        "Some data could not be added due to unexpected format"
-                    )
-                rows.extend(data_to_be_processed)
-            elif isinstance(data_to_be_processed, dict):
-                rows.append(data_to_be_processed)
-            else:
+        return rows
+
+    def response_to_rows(
+        self,
+        node: TraversalNode,
+        privacy_request: PrivacyRequest,
+        response: Union[Response, httpx.Response],
+    ) -> List[Row]:
+        """Apply the read request's postprocessors, if any, to a response and return the resulting rows"""
+        # get the corresponding read request for the given collection
+        collection_name: str = node.address.collection
+        read_request: SaaSRequest = self.endpoints[collection_name].requests["read"]
+
+        if read_request.postprocessors is None:
+            return response.json()
+        data_to_be_processed: Any = self.post_process(
+            node.address,
+            privacy_request.get_cached_identity_data(),
+            read_request.postprocessors,
+            response,
+        )
+        if isinstance(data_to_be_processed, list):
+            if not all([isinstance(item, dict) for item in data_to_be_processed]):
                 raise PostProcessingException(
                     "Some data could not be added due to unexpected format"
                 )
-        return rows
+            return data_to_be_processed
+        if isinstance(data_to_be_processed, dict):
+            return [data_to_be_processed]
+        raise PostProcessingException(
+            "Some data could not be added due to unexpected format"
+        )
 
     @staticmethod
     def post_process(
         node_address: CollectionAddress,
         cached_identity: Dict[str, Any],
         postprocessors: List[Strategy],
-        response: Response,
+        response: Union[Response, httpx.Response],
     ) -> Any:
         """Post process response"""
         data_to_be_processed = response.json()
@@ -190,24 +251,68 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
                 )
         return data_to_be_processed
 
-    def mask_data(
+    def generate_update_requests(
         self,
         node: TraversalNode,
         policy: Policy,
         privacy_request: PrivacyRequest,
         rows: List[Row],
-    ) -> int:
-        """Execute a masking request. Return the number of rows that have been updated"""
+    ) -> List[SaaSRequestParams]:
+        """The update request that masks each row"""
         query_config = self.query_config(node)
-        prepared_requests = [
+        return [
             query_config.generate_update_stmt(row, policy, privacy_request)
             for row in rows
         ]
+
+    def mask_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request. Return the number of rows that have been updated"""
+        prepared_requests = self.generate_update_requests(
+            node, policy, privacy_request, rows
+        )
         rows_updated = 0
         for prepared_request in prepared_requests:
             self.client().send(prepared_request)
             rows_updated += 1
         return rows_updated
 
+    async def amask_data(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request, sending the update for each row concurrently.
+        Return the number of rows that have been updated"""
+        # masking strategies may read their secrets from the cache
+        prepared_requests = await run_in_thread(
+            self.generate_update_requests, node, policy, privacy_request, rows
+        )
+        await self.asend_all(prepared_requests)
+        return len(prepared_requests)
+
+    async def asend_all(
+        self, prepared_requests: List[SaaSRequestParams]
+    ) -> List[httpx.Response]:
+        """Send requests concurrently, TASK_CONCURRENCY at a time, returning their responses in order"""
+        client: AuthenticatedClient = self.client()
+        request_slots = asyncio.Semaphore(config.execution.TASK_CONCURRENCY)
+
+        async def asend(prepared_request: SaaSRequestParams) -> httpx.Response:
+            async with request_slots:
+                return await client.asend(session, prepared_request)
+
+        async with httpx.AsyncClient() as session:
+            return await asyncio.gather(
+                *[asend(prepared_request) for prepared_request in prepared_requests]
+            )
+
     def close(self) -> None:
         """Not required for this type"""
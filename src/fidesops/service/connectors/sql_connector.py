@@ -1,8 +1,10 @@
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, cast
 
-from sqlalchemy import Column, text
+from sqlalchemy import Column, MetaData, Table, text
 from sqlalchemy.engine import (
     URL,
     Engine,
@@ -17,8 +19,10 @@ from sqlalchemy.sql.elements import TextClause
 from snowflake.sqlalchemy import URL as Snowflake_URL
 
 from fidesops.common_exceptions import ConnectionException
+from fidesops.core.config import config as fidesops_config
+from fidesops.graph.config import CollectionAddress
 from fidesops.graph.traversal import Row, TraversalNode
-from fidesops.models.connectionconfig import ConnectionTestStatus
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionTestStatus
 from fidesops.models.policy import Policy
 from fidesops.models.privacy_request import PrivacyRequest
 from fidesops.schemas.connection_configuration import (
@@ -44,6 +48,8 @@ from fidesops.service.connectors.query_config import (
     MicrosoftSQLServerQueryConfig,
     BigQueryQueryConfig,
 )
+from fidesops.task.connection_limiter import connection_limiter
+from fidesops.util.collection_util import chunk_values, unique_rows, unseen_rows
 
 logger = logging.getLogger(__name__)
 
@@ -52,28 +58,79 @@ class SQLConnector(BaseConnector[Engine]):
     """A SQL connector represents an abstract connector to any datastore that can be
     interacted with via standard SQL via SQLAlchemy"""
 
+    # the max number of input values in a single query, if the ConnectionConfig doesn't set one
+    default_max_in_values: Optional[int] = None
+
+    shared_client = True
+
+    # whether retrieval queries ask for a server-side cursor, so that results are streamed from
+    # the database a batch at a time. Dialects without server-side cursors ignore this.
+    stream_results: bool = True
+
     @staticmethod
-    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
-        """Convert SQLAlchemy results to a list of dictionaries"""
+    def column_names(results: CursorResult) -> List[str]:
+        """The names of the result's columns, as reported by the database driver"""
         columns: List[Column] = results.cursor.description
-        rows = []
-        for row_tuple in results:
-            rows.append(
-                {col.name: row_tuple[count] for count, col in enumerate(columns)}
+        return [col[0] for col in columns]
+
+    @staticmethod
+    def cursor_result_to_rows(results: CursorResult) -> List[Row]:
+        """Convert SQLAlchemy results to a list of dictionaries, fetching CURSOR_BATCH_SIZE
+        rows from the cursor at a time"""
+        return [
+            row
+            for batch in SQLConnector.cursor_result_to_row_batches(
+                results, fidesops_config.execution.CURSOR_BATCH_SIZE
             )
-        return rows
+            for row in batch
+        ]
 
     @staticmethod
     def default_cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
         """
         Convert SQLAlchemy results to a list of dictionaries
-        Overrides BaseConnector.cursor_result_to_rows since SQLAlchemy execute returns LegacyCursorResult for MariaDB
+        Column names are read from the DBAPI cursor description, so the LegacyCursorResult returned
+        for MariaDB, MySQL and SQL Server is converted the same way as any other result.
         """
-        columns: List[Column] = results.cursor.description
-        rows = []
-        for row_tuple in results:
-            rows.append({col[0]: row_tuple[count] for count, col in enumerate(columns)})
-        return rows
+        return SQLConnector.cursor_result_to_rows(results)
+
+    @staticmethod
+    def cursor_result_to_row_batches(
+        results: CursorResult, batch_size: int
+    ) -> Iterator[List[Row]]:
+        """Convert SQLAlchemy results to lists of up to `batch_size` dictionaries,
+        fetching each batch from the cursor as it is needed"""
+        columns: List[str] = SQLConnector.column_names(results)
+        for partition in results.partitions(batch_size):
+            yield [dict(zip(columns, row_tuple)) for row_tuple in partition]
+
+    def pool_options(self) -> Dict[str, Any]:
+        """Connection pool options for this connector's engine: the POOL_ settings, with any
+        POOL_OVERRIDES for its connection type"""
+        settings: Dict[str, Any] = {
+            "POOL_SIZE": fidesops_config.execution.POOL_SIZE,
+            "POOL_MAX_OVERFLOW": fidesops_config.execution.POOL_MAX_OVERFLOW,
+            "POOL_RECYCLE": fidesops_config.execution.POOL_RECYCLE,
+            "POOL_PRE_PING": fidesops_config.execution.POOL_PRE_PING,
+        }
+        settings.update(
+            fidesops_config.execution.POOL_OVERRIDES.get(
+                self.configuration.connection_type.value, {}
+            )
+        )
+        return {
+            "pool_size": settings["POOL_SIZE"],
+            "max_overflow": settings["POOL_MAX_OVERFLOW"],
+            "pool_recycle": settings["POOL_RECYCLE"],
+            "pool_pre_ping": settings["POOL_PRE_PING"],
+        }
+
+    def execute_select(self, connection: Connection, stmt: TextClause) -> CursorResult:
+        """Run a retrieval query, streaming its results from a server-side cursor if the
+        connector and dialect support it"""
+        if self.stream_results:
+            connection = connection.execution_options(stream_results=True)
+        return connection.execute(stmt)
 
     @abstractmethod
     def build_uri(self) -> str:
@@ -104,6 +161,40 @@ class SQLConnector(BaseConnector[Engine]):
 
         return ConnectionTestStatus.succeeded
 
+    @property
+    def max_in_values(self) -> Optional[int]:
+        """The max number of input values passed to a single query against this connection"""
+        return self.configuration.max_in_values or self.default_max_in_values
+
+    def set_schema(self, connection: Connection) -> None:
+        """Sets the schema for the duration of the session, for databases that need one set"""
+
+    def generate_queries(
+        self,
+        query_config: SQLQueryConfig,
+        input_data: Dict[str, List[Any]],
+        policy: Policy,
+    ) -> List[TextClause]:
+        """Generate the queries to retrieve data for the input values, splitting input of more than
+        `max_in_values` values into chunks so no single query goes over the limit"""
+        chunks: List[Dict[str, List[Any]]] = (
+            chunk_values(input_data, self.max_in_values)
+            if self.max_in_values
+            else [input_data]
+        )
+        return [
+            stmt
+            for stmt in (query_config.generate_query(chunk, policy) for chunk in chunks)
+            if stmt is not None
+        ]
+
+    def execute_query(self, stmt: TextClause) -> List[Row]:
+        """Run a single retrieval query"""
+        with self.client().connect() as connection:
+            self.set_schema(connection)
+            results = self.execute_select(connection, stmt)
+            return self.cursor_result_to_rows(results)
+
     def retrieve_data(
         self,
         node: TraversalNode,
@@ -111,16 +202,84 @@ class SQLConnector(BaseConnector[Engine]):
         privacy_request: PrivacyRequest,
         input_data: Dict[str, List[Any]],
     ) -> List[Row]:
-        """Retrieve sql data"""
+        """Retrieve sql data
+
+        If the input is split into several chunked queries, they're run QUERY_CHUNK_CONCURRENCY
+        at a time on the engine's connection pool, and rows returned by more than one chunk are
+        only returned once. The caller holds one query slot on the connection; each additional
+        chunk run at once holds another, if one is free.
+        """
         query_config = self.query_config(node)
-        client = self.client()
-        stmt: Optional[TextClause] = query_config.generate_query(input_data, policy)
-        if stmt is None:
+        stmts: List[TextClause] = self.generate_queries(
+            query_config, input_data, policy
+        )
+        if not stmts:
             return []
         logger.info(f"Starting data retrieval for {node.address}")
-        with client.connect() as connection:
-            results = connection.execute(stmt)
-            return self.cursor_result_to_rows(results)
+        if len(stmts) == 1:
+            return self.execute_query(stmts[0])
+
+        logger.info(f"Querying {node.address} in {len(stmts)} chunks")
+        self.client()  # create the engine before its pool is shared between threads
+        with connection_limiter.limit_additional(
+            self.configuration,
+            min(fidesops_config.execution.QUERY_CHUNK_CONCURRENCY, len(stmts)) - 1,
+        ) as additional_slots:
+            if additional_slots:
+                with ThreadPoolExecutor(max_workers=additional_slots + 1) as executor:
+                    chunk_rows: List[List[Row]] = list(
+                        executor.map(self.execute_query, stmts)
+                    )
+            else:
+                chunk_rows = [self.execute_query(stmt) for stmt in stmts]
+
+        return unique_rows(
+            [
+                field_path.string_path
+                for field_path in query_config.primary_key_field_paths
+            ],
+            (row for chunk in chunk_rows for row in chunk),
+        )
+
+    def retrieve_data_batches(  # pylint: disable=too-many-arguments
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        input_data: Dict[str, List[Any]],
+        batch_size: int,
+    ) -> Iterator[List[Row]]:
+        """Retrieve sql data, fetching batch_size rows at a time
+
+        Chunked queries are run one after the other, and rows returned by an earlier chunk are skipped.
+        Each query's rows are all fetched before its connection is released and they are yielded, so
+        no connection is left open while the caller, which only holds a query slot while reading the
+        next batch, passes the rows on.
+        """
+        query_config = self.query_config(node)
+        stmts: List[TextClause] = self.generate_queries(
+            query_config, input_data, policy
+        )
+        if not stmts:
+            return
+        logger.info(f"Starting batched data retrieval for {node.address}")
+        primary_keys: List[str] = [
+            field_path.string_path
+            for field_path in query_config.primary_key_field_paths
+        ]
+        row_keys: Set[Hashable] = set()
+        for stmt in stmts:
+            with self.client().connect() as connection:
+                self.set_schema(connection)
+                results = self.execute_select(connection, stmt)
+                batches: List[List[Row]] = list(
+                    self.cursor_result_to_row_batches(results, batch_size)
+                )
+            for batch in batches:
+                if len(stmts) > 1:
+                    batch = unseen_rows(primary_keys, row_keys, batch)
+                if batch:
+                    yield batch
 
     def mask_data(
         self,
@@ -129,18 +288,48 @@ class SQLConnector(BaseConnector[Engine]):
         privacy_request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        All of the node's updates run on one connection, in a single transaction.
+        """
         query_config = self.query_config(node)
+        update_stmts: List[TextClause] = [
+            update_stmt
+            for update_stmt in (
+                query_config.generate_update_stmt(row, policy, privacy_request)
+                for row in rows
+            )
+            if update_stmt is not None
+        ]
+        if not update_stmts:
+            return 0
+        with self.client().begin() as connection:
+            self.set_schema(connection)
+            return self.execute_updates(connection, update_stmts)
+
+    @staticmethod
+    def execute_updates(connection: Connection, update_stmts: List[TextClause]) -> int:
+        """Run update statements, returning the number of rows updated.
+
+        Updates with the same SQL (those setting the same columns) are sent together with
+        executemany, where the driver reports the total number of rows an executemany updates.
+        Otherwise they're run one at a time. Each group runs as its first statement, with every
+        statement's values, so any types given to its bind parameters still apply.
+        """
+        if not connection.dialect.supports_sane_multi_rowcount:
+            return sum(
+                connection.execute(update_stmt).rowcount for update_stmt in update_stmts
+            )
+
+        stmts_by_query: Dict[str, List[TextClause]] = {}
+        for update_stmt in update_stmts:
+            stmts_by_query.setdefault(update_stmt.text, []).append(update_stmt)
         update_ct = 0
-        client = self.client()
-        for row in rows:
-            update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
+        for stmts in stmts_by_query.values():
+            results: LegacyCursorResult = connection.execute(
+                stmts[0], [stmt.compile().params for stmt in stmts]
             )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+            update_ct = update_ct + results.rowcount
         return update_ct
 
     def close(self) -> None:
@@ -176,12 +365,16 @@ class PostgreSQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
 
 class MySQLConnector(SQLConnector):
     """Connector specific to MySQL"""
 
+    # strings are compared case-insensitively by default
+    exact_match = False
+
     def build_uri(self) -> str:
         """Build URI of format mysql+pymysql://[user[:password]@][netloc][:port][/dbname]"""
         config = MySQLSchema(**self.configuration.secrets or {})
@@ -206,19 +399,16 @@ class MySQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
-    @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
-        """
-        Convert SQLAlchemy results to a list of dictionaries
-        """
-        return SQLConnector.default_cursor_result_to_rows(results)
-
 
 class MariaDBConnector(SQLConnector):
     """Connector specific to MariaDB"""
 
+    # strings are compared case-insensitively by default
+    exact_match = False
+
     def build_uri(self) -> str:
         """Build URI of format mariadb+pymysql://[user[:password]@][netloc][:port][/dbname]"""
         config = MariaDBSchema(**self.configuration.secrets or {})
@@ -243,19 +433,17 @@ class MariaDBConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
-    @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
-        """
-        Convert SQLAlchemy results to a list of dictionaries
-        """
-        return SQLConnector.default_cursor_result_to_rows(results)
-
 
 class RedshiftConnector(SQLConnector):
     """Connector specific to Amazon Redshift"""
 
+    # Redshift materializes a cursor's whole result on its leader node, so results are read
+    # through a regular cursor instead
+    stream_results = False
+
     # Overrides BaseConnector.build_uri
     def build_uri(self) -> str:
         """Build URI of format redshift+psycopg2://user:password@[host][:port][/database]"""
@@ -275,69 +463,19 @@ class RedshiftConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
+    # Overrides SQLConnector.set_schema
     def set_schema(self, connection: Connection) -> None:
         """Sets the search_path for the duration of the session"""
         config = RedshiftSchema(**self.configuration.secrets or {})
         if config.db_schema:
-            logger.info("Setting Redshift search_path before retrieving data")
+            logger.info("Setting Redshift search_path")
             stmt = text("SET search_path to :search_path")
             stmt = stmt.bindparams(search_path=config.db_schema)
             connection.execute(stmt)
 
-    # Overrides SQLConnector.retrieve_data
-    def retrieve_data(
-        self,
-        node: TraversalNode,
-        policy: Policy,
-        privacy_request: PrivacyRequest,
-        input_data: Dict[str, List[Any]],
-    ) -> List[Row]:
-        """Retrieve data from Amazon Redshift
-
-        For redshift, we also set the search_path to be the schema defined on the ConnectionConfig if
-        applicable - persists for the current session.
-        """
-        query_config = self.query_config(node)
-        client = self.client()
-        stmt = query_config.generate_query(input_data, policy)
-        if stmt is None:
-            return []
-
-        logger.info(f"Starting data retrieval for {node.address}")
-        with client.connect() as connection:
-            self.set_schema(connection)
-            results = connection.execute(stmt)
-            return SQLConnector.cursor_result_to_rows(results)
-
-    # Overrides SQLConnector.mask_data
-    def mask_data(
-        self,
-        node: TraversalNode,
-        policy: Policy,
-        privacy_request: PrivacyRequest,
-        rows: List[Row],
-    ) -> int:
-        """Execute a masking request. Returns the number of records masked
-
-        For redshift, we also set the search_path to be the schema defined on the ConnectionConfig if
-        applicable - persists for the current session.
-        """
-        query_config = self.query_config(node)
-        update_ct = 0
-        client = self.client()
-        for row in rows:
-            update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    self.set_schema(connection)
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
-        return update_ct
-
     # Overrides SQLConnector.query_config
     def query_config(self, node: TraversalNode) -> RedshiftQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
@@ -347,6 +485,13 @@ class RedshiftConnector(SQLConnector):
 class BigQueryConnector(SQLConnector):
     """Connector specific to Google BigQuery"""
 
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        # tables reflected for masking, by collection
+        self._metadata = MetaData()
+        self._tables: Dict[CollectionAddress, Table] = {}
+        self._tables_lock = Lock()
+
     # Overrides BaseConnector.build_uri
     def build_uri(self) -> str:
         """Build URI of format"""
@@ -367,6 +512,7 @@ class BigQueryConnector(SQLConnector):
             credentials_info=config.keyfile_creds.dict(),
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
     # Overrides SQLConnector.query_config
@@ -374,6 +520,29 @@ class BigQueryConnector(SQLConnector):
         """Query wrapper corresponding to the input traversal_node."""
         return BigQueryQueryConfig(node)
 
+    def table(self, node: TraversalNode) -> Table:
+        """The node's table, reflected from BigQuery the first time it's needed and then reused
+        for every update run with the same client.
+
+        A client shared through the connector registry is owned by a connector held there, so
+        its tables are kept on that connector and reused by later privacy requests until the
+        client is replaced."""
+        if self.client_registry:
+            owner = cast(BigQueryConnector, self.client_registry.owner(self))
+            if owner is not self:
+                return owner.table(node)
+        with self._tables_lock:
+            table: Optional[Table] = self._tables.get(node.address)
+            if table is None:
+                logger.info(f"Reflecting BigQuery table for {node.address}")
+                table = Table(
+                    node.address.collection,
+                    self._metadata,
+                    autoload_with=self.client(),
+                )
+                self._tables[node.address] = table
+            return table
+
     def mask_data(
         self,
         node: TraversalNode,
@@ -381,18 +550,25 @@ class BigQueryConnector(SQLConnector):
         privacy_request: PrivacyRequest,
         rows: List[Row],
     ) -> int:
-        """Execute a masking request. Returns the number of records masked"""
+        """Execute a masking request. Returns the number of records masked
+
+        Rows that get the same masked values are updated together (see
+        BigQueryQueryConfig.generate_updates), and the updates are run one after the other on a
+        single connection.
+        """
         query_config = self.query_config(node)
+        update_stmts: List[Executable] = query_config.generate_updates(
+            rows,
+            policy,
+            privacy_request,
+            self.table(node),
+            fidesops_config.execution.ERASURE_BATCH_SIZE,
+        )
         update_ct = 0
-        client = self.client()
-        for row in rows:
-            update_stmt: Optional[Executable] = query_config.generate_update(
-                row, policy, privacy_request, client
-            )
-            if update_stmt is not None:
-                with client.connect() as connection:
-                    results: LegacyCursorResult = connection.execute(update_stmt)
-                    update_ct = update_ct + results.rowcount
+        with self.client().connect() as connection:
+            for update_stmt in update_stmts:
+                results: LegacyCursorResult = connection.execute(update_stmt)
+                update_ct = update_ct + results.rowcount
         return update_ct
 
 
@@ -433,6 +609,7 @@ class SnowflakeConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
@@ -445,6 +622,11 @@ class MicrosoftSQLServerConnector(SQLConnector):
     Connector specific to Microsoft SQL Server
     """
 
+    # SQL Server allows at most 2,100 parameters in a statement
+    default_max_in_values = 2000
+    # strings are compared case-insensitively by default
+    exact_match = False
+
     def build_uri(self) -> URL:
         """
         Build URI of format
@@ -474,15 +656,9 @@ class MicrosoftSQLServerConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.pool_options(),
         )
 
     def query_config(self, node: TraversalNode) -> SQLQueryConfig:
         """Query wrapper corresponding to the input traversal_node."""
         return MicrosoftSQLServerQueryConfig(node)
-
-    @staticmethod
-    def cursor_result_to_rows(results: LegacyCursorResult) -> List[Row]:
-        """
-        Convert SQLAlchemy results to a list of dictionaries
-        """
-        return SQLConnector.default_cursor_result_to_rows(results)
@@ -0,0 +1,89 @@
+import logging
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from fidesops.graph.graph import DatasetGraph
+from fidesops.models.connectionconfig import ConnectionConfig
+from fidesops.models.datasetconfig import DatasetConfig
+
+logger = logging.getLogger(__name__)
+
+
+def build_dataset_graph(session: Session) -> DatasetGraph:
+    """Generate a graph from all the currently configured datasets.
+
+    The graph is versioned by the ids and update times of the dataset configs and their
+    connection configs (which supply connection keys and SaaS configs), so traversals of
+    graphs built from unchanged configuration share their TraversalPlans.
+    """
+    datasets = DatasetConfig.all(db=session)
+    dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
+    graph = DatasetGraph(*dataset_graphs)
+    graph.version = tuple(
+        sorted(
+            (
+                dataset_config.id,
+                str(dataset_config.updated_at),
+                str(dataset_config.connection_config.updated_at),
+            )
+            for dataset_config in datasets
+        )
+    )
+    return graph
+
+
+def dataset_config_version(session: Session) -> Tuple[Any, ...]:
+    """A cheap summary of the dataset and connection configs that changes whenever one is added,
+    updated or deleted: the number of dataset configs and the latest update to any of them or to
+    their connection configs."""
+    return tuple(
+        session.query(
+            func.count(DatasetConfig.id),
+            func.max(DatasetConfig.updated_at),
+            func.max(ConnectionConfig.updated_at),
+        )
+        .select_from(DatasetConfig)
+        .join(
+            ConnectionConfig, DatasetConfig.connection_config_id == ConnectionConfig.id
+        )
+        .one()
+    )
+
+
+class DatasetGraphCache:
+    """Holds the DatasetGraph built from the current dataset configs, for every privacy request run
+    in this process.
+
+    Each lookup compares `dataset_config_version` with the version the graph was built from, so
+    changes made through other workers are picked up too. Endpoints that change datasets,
+    SaaS configs or connections also invalidate the cache directly.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._version: Optional[Tuple[Any, ...]] = None
+        self._graph: Optional[DatasetGraph] = None
+
+    def get(self, session: Session) -> DatasetGraph:
+        """Return the graph of the current dataset configs, rebuilding it if they have changed"""
+        version = dataset_config_version(session)
+        with self._lock:
+            if self._graph is not None and self._version == version:
+                return self._graph
+
+        logger.info("Building dataset graph")
+        graph = build_dataset_graph(session)
+        with self._lock:
+            self._graph, self._version = graph, version
+        return graph
+
+    def invalidate(self) -> None:
+        """Drop the cached graph, so the next lookup rebuilds it"""
+        with self._lock:
+            self._graph, self._version = None, None
+
+
+dataset_graph_cache = DatasetGraphCache()
@@ -12,6 +12,7 @@ from fidesops.common_exceptions import (
     StorageConfigNotFoundException,
     AuthenticationException,
 )
+from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.models.policy import Policy
 from fidesops.models.privacy_request import (
@@ -155,10 +156,12 @@ class OneTrustService:
         privacy_request: PrivacyRequest = PrivacyRequest.create(db=db, data=kwargs)
         privacy_request.cache_identity(identity)
         try:
-            PrivacyRequestRunner(
-                cache=get_cache(),
-                privacy_request=privacy_request,
-            ).submit()
+            if not config.execution.REQUEST_BATCH_INTERVAL:
+                # Otherwise the request is left pending until the next batch is run
+                PrivacyRequestRunner(
+                    cache=get_cache(),
+                    privacy_request=privacy_request,
+                ).submit()
             request_status = OneTrustSubtaskStatus.COMPLETED
         except BaseException:  # pylint: disable=W0703
             request_status = OneTrustSubtaskStatus.FAILED
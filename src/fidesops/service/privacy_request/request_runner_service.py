@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Set, Optional, Awaitable
+from typing import Set, Optional, Awaitable, Dict, List, Any, Tuple, FrozenSet
 
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
@@ -10,25 +11,33 @@ from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.common_exceptions import PrivacyRequestPaused, ClientUnsuccessfulException
 from fidesops.graph.graph import DatasetGraph
-from fidesops.models.connectionconfig import ConnectionConfig
-from fidesops.models.datasetconfig import DatasetConfig
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.models.policy import (
     ActionType,
     WebhookTypes,
     PolicyPreWebhook,
     PolicyPostWebhook,
 )
-from fidesops.models.privacy_request import PrivacyRequest, PrivacyRequestStatus
+from fidesops.models.privacy_request import (
+    ExecutionLog,
+    PrivacyRequest,
+    PrivacyRequestStatus,
+)
+from fidesops.service.dataset_graph_cache import dataset_graph_cache
 from fidesops.service.storage.storage_uploader_service import upload
 from fidesops.task.filter_results import filter_data_categories
+from fidesops.task.batch_graph_task import run_access_request_batch
 from fidesops.task.graph_task import (
     run_access_request,
     run_erasure,
     get_cached_data_for_erasures,
 )
+from fidesops.task.streaming_graph_task import run_access_request_streaming
+from fidesops.task.task_executor import is_async_executor
 from fidesops.tasks.scheduled.scheduler import scheduler
 from fidesops.util.async_util import run_async
-from fidesops.util.cache import FidesopsRedis
+from fidesops.util.cache import FidesopsRedis, get_cache
+from fidesops.util.collection_util import Row, filter_nonempty_values, partition
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +76,10 @@ class PrivacyRequestRunner:
 
         for webhook in webhooks.order_by(webhook_cls.order):
             try:
-                privacy_request.trigger_policy_webhook(webhook)
+                if is_async_executor():
+                    asyncio.run(privacy_request.atrigger_policy_webhook(webhook))
+                else:
+                    privacy_request.trigger_policy_webhook(webhook)
             except PrivacyRequestPaused:
                 logging.info(
                     f"Pausing execution of privacy request {privacy_request.id}. Halt instruction received from webhook {webhook.key}."
@@ -102,7 +114,6 @@ class PrivacyRequestRunner:
     def run(
         self, privacy_request_id: str, from_webhook_id: Optional[str] = None
     ) -> None:
-        # pylint: disable=too-many-locals
         """
         Dispatch a privacy_request into the execution layer by:
             1. Generate a graph from all the currently configured datasets
@@ -114,114 +125,274 @@ class PrivacyRequestRunner:
         with SessionLocal() as session:
 
             privacy_request = PrivacyRequest.get(db=session, id=privacy_request_id)
-            logging.info(f"Dispatching privacy request {privacy_request.id}")
-            privacy_request.start_processing(session)
-
-            # Run pre-execution webhooks
-            proceed = self.run_webhooks_and_report_status(
-                session,
-                privacy_request=privacy_request,
-                webhook_cls=PolicyPreWebhook,
-                after_webhook_id=from_webhook_id,
-            )
+            proceed = self.start_processing(session, privacy_request, from_webhook_id)
             if not proceed:
                 session.close()
                 return
 
-            datasets = DatasetConfig.all(db=session)
-            dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-            dataset_graph = DatasetGraph(*dataset_graphs)
-            identity_data = privacy_request.get_cached_identity_data()
+            dataset_graph = dataset_graph_cache.get(session)
             connection_configs = ConnectionConfig.all(db=session)
-            policy = privacy_request.policy
-            try:
-                policy.rules[0]
-            except IndexError:
-                raise common_exceptions.MisconfiguredPolicyException(
-                    f"Policy with key {policy.key} must contain at least one Rule."
-                )
+            self.execute(session, privacy_request, dataset_graph, connection_configs)
+            session.close()
 
-            try:
-                access_result = run_access_request(
+    def start_processing(
+        self,
+        session: Session,
+        privacy_request: PrivacyRequest,
+        from_webhook_id: Optional[str] = None,
+    ) -> bool:
+        """Mark the privacy request as in processing and run its pre-execution webhooks.
+        Returns True if execution should proceed."""
+        logging.info(f"Dispatching privacy request {privacy_request.id}")
+        privacy_request.start_processing(session)
+
+        return self.run_webhooks_and_report_status(
+            session,
+            privacy_request=privacy_request,
+            webhook_cls=PolicyPreWebhook,
+            after_webhook_id=from_webhook_id,
+        )
+
+    def execute(  # pylint: disable=too-many-arguments
+        self,
+        session: Session,
+        privacy_request: PrivacyRequest,
+        dataset_graph: DatasetGraph,
+        connection_configs: List[ConnectionConfig],
+        access_result: Optional[Dict[str, List[Row]]] = None,
+    ) -> None:
+        """
+        Run the access request (unless its results are passed in from a batch), upload the results,
+        run the erasure request if applicable, then the post-execution webhooks.
+        """
+        identity_data = privacy_request.get_cached_identity_data()
+        policy = privacy_request.policy
+        try:
+            policy.rules[0]
+        except IndexError:
+            raise common_exceptions.MisconfiguredPolicyException(
+                f"Policy with key {policy.key} must contain at least one Rule."
+            )
+
+        try:
+            if access_result is None:
+                # only run_access_request resumes from the checkpoints of an earlier run
+                access_request_fn = (
+                    run_access_request_streaming
+                    if config.execution.STREAM_ACCESS_RESULTS
+                    and not has_access_checkpoints(privacy_request)
+                    else run_access_request
+                )
+                access_result = access_request_fn(
                     privacy_request=privacy_request,
                     policy=policy,
                     graph=dataset_graph,
                     connection_configs=connection_configs,
                     identity=identity_data,
                 )
-                if not access_result:
-                    logging.info(
-                        f"No results returned for access request {privacy_request.id}"
-                    )
+            if not access_result:
+                logging.info(
+                    f"No results returned for access request {privacy_request.id}"
+                )
 
-                # Once the access request is complete, process the data uploads
-                for rule in policy.get_rules_for_action(action_type=ActionType.access):
-                    if not rule.storage_destination:
-                        raise common_exceptions.RuleValidationError(
-                            f"No storage destination configured on rule {rule.key}"
-                        )
-                    target_categories: Set[str] = {
-                        target.data_category for target in rule.targets
-                    }
-                    filtered_results = filter_data_categories(
-                        access_result,
-                        target_categories,
-                        dataset_graph.data_category_field_mapping,
+            # Once the access request is complete, process the data uploads
+            for rule in policy.get_rules_for_action(action_type=ActionType.access):
+                if not rule.storage_destination:
+                    raise common_exceptions.RuleValidationError(
+                        f"No storage destination configured on rule {rule.key}"
                     )
-                    logging.info(
-                        f"Starting access request upload for rule {rule.key} for privacy request {privacy_request.id}"
+                target_categories: Set[str] = {
+                    target.data_category for target in rule.targets
+                }
+                filtered_results = filter_data_categories(
+                    access_result,
+                    target_categories,
+                    dataset_graph.data_category_field_mapping,
+                )
+                logging.info(
+                    f"Starting access request upload for rule {rule.key} for privacy request {privacy_request.id}"
+                )
+                try:
+                    upload(
+                        db=session,
+                        request_id=privacy_request.id,
+                        data=filtered_results,
+                        storage_key=rule.storage_destination.key,
                     )
-                    try:
-                        upload(
-                            db=session,
-                            request_id=privacy_request.id,
-                            data=filtered_results,
-                            storage_key=rule.storage_destination.key,
-                        )
-                    except common_exceptions.StorageUploadError as exc:
-                        logging.error(
-                            f"Error uploading subject access data for rule {rule.key} on policy {policy.key} and privacy request {privacy_request.id} : {exc}"
-                        )
-                        privacy_request.status = PrivacyRequestStatus.error
-
-                if policy.get_rules_for_action(action_type=ActionType.erasure):
-                    # We only need to run the erasure once until masking strategies are handled
-                    run_erasure(
-                        privacy_request=privacy_request,
-                        policy=policy,
-                        graph=dataset_graph,
-                        connection_configs=connection_configs,
-                        identity=identity_data,
-                        access_request_data=get_cached_data_for_erasures(
-                            privacy_request.id
-                        ),
+                except common_exceptions.StorageUploadError as exc:
+                    logging.error(
+                        f"Error uploading subject access data for rule {rule.key} on policy {policy.key} and privacy request {privacy_request.id} : {exc}"
                     )
+                    privacy_request.status = PrivacyRequestStatus.error
 
-            except BaseException as exc:  # pylint: disable=broad-except
-                logging.error(exc)
-                privacy_request.status = PrivacyRequestStatus.error
+            if policy.get_rules_for_action(action_type=ActionType.erasure):
+                # We only need to run the erasure once until masking strategies are handled
+                run_erasure(
+                    privacy_request=privacy_request,
+                    policy=policy,
+                    graph=dataset_graph,
+                    connection_configs=connection_configs,
+                    identity=identity_data,
+                    access_request_data=get_cached_data_for_erasures(
+                        privacy_request.id
+                    ),
+                )
 
-            # Run post-execution webhooks
-            proceed = self.run_webhooks_and_report_status(
-                db=session,
-                privacy_request=privacy_request,
-                webhook_cls=PolicyPostWebhook,
-            )
-            if not proceed:
-                session.close()
-                return
+        except BaseException as exc:  # pylint: disable=broad-except
+            logging.error(exc)
+            privacy_request.status = PrivacyRequestStatus.error
 
-            privacy_request.finished_processing_at = datetime.utcnow()
-            if privacy_request.status != PrivacyRequestStatus.error:
-                privacy_request.status = PrivacyRequestStatus.complete
-            privacy_request.save(db=session)
-            logging.info(f"Privacy request {privacy_request.id} run completed.")
-            session.close()
+        # Run post-execution webhooks
+        proceed = self.run_webhooks_and_report_status(
+            db=session,
+            privacy_request=privacy_request,
+            webhook_cls=PolicyPostWebhook,
+        )
+        if not proceed:
+            return
+
+        privacy_request.finished_processing_at = datetime.utcnow()
+        if privacy_request.status != PrivacyRequestStatus.error:
+            privacy_request.status = PrivacyRequestStatus.complete
+        privacy_request.save(db=session)
+        logging.info(f"Privacy request {privacy_request.id} run completed.")
 
     def dry_run(self, privacy_request: PrivacyRequest) -> None:
         """Pretend to dispatch privacy_request into the execution layer, return the query plan"""
 
 
+def run_pending_privacy_requests() -> None:
+    """
+    Run the oldest pending privacy requests, up to REQUEST_BATCH_SIZE of them, as a batch.
+
+    Scheduled every REQUEST_BATCH_INTERVAL seconds if that is set, in which case new privacy
+    requests are left pending when they are created rather than run straight away.
+    """
+    SessionLocal = get_db_session()
+    with SessionLocal() as session:
+        privacy_request_ids: List[str] = [
+            privacy_request.id
+            for privacy_request in PrivacyRequest.query(db=session)
+            .filter(PrivacyRequest.status == PrivacyRequestStatus.pending)
+            .order_by(PrivacyRequest.created_at)
+            .limit(config.execution.REQUEST_BATCH_SIZE)
+        ]
+        session.close()
+    if privacy_request_ids:
+        logger.info(f"Running a batch of {len(privacy_request_ids)} privacy requests")
+        run_privacy_request_batch(privacy_request_ids)
+
+
+def run_privacy_request_batch(privacy_request_ids: List[str]) -> None:
+    """
+    Dispatch a batch of pending privacy requests, e.g. the backlog from a OneTrust sync.
+
+    Requests that share a policy and supply the same identity keys have their access requests
+    run as one traversal, so each collection is queried once for the whole group rather than
+    once per request. Everything after the access request (uploads, erasures, webhooks) runs
+    for each request individually, exactly as in `PrivacyRequestRunner.run`.
+
+    SaaS connectors build requests from each privacy request's own identity data, so if any
+    are configured, every request in the batch is run on its own.
+    """
+    SessionLocal = get_db_session()
+    with SessionLocal() as session:
+        runners: Dict[str, PrivacyRequestRunner] = start_privacy_requests(
+            session, privacy_request_ids
+        )
+        dataset_graph = dataset_graph_cache.get(session)
+        connection_configs = ConnectionConfig.all(db=session)
+        can_coalesce = not any(
+            connection_config.connection_type == ConnectionType.saas
+            for connection_config in connection_configs
+        )
+
+        identities: Dict[str, Dict[str, Any]] = {
+            privacy_request_id: filter_nonempty_values(
+                runner.privacy_request.get_cached_identity_data()
+            )
+            for privacy_request_id, runner in runners.items()
+        }
+        groups: Dict[Tuple[str, FrozenSet[str]], List[PrivacyRequest]] = partition(
+            [runner.privacy_request for runner in runners.values()],
+            lambda pr: (pr.policy_id, frozenset(identities[pr.id])),
+        )
+
+        for group in groups.values():
+            access_results: Dict[str, Dict[str, List[Row]]] = {}
+            # requests resumed from an earlier run's checkpoints are run on their own
+            batchable = [pr for pr in group if not has_access_checkpoints(pr)]
+            if can_coalesce and len(batchable) > 1:
+                access_results = run_batch_access_requests(
+                    batchable, dataset_graph, connection_configs, identities
+                )
+
+            for privacy_request in group:
+                try:
+                    runners[privacy_request.id].execute(
+                        session,
+                        privacy_request,
+                        dataset_graph,
+                        connection_configs,
+                        access_result=access_results.get(privacy_request.id),
+                    )
+                except common_exceptions.MisconfiguredPolicyException as exc:
+                    logging.error(exc)
+                    privacy_request.error_processing(session)
+        session.close()
+
+
+def start_privacy_requests(
+    session: Session, privacy_request_ids: List[str]
+) -> Dict[str, PrivacyRequestRunner]:
+    """Start processing each privacy request, returning the runners of those that should proceed"""
+    cache = get_cache()
+    runners: Dict[str, PrivacyRequestRunner] = {}
+    for privacy_request_id in privacy_request_ids:
+        privacy_request = PrivacyRequest.get(db=session, id=privacy_request_id)
+        runner = PrivacyRequestRunner(cache=cache, privacy_request=privacy_request)
+        if runner.start_processing(session, privacy_request):
+            runners[privacy_request.id] = runner
+    return runners
+
+
+def run_batch_access_requests(
+    group: List[PrivacyRequest],
+    dataset_graph: DatasetGraph,
+    connection_configs: List[ConnectionConfig],
+    identities: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, List[Row]]]:
+    """
+    Run the access requests of a group of privacy requests that share a policy as one batch.
+    Returns no results if the batch fails, so that each access request is run on its own instead.
+    """
+    logging.info(
+        f"Running access requests for {len(group)} privacy requests as one batch"
+    )
+    try:
+        return run_access_request_batch(
+            privacy_requests=group,
+            policy=group[0].policy,
+            graph=dataset_graph,
+            connection_configs=connection_configs,
+            identities=identities,
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.error(exc)
+        return {}
+
+
+def has_access_checkpoints(privacy_request: PrivacyRequest) -> bool:
+    """Whether an earlier run of this privacy request logged access progress, so it should be
+    resumed from those checkpoints rather than streamed or batched, which start from scratch"""
+    return (
+        privacy_request.execution_logs.filter(
+            ExecutionLog.action_type == ActionType.access
+        ).first()
+        is not None
+    )
+
+
 def initiate_paused_privacy_request_followup(privacy_request: PrivacyRequest) -> None:
     """Initiates scheduler to expire privacy request when the redis cache expires"""
     scheduler.add_job(
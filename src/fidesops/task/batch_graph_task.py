@@ -0,0 +1,153 @@
+from typing import Any, Dict, Hashable, List, Set
+
+from fidesops.graph.config import (
+    CollectionAddress,
+    ROOT_COLLECTION_ADDRESS,
+    TERMINATOR_ADDRESS,
+)
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.traversal import Traversal, TraversalNode
+from fidesops.models.connectionconfig import ConnectionConfig
+from fidesops.models.policy import ActionType, Policy
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.task.graph_task import GraphTask, retry
+from fidesops.task.task_executor import get_scheduler
+from fidesops.task.task_resources import BatchTaskResources, TaskResources
+from fidesops.util.collection_util import NodeInput, Row, value_key
+
+
+class BatchGraphTask(GraphTask):
+    """A task that queries one traversal_node on behalf of a batch of privacy requests.
+
+    Its inputs are the rows retrieved for every request in the batch, so each query carries
+    the values of the whole batch at once.  Rows are returned without post-processing; they
+    are split back out to their owning requests with `split_batch_results`.
+    """
+
+    @retry(action_type=ActionType.access, default_return=[])
+    def access_request(self, *inputs: List[Row]) -> List[Row]:
+        """Run an access request on a single node for every request in the batch."""
+        formatted_input_data: NodeInput = self.pre_process_input_data(*inputs)
+        output: List[Row] = self.retrieve_data(formatted_input_data)
+        self.log_end(ActionType.access)
+        return output
+
+    def rows_within_limit(self, row_count: int, rows: List[Row]) -> List[Row]:
+        """Keep every row. MAX_ROWS_PER_NODE applies to each request's own rows, so
+        it is applied once the rows are split, in `split_batch_results`."""
+        return rows
+
+
+def run_access_request_batch(  # pylint: disable = too-many-arguments
+    privacy_requests: List[PrivacyRequest],
+    policy: Policy,
+    graph: DatasetGraph,
+    connection_configs: List[ConnectionConfig],
+    identities: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, List[Row]]]:
+    """Run the access requests of several privacy requests that share a policy as one traversal.
+
+    Every request must supply the same identity keys. Each traversal_node is queried once with the
+    values of the whole batch, then the rows are split back out to each request by following the
+    same incoming edges its own traversal would have used. Results are cached for each request as
+    `run_access_request` would cache them, and returned keyed by privacy request id.
+
+    Batches don't resume from checkpoints, so a request being resumed is run on its own.
+    """
+    seeds: List[Dict[str, Any]] = [identities[pr.id] for pr in privacy_requests]
+    traversal: Traversal = Traversal(graph, seeds[0])
+    with BatchTaskResources(privacy_requests, policy, connection_configs) as resources:
+
+        def start_function() -> List[Dict[str, Any]]:
+            """The root of the batched traversal returns the identity data of every request."""
+            return seeds
+
+        def collect_tasks_fn(
+            tn: TraversalNode, data: Dict[CollectionAddress, GraphTask]
+        ) -> None:
+            """Run the traversal, as an action creating a BatchGraphTask for each traversal_node."""
+            if not tn.is_root_node():
+                data[tn.address] = BatchGraphTask(tn, resources)
+
+        env: Dict[CollectionAddress, Any] = {}
+        traversal.traverse(env, collect_tasks_fn)
+
+        def termination_fn(
+            *dependent_values: List[Row],
+        ) -> Dict[CollectionAddress, List[Row]]:
+            """Return the unfiltered rows of every traversal_node mapped to its address."""
+            return dict(zip(env.keys(), dependent_values))
+
+        dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
+        dsk[ROOT_COLLECTION_ADDRESS] = (start_function,)
+        dsk[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
+        batch_rows: Dict[CollectionAddress, List[Row]] = get_scheduler()(
+            dsk, TERMINATOR_ADDRESS
+        )
+        batch_rows[ROOT_COLLECTION_ADDRESS] = seeds
+
+    # env was filled in traversal order, so each node's parents are split before it is.
+    traversal_nodes: List[TraversalNode] = [t.traversal_node for t in env.values()]
+    return {
+        privacy_request.id: split_batch_results(
+            privacy_request,
+            policy,
+            traversal_nodes,
+            connection_configs,
+            identities[privacy_request.id],
+            batch_rows,
+        )
+        for privacy_request in privacy_requests
+    }
+
+
+def split_batch_results(  # pylint: disable = too-many-arguments
+    privacy_request: PrivacyRequest,
+    policy: Policy,
+    traversal_nodes: List[TraversalNode],
+    connection_configs: List[ConnectionConfig],
+    identity: Dict[str, Any],
+    batch_rows: Dict[CollectionAddress, List[Row]],
+) -> Dict[str, List[Row]]:
+    """Pick out and post-process the rows of a batched or streamed traversal that belong to one privacy request.
+
+    `traversal_nodes` must be in traversal order, and `batch_rows` must hold the rows of every node,
+    including the root.  Starting from the request's own identity data, each node's input is built
+    from the rows already assigned to the request upstream, exactly as in `run_access_request`.
+    If that's narrower than the input the node was queried with, only the rows the request's input
+    would have retrieved are kept. For a datastore that doesn't match values exactly, such as one
+    comparing strings case-insensitively, the node is queried again with the request's input instead.
+    Each request's rows are then truncated to MAX_ROWS_PER_NODE.
+    """
+
+    def input_values(input_data: NodeInput) -> Dict[str, Set[Hashable]]:
+        """The distinct values of each input field"""
+        return {
+            string_path: {value_key(value) for value in values}
+            for string_path, values in input_data.items()
+        }
+
+    with TaskResources(privacy_request, policy, connection_configs) as resources:
+        request_rows: Dict[CollectionAddress, List[Row]] = {
+            ROOT_COLLECTION_ADDRESS: [identity]
+        }
+        for traversal_node in traversal_nodes:
+            task = GraphTask(traversal_node, resources)
+            formatted_input_data: NodeInput = task.pre_process_input_data(
+                *[request_rows.get(key, []) for key in task.input_keys]
+            )
+            queried_input_data: NodeInput = task.pre_process_input_data(
+                *[batch_rows.get(key, []) for key in task.input_keys]
+            )
+            # post-processing leaves rows unmodified, so batch rows can be shared between requests
+            output: List[Row] = batch_rows[traversal_node.address]
+            if input_values(formatted_input_data) != input_values(queried_input_data):
+                if task.connector.exact_match:
+                    output = task.filter_rows_by_input(formatted_input_data, output)
+                else:
+                    output = task.retrieve_data(formatted_input_data)
+            output = task.rows_within_limit(0, output)
+            request_rows[traversal_node.address] = task.access_results_post_processing(
+                formatted_input_data, output
+            )
+        return resources.get_all_cached_objects()
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from threading import BoundedSemaphore, Lock
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from fidesops.models.connectionconfig import ConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionLimiter:
+    """Limits the number of queries in flight against each connection.
+
+    Limits are keyed by ConnectionConfig.key and shared by every privacy request running in
+    this process, so many concurrent privacy requests can't overwhelm a fragile datastore.
+    Connections without a `concurrency_limit` are not limited.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._semaphores: Dict[str, Tuple[int, BoundedSemaphore]] = {}
+
+    def _get_semaphore(self, key: str, limit: int) -> BoundedSemaphore:
+        """Return the semaphore for this connection key, replacing it if the limit has changed.
+
+        Queries already holding a slot on a replaced semaphore release it there, so a changed
+        limit takes effect for every query that starts after the change.
+        """
+        with self._lock:
+            current: Optional[Tuple[int, BoundedSemaphore]] = self._semaphores.get(key)
+            if current is None or current[0] != limit:
+                current = (limit, BoundedSemaphore(limit))
+                self._semaphores[key] = current
+            return current[1]
+
+    @contextmanager
+    def limit(self, connection_config: ConnectionConfig) -> Iterator[None]:
+        """Hold a query slot on the given connection for the duration of the context"""
+        limit: Optional[int] = connection_config.concurrency_limit
+        if not limit:
+            yield
+            return
+
+        semaphore = self._get_semaphore(connection_config.key, limit)
+        if not semaphore.acquire(blocking=False):
+            logger.info(
+                f"Waiting for one of {limit} query slots on connection {connection_config.key}"
+            )
+            semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @contextmanager
+    def limit_additional(
+        self, connection_config: ConnectionConfig, wanted: int
+    ) -> Iterator[int]:
+        """Hold up to `wanted` more query slots on the given connection for the duration of the
+        context, for a caller that already holds one and wants to run more queries alongside it.
+
+        Only slots that are free right away are taken, since waiting for more while holding one
+        could deadlock with other callers doing the same. Yields the number of slots held, which
+        is `wanted` on a connection without a limit.
+        """
+        limit: Optional[int] = connection_config.concurrency_limit
+        if not limit:
+            yield wanted
+            return
+
+        semaphore = self._get_semaphore(connection_config.key, limit)
+        acquired = 0
+        while acquired < wanted and semaphore.acquire(blocking=False):
+            acquired += 1
+        try:
+            yield acquired
+        finally:
+            for _ in range(acquired):
+                semaphore.release()
+
+    @asynccontextmanager
+    async def alimit(self, connection_config: ConnectionConfig) -> AsyncIterator[None]:
+        """Hold a query slot on the given connection for the duration of the async context.
+
+        Slots are shared with `limit`. While waiting for a slot, the event loop keeps running;
+        the wait happens on a worker thread. If the caller is cancelled while waiting, the worker
+        thread still takes a slot once one is free, and gives it straight back.
+        """
+        limit: Optional[int] = connection_config.concurrency_limit
+        if not limit:
+            yield
+            return
+
+        semaphore = self._get_semaphore(connection_config.key, limit)
+        if not semaphore.acquire(blocking=False):
+            logger.info(
+                f"Waiting for one of {limit} query slots on connection {connection_config.key}"
+            )
+            acquiring = asyncio.get_running_loop().run_in_executor(
+                None, semaphore.acquire
+            )
+            try:
+                await asyncio.shield(acquiring)
+            except asyncio.CancelledError:
+                acquiring.add_done_callback(
+                    lambda future: release_acquired(semaphore, future)
+                )
+                raise
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+def release_acquired(
+    semaphore: BoundedSemaphore, acquiring: "asyncio.Future[bool]"
+) -> None:
+    """Release the slot taken on a worker thread for a caller that stopped waiting for it"""
+    if not acquiring.cancelled() and acquiring.exception() is None:
+        semaphore.release()
+
+
+connection_limiter = ConnectionLimiter()
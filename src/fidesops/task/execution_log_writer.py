@@ -0,0 +1,152 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from threading import Condition, Thread
+from typing import Any, Dict, List, Optional
+
+from fidesops.db.session import get_db_session
+from fidesops.models.privacy_request import ExecutionLog
+
+logger = logging.getLogger(__name__)
+
+
+class PendingExecutionLogs:
+    """ExecutionLogs waiting to be inserted, in the order they were written.
+
+    Each log is stamped with the time it was written, and those times strictly increase, so
+    logs sort by created_at in the order they were written even though a batch is inserted at
+    once. Logs are counted by their position in that order: `queued_count` have been written,
+    `written_count` of those have been inserted, and every log up to `flush_target` should be
+    inserted without waiting for a full batch.
+    """
+
+    def __init__(self) -> None:
+        self.logs: List[Dict[str, Any]] = []
+        self.queued_count = 0
+        self.written_count = 0
+        self.flush_target = 0
+        self._last_created_at: Optional[datetime] = None
+
+    def append(self, data: Dict[str, Any]) -> None:
+        """Queue a log with the given column values, stamped with the time it was written"""
+        created_at = datetime.now(timezone.utc)
+        if self._last_created_at and created_at <= self._last_created_at:
+            created_at = self._last_created_at + timedelta(microseconds=1)
+        self._last_created_at = created_at
+        self.logs.append({**data, "created_at": created_at})
+        self.queued_count += 1
+
+    def take(self, count: int) -> List[Dict[str, Any]]:
+        """Remove and return up to `count` of the oldest queued logs"""
+        batch = self.logs[:count]
+        del self.logs[:count]
+        return batch
+
+
+class ExecutionLogWriter:
+    """Writes ExecutionLogs to the application db in batches, on a background thread.
+
+    Logs are inserted in the order they were written (see `PendingExecutionLogs`),
+    `batch_size` at a time or every `flush_interval` seconds, whichever comes first, so that
+    the nodes of a privacy request don't each wait on a separate transaction.
+
+    Call `flush` before reading logs back, and `close` once the privacy request is complete.
+    If a batch fails to insert, the next call to `flush` raises the error. `close` only logs
+    it, so that it doesn't hide an error raised by the privacy request itself.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._condition = Condition()
+        self._pending = PendingExecutionLogs()
+        self._thread: Optional[Thread] = None
+        self._closed = False
+        self._error: Optional[Exception] = None
+
+    def write(self, **data: Any) -> None:
+        """Queue an ExecutionLog with the given column values to be inserted"""
+        with self._condition:
+            self._pending.append(data)
+            if self._thread is None:
+                # start the writer thread on the first write (or the first after `close`)
+                self._closed = False
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+            elif len(self._pending.logs) >= self.batch_size:
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Wait until every log written so far has been inserted"""
+        with self._condition:
+            target = self._pending.queued_count
+            if self._pending.written_count < target:
+                self._pending.flush_target = max(self._pending.flush_target, target)
+                self._condition.notify_all()
+                self._condition.wait_for(lambda: self._pending.written_count >= target)
+            self._raise_error()
+
+    def close(self) -> None:
+        """Insert any pending logs and stop the writer thread"""
+        with self._condition:
+            thread = self._thread
+            self._closed = True
+            self._condition.notify_all()
+        if thread:
+            thread.join()
+        with self._condition:
+            error, self._error = self._error, None
+        if error:
+            logger.error(
+                f"Not every execution log was written to the database: {error}"
+            )
+
+    def insert(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of ExecutionLogs in a single transaction"""
+        SessionLocal = get_db_session()
+        db = SessionLocal()
+        try:
+            db.add_all([ExecutionLog(**data) for data in batch])
+            db.commit()
+        finally:
+            db.close()
+
+    def _raise_error(self) -> None:
+        """Raise the first error inserting a batch since the last one was raised"""
+        error = self._error
+        if error:
+            self._error = None
+            raise error
+
+    def _ready(self) -> bool:
+        return (
+            self._closed
+            or self._pending.written_count < self._pending.flush_target
+            or len(self._pending.logs) >= self.batch_size
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(self._ready, timeout=self.flush_interval)
+                batch = self._pending.take(self.batch_size)
+                done = self._closed and not self._pending.logs
+                if done:
+                    self._thread = None
+
+            error: Optional[Exception] = None
+            if batch:
+                try:
+                    self.insert(batch)
+                except Exception as exc:  # pylint: disable=W0703
+                    logger.exception(
+                        f"Failed to write {len(batch)} execution logs to the database"
+                    )
+                    error = exc
+
+            with self._condition:
+                if error and not self._error:
+                    self._error = error
+                self._pending.written_count += len(batch)
+                self._condition.notify_all()
+            if done:
+                return
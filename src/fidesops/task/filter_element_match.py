@@ -2,7 +2,7 @@ import copy
 import logging
 from collections import defaultdict
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Set, Tuple
 
 import pydash
 
@@ -11,6 +11,7 @@ from fidesops.task.refine_target_path import (
     DetailedPath,
     join_detailed_path,
     FieldPathNodeInput,
+    Level,
 )
 from fidesops.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX, Row
 
@@ -68,6 +69,81 @@ def filter_element_match(
     return _remove_paths_from_row(row, array_paths_to_preserve, delete_elements)
 
 
+def filter_element_match_views(
+    row: Row, query_paths: FieldPathNodeInput
+) -> Tuple[Row, Row]:
+    """
+    Returns both filtered forms of a row at once, without modifying it: the first *replaces* unmatched
+    array elements with placeholder text, like filter_element_match with delete_elements=False, and the
+    second *removes* them, like filter_element_match.
+
+    Only the arrays that are filtered, and the dicts and arrays that contain them, are copied: everything
+    else is shared with the input row. If no array data was targeted, both views are the input row itself.
+
+    :Example:
+    filter_element_match_views(
+        row={"A": [1, 2, 3], "B": {"C": 4}},
+        query_paths={FieldPath("A"): [2]}
+    )
+
+    ({'A': ['FIDESOPS_DO_NOT_MASK', 2, 'FIDESOPS_DO_NOT_MASK'], 'B': {'C': 4}}, {'A': [2], 'B': {'C': 4}})
+    """
+    # Array paths mapped to the indices to keep in each
+    preserve_indices: Dict[Tuple[Level, ...], Set[int]] = defaultdict(set)
+    for detailed_path in build_refined_target_paths(row, query_paths):
+        for depth, level in enumerate(detailed_path):
+            if isinstance(level, int):
+                preserve_indices[tuple(detailed_path[:depth])].add(level)
+
+    if not preserve_indices:
+        return row, row
+
+    # Every path leading to a filtered array
+    affected_paths: Set[Tuple[Level, ...]] = {
+        path[:depth] for path in preserve_indices for depth in range(len(path) + 1)
+    }
+    return _filtered_views(row, (), preserve_indices, affected_paths)
+
+
+def _filtered_views(
+    value: Any,
+    path: Tuple[Level, ...],
+    preserve_indices: Dict[Tuple[Level, ...], Set[int]],
+    affected_paths: Set[Tuple[Level, ...]],
+) -> Tuple[Any, Any]:
+    """
+    Used by filter_element_match_views, returns the placeholder and filtered views of the value at the given path.
+    """
+    if path not in affected_paths:
+        return value, value
+
+    if isinstance(value, dict):
+        placeholder_dict, filtered_dict = dict(value), dict(value)
+        for key, child in value.items():
+            if path + (key,) in affected_paths:
+                placeholder_dict[key], filtered_dict[key] = _filtered_views(
+                    child, path + (key,), preserve_indices, affected_paths
+                )
+        return placeholder_dict, filtered_dict
+
+    if isinstance(value, list):
+        preserve = preserve_indices.get(path)
+        placeholder_list: List[Any] = []
+        filtered_list: List[Any] = []
+        for index, child in enumerate(value):
+            if preserve is not None and index not in preserve:
+                placeholder_list.append(FIDESOPS_DO_NOT_MASK_INDEX)
+                continue
+            placeholder_child, filtered_child = _filtered_views(
+                child, path + (index,), preserve_indices, affected_paths
+            )
+            placeholder_list.append(placeholder_child)
+            filtered_list.append(filtered_child)
+        return placeholder_list, filtered_list
+
+    return value, value
+
+
 def _remove_paths_from_row(
     row: Dict[str, Any],
     preserve_indices: Dict[str, List[int]],
@@ -1,16 +1,27 @@
-import copy
+import inspect
 
 import logging
+import random
 import traceback
 from abc import ABC
-from functools import wraps
-
-from time import sleep
-from typing import List, Dict, Any, Tuple, Callable, Optional
+from functools import partial, wraps
+
+from typing import (
+    List,
+    Dict,
+    Any,
+    Tuple,
+    Callable,
+    Optional,
+    Set,
+    Type,
+    Hashable,
+)
 
-import dask
-from dask.threaded import get
+import pydantic
+import sqlalchemy.exc
 
+from fidesops import common_exceptions
 from fidesops.core.config import config
 from fidesops.graph.config import (
     CollectionAddress,
@@ -20,27 +31,121 @@ from fidesops.graph.config import (
     Field,
     FieldAddress,
 )
-from fidesops.graph.graph import Edge, DatasetGraph, Node
+from fidesops.graph.graph import DatasetGraph, Node
 from fidesops.graph.traversal import TraversalNode, Traversal
 from fidesops.models.connectionconfig import ConnectionConfig, AccessLevel
 from fidesops.models.policy import ActionType, Policy
 from fidesops.models.privacy_request import PrivacyRequest, ExecutionLogStatus
 from fidesops.service.connectors import BaseConnector
+from fidesops.task.connection_limiter import connection_limiter
 from fidesops.task.consolidate_query_matches import consolidate_query_matches
-from fidesops.task.filter_element_match import filter_element_match
+from fidesops.task.filter_element_match import filter_element_match_views
 from fidesops.task.refine_target_path import FieldPathNodeInput
+from fidesops.task.task_executor import (
+    get_scheduler,
+    is_async_executor,
+    retry_after,
+    asleep_without_slot,
+)
 from fidesops.task.task_resources import TaskResources
+from fidesops.util.async_util import run_in_thread
 from fidesops.util.cache import get_cache
-from fidesops.util.collection_util import partition, append, NodeInput, Row
+from fidesops.util.collection_util import (
+    NodeInput,
+    Row,
+    chunk_values,
+    unique,
+    unseen_rows,
+)
 from fidesops.util.logger import NotPii
 
 logger = logging.getLogger(__name__)
 
-dask.config.set(scheduler="processes")
-
 EMPTY_REQUEST = PrivacyRequest()
 
 
+NON_RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    # bad requests and configuration that will fail the same way every time
+    common_exceptions.ValidationError,
+    pydantic.ValidationError,
+    common_exceptions.TraversalError,
+    common_exceptions.PostProcessingException,
+    common_exceptions.MisconfiguredPolicyException,
+    common_exceptions.ConnectorNotFoundException,
+    common_exceptions.NoSuchStrategyException,
+    sqlalchemy.exc.ProgrammingError,
+    sqlalchemy.exc.DataError,
+    sqlalchemy.exc.IntegrityError,
+    sqlalchemy.exc.NotSupportedError,
+    sqlalchemy.exc.CompileError,
+    KeyboardInterrupt,
+    SystemExit,
+)
+
+RETRYABLE_STATUS_CODES = {408, 429}
+
+
+def is_retryable(ex: BaseException) -> bool:
+    """False if the exception is a deterministic failure that retrying won't fix, such as
+    invalid SQL, a validation error, or a 4xx response other than a timeout or rate limit."""
+    if isinstance(ex, NON_RETRYABLE_EXCEPTIONS):
+        return False
+    if isinstance(ex, common_exceptions.ClientUnsuccessfulException):
+        return not (
+            400 <= ex.status_code < 500 and ex.status_code not in RETRYABLE_STATUS_CODES
+        )
+    return True
+
+
+def with_jitter(delay: float) -> float:
+    """Pick a random delay between half and all of the given delay, so that tasks
+    that failed together don't all retry at the same moment."""
+    return random.uniform(delay / 2, delay)
+
+
+def should_retry(task: Any, method_name: str, attempt: int, ex: BaseException) -> bool:
+    """True if a failed attempt at one of a GraphTask's queries should be retried"""
+    if not is_retryable(ex):
+        logger.warning(
+            f"Not retrying {method_name} {task.traversal_node.address}: {type(ex).__name__} is not retryable"
+        )
+        return False
+    return attempt < config.execution.TASK_RETRY_COUNT
+
+
+def call_with_retries(
+    task: Any,
+    action_type: ActionType,
+    method_name: str,
+    func: Callable[[], Any],
+    on_failure: Callable[[BaseException], Any],
+) -> Any:
+    """Call func on behalf of a GraphTask, retrying it `TASK_RETRY_COUNT` times with exponential backoff
+    and jitter. After the number of retries have expired, or straight away if the exception isn't retryable
+    (see `is_retryable`), returns on_failure(ex).
+
+    While waiting to retry, the task doesn't hold a worker on the executor (see `retry_after`).
+    """
+
+    def attempt(number: int, func_delay: float) -> Any:
+        try:
+            if number:
+                # Create ExecutionLog with status retrying
+                task.log_retry(action_type)
+            return func()
+        except BaseException as ex:  # pylint: disable=W0703
+            if not should_retry(task, method_name, number, ex):
+                return on_failure(ex)
+            func_delay *= config.execution.TASK_RETRY_BACKOFF
+            delay = with_jitter(func_delay)
+            logger.warning(
+                f"Retrying {method_name} {task.traversal_node.address} in {delay:.2f} seconds..."
+            )
+            return retry_after(delay, partial(attempt, number + 1, func_delay))
+
+    return attempt(0, config.execution.TASK_RETRY_DELAY)
+
+
 def retry(
     action_type: ActionType,
     default_return: Any,
@@ -48,36 +153,59 @@ def retry(
     """
     Retry decorator for access and right to forget requests requests -
 
-    If an exception is raised, we retry the function `count` times with exponential backoff. After the number of
-    retries have expired, we call GraphTask.end() with the appropriate `action_type` and `default_return`.
+    If an exception is raised, we retry the function `count` times with exponential backoff and jitter. After the
+    number of retries have expired, or straight away if the exception isn't retryable (see `is_retryable`), we call
+    GraphTask.end() with the appropriate `action_type` and `default_return`.
+
+    While waiting to retry, the task doesn't hold a worker on the executor, so that other tasks can run.
+    Coroutine functions are retried the same way, without blocking the event loop.
     """
 
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_result(*args: Any, **kwargs: Any) -> Any:
+                func_delay = config.execution.TASK_RETRY_DELAY
+                method_name = func.__name__
+                self = args[0]
+
+                raised_ex = None
+                for attempt in range(config.execution.TASK_RETRY_COUNT + 1):
+                    try:
+                        # execution logs are written to the database off the event loop
+                        await run_in_thread(
+                            self.log_retry if attempt else self.log_start, action_type
+                        )
+                        return await func(*args, **kwargs)
+                    except BaseException as ex:  # pylint: disable=W0703
+                        raised_ex = ex
+                        if not should_retry(self, method_name, attempt, ex):
+                            break
+                        func_delay *= config.execution.TASK_RETRY_BACKOFF
+                        delay = with_jitter(func_delay)
+                        logger.warning(
+                            f"Retrying {method_name} {self.traversal_node.address} in {delay:.2f} seconds..."
+                        )
+                        await asleep_without_slot(delay)
+                await run_in_thread(self.log_end, action_type, raised_ex)
+                return default_return
+
+            return async_result
+
         @wraps(func)
         def result(*args: Any, **kwargs: Any) -> List[Optional[Row]]:
-            func_delay = config.execution.TASK_RETRY_DELAY
-            method_name = func.__name__
             self = args[0]
 
-            raised_ex = None
-            for attempt in range(config.execution.TASK_RETRY_COUNT + 1):
-                try:
-                    # Create ExecutionLog with status in_processing or retrying
-                    if attempt:
-                        self.log_retry(action_type)
-                    else:
-                        self.log_start(action_type)
-                    # Run access or erasure request
-                    return func(*args, **kwargs)
-                except BaseException as ex:  # pylint: disable=W0703
-                    func_delay *= config.execution.TASK_RETRY_BACKOFF
-                    logger.warning(
-                        f"Retrying {method_name} {self.traversal_node.address} in {func_delay} seconds..."
-                    )
-                    sleep(func_delay)
-                    raised_ex = ex
-            self.log_end(action_type, raised_ex)
-            return default_return
+            def give_up(ex: BaseException) -> Any:
+                self.log_end(action_type, ex)
+                return default_return
+
+            # Create ExecutionLog with status in_processing, then run access or erasure request
+            self.log_start(action_type)
+            return call_with_retries(
+                self, action_type, func.__name__, lambda: func(*args, **kwargs), give_up
+            )
 
         return result
 
@@ -97,23 +225,21 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             self.traversal_node.node.dataset.connection_key  # ConnectionConfig.key
         )
 
-        # build incoming edges to the form : [dataset address: [(foreign field, local field)]
-        b: Dict[CollectionAddress, List[Edge]] = partition(
-            self.traversal_node.incoming_edges(), lambda e: e.f1.collection_address()
-        )
-
+        # incoming edges in the form : [dataset address: [(foreign field, local field)]
         self.incoming_field_path_map: Dict[
             CollectionAddress, List[Tuple[FieldPath, FieldPath]]
-        ] = {
-            col_addr: [(edge.f1.field_path, edge.f2.field_path) for edge in edge_list]
-            for col_addr, edge_list in b.items()
-        }
+        ] = self.traversal_node.incoming_field_path_map
 
         # the input keys this task will read from.These will build the dask graph
-        self.input_keys: List[CollectionAddress] = sorted(b.keys())
+        self.input_keys: List[CollectionAddress] = sorted(
+            self.incoming_field_path_map.keys()
+        )
 
         self.key = self.traversal_node.address
 
+        # set once rows are dropped to keep this node under MAX_ROWS_PER_NODE
+        self.truncated = False
+
         self.execution_log_id = None
         # a local copy of the execution log record written to. If we write multiple status
         # updates, we will use this id to ensure that we're updating rather than creating
@@ -148,6 +274,9 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
            table3.y => self.contact.email
          becomes
          {id:[1,2,3,4], name:["A","B"], contact.address:["C"], "contact.email": [4, 5]}
+
+        Each field's values are de-duplicated, keeping the order they were first seen in, so
+        a value shared by many parent rows is only queried (and cast) once.
         """
         if not len(data) == len(self.input_keys):
             logger.warning(
@@ -172,10 +301,91 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                     new_values: List = consolidate_query_matches(
                         row=row, target_path=foreign_field_path
                     )
-                    if new_values:
-                        append(output, local_field_path.string_path, new_values)
+                    if not new_values:
+                        continue
+                    string_path: str = local_field_path.string_path
+                    output.setdefault(string_path, []).extend(new_values)
+        return {string_path: unique(values) for string_path, values in output.items()}
+
+    def retrieve_data(self, formatted_input_data: NodeInput) -> List[Row]:
+        """Retrieve data from the connector, holding a slot on the connection while querying.
+
+        Input of more than MAX_QUERY_INPUT_VALUES values, across all fields, is queried in batches
+        rather than in one huge query. A row that matches values from more than one batch is only
+        returned once. No more than MAX_ROWS_PER_NODE rows are returned."""
+        input_batches: List[NodeInput] = chunk_values(
+            formatted_input_data, config.execution.MAX_QUERY_INPUT_VALUES
+        )
+        output: List[Row] = []
+        row_keys: Set[Hashable] = set()
+        for input_batch in input_batches:
+            with connection_limiter.limit(self.connector.configuration):
+                rows: List[Row] = self.connector.retrieve_data(
+                    self.traversal_node,
+                    self.resources.policy,
+                    self.resources.request,
+                    input_batch,
+                )
+            if len(input_batches) == 1:
+                return self.rows_within_limit(0, rows)
+            self.merge_rows(output, row_keys, rows)
+            if self.truncated:
+                break
         return output
 
+    async def aretrieve_data(self, formatted_input_data: NodeInput) -> List[Row]:
+        """Retrieve data like `retrieve_data`, awaiting the connector."""
+        input_batches: List[NodeInput] = chunk_values(
+            formatted_input_data, config.execution.MAX_QUERY_INPUT_VALUES
+        )
+        output: List[Row] = []
+        row_keys: Set[Hashable] = set()
+        for input_batch in input_batches:
+            async with connection_limiter.alimit(self.connector.configuration):
+                rows: List[Row] = await self.connector.aretrieve_data(
+                    self.traversal_node,
+                    self.resources.policy,
+                    self.resources.request,
+                    input_batch,
+                )
+            if len(input_batches) == 1:
+                return self.rows_within_limit(0, rows)
+            self.merge_rows(output, row_keys, rows)
+            if self.truncated:
+                break
+        return output
+
+    def merge_rows(
+        self, output: List[Row], row_keys: Set[Hashable], rows: List[Row]
+    ) -> List[Row]:
+        """Add the rows that haven't already been retrieved to output, up to MAX_ROWS_PER_NODE, and
+        return them. Rows are told apart by their primary key values; rows without them are all kept."""
+        primary_keys: List[str] = [
+            field_path.string_path
+            for field_path in self.traversal_node.node.collection.primary_key_field_paths
+        ]
+        new_rows = self.rows_within_limit(
+            len(output), unseen_rows(primary_keys, row_keys, rows)
+        )
+        output.extend(new_rows)
+        return new_rows
+
+    def rows_within_limit(self, row_count: int, rows: List[Row]) -> List[Row]:
+        """The new rows that can be kept under MAX_ROWS_PER_NODE, when row_count rows have already
+        been retrieved for this node. Marks the node as truncated if any rows are dropped."""
+        max_rows: Optional[int] = config.execution.MAX_ROWS_PER_NODE
+        if max_rows is None or row_count + len(rows) <= max_rows:
+            return rows
+        if not self.truncated:
+            logger.warning(
+                "Truncating the rows retrieved for %s on privacy request %s to %s",
+                NotPii(self.key),
+                NotPii(self.resources.request.id),
+                NotPii(max_rows),
+            )
+            self.truncated = True
+        return rows[: max(max_rows - row_count, 0)]
+
     def update_status(
         self,
         msg: str,
@@ -219,7 +429,9 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         else:
             logger.info(f"Ending {self.resources.request.id}, {self.key}")
             self.update_status(
-                "success",
+                f"success, truncated to {config.execution.MAX_ROWS_PER_NODE} rows"
+                if self.truncated and action_type == ActionType.access
+                else "success",
                 build_affected_field_logs(
                     self.traversal_node.node, self.resources.policy, action_type
                 ),
@@ -278,51 +490,90 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         Caches the data in TWO separate formats: 1) erasure format, *replaces* unmatched array elements with placeholder
         text, and 2) access request format, which *removes* unmatched array elements altogether.  If no data was filtered
         out, both cached versions will be the same.
+
+        Both formats are built in a single pass over each row, which is left unmodified. Only filtered arrays (and
+        what contains them) are copied, so rows without array matches are shared by both formats.
         """
         post_processed_node_input_data: FieldPathNodeInput = (
             self.post_process_input_data(formatted_input_data)
         )
 
-        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
-        placeholder_output: List[Row] = copy.deepcopy(output)
-        for row in placeholder_output:
-            filter_element_match(
-                row, query_paths=post_processed_node_input_data, delete_elements=False
+        logger.info(
+            f"Filtering rows in {self.traversal_node.node.address} for matching array elements."
+        )
+        placeholder_output: List[Row] = []
+        filtered_output: List[Row] = []
+        for row in output:
+            placeholder_row, filtered_row = filter_element_match_views(
+                row, post_processed_node_input_data
             )
+            placeholder_output.append(placeholder_row)
+            filtered_output.append(filtered_row)
+
+        # For erasures: cache results with non-matching array elements *replaced* with placeholder text
         self.resources.cache_results_with_placeholders(
             f"access_request__{self.key}", placeholder_output
         )
-
         # For access request results, cache results with non-matching array elements *removed*
-        for row in output:
-            logger.info(
-                f"Filtering row in {self.traversal_node.node.address} for matching array elements."
-            )
-            filter_element_match(row, post_processed_node_input_data)
-        self.resources.cache_object(f"access_request__{self.key}", output)
+        self.resources.cache_object(f"access_request__{self.key}", filtered_output)
 
         # Return filtered rows with non-matched array data removed.
-        return output
+        return filtered_output
+
+    def filter_rows_by_input(
+        self, formatted_input_data: NodeInput, rows: List[Row]
+    ) -> List[Row]:
+        """
+        Return the rows that querying this node with just `formatted_input_data` would have retrieved.
+
+        Generated queries match a row if *any* of the incoming edge fields holds one of the input
+        values, so a row is kept here under the same condition.  Used to split the rows of a
+        batched query back out to the privacy request that they belong to.
+
+        Values are compared for equality in Python, so this only holds for connectors whose
+        datastore matches values exactly (see `BaseConnector.exact_match`).
+        """
+        typed_input: Dict[str, List[Any]] = self.traversal_node.typed_filtered_values(
+            formatted_input_data
+        )
+        matched: List[Row] = []
+        for row in rows:
+            for string_path, values in typed_input.items():
+                path: FieldPath = FieldPath.parse(string_path)
+                field: Field = self.traversal_node.node.collection.field(path)
+                row_values = [
+                    field.cast(v) for v in consolidate_query_matches(row, path)
+                ]
+                if any(v in values for v in row_values):
+                    matched.append(row)
+                    break
+        return matched
 
     @retry(action_type=ActionType.access, default_return=[])
     def access_request(self, *inputs: List[Row]) -> List[Row]:
         """Run an access request on a single node."""
         formatted_input_data: NodeInput = self.pre_process_input_data(*inputs)
-        output: List[Row] = self.connector.retrieve_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            formatted_input_data,
-        )
+        output: List[Row] = self.retrieve_data(formatted_input_data)
         filtered_output: List[Row] = self.access_results_post_processing(
             formatted_input_data, output
         )
         self.log_end(ActionType.access)
         return filtered_output
 
-    @retry(action_type=ActionType.erasure, default_return=0)
-    def erasure_request(self, retrieved_data: List[Row]) -> int:
-        """Run erasure request"""
+    @retry(action_type=ActionType.access, default_return=[])
+    async def aaccess_request(self, *inputs: List[Row]) -> List[Row]:
+        """Run an access request on a single node, awaiting the connector."""
+        formatted_input_data: NodeInput = self.pre_process_input_data(*inputs)
+        output: List[Row] = await self.aretrieve_data(formatted_input_data)
+        # post-processing caches the results
+        filtered_output: List[Row] = await run_in_thread(
+            self.access_results_post_processing, formatted_input_data, output
+        )
+        await run_in_thread(self.log_end, ActionType.access)
+        return filtered_output
+
+    def can_run_erasure(self) -> bool:
+        """Check that this node can be masked, logging the reason if it can't."""
         # if there is no primary key specified in the graph node configuration
         # note this in the execution log and perform no erasures on this node
         if not self.traversal_node.node.contains_field(lambda f: f.primary_key):
@@ -335,7 +586,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ActionType.erasure,
                 ExecutionLogStatus.complete,
             )
-            return 0
+            return False
 
         if not self.can_write_data():
             logger.warning(
@@ -348,17 +599,48 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
                 ActionType.erasure,
                 ExecutionLogStatus.error,
             )
+            return False
+
+        return True
+
+    @retry(action_type=ActionType.erasure, default_return=0)
+    def erasure_request(self, retrieved_data: List[Row], *_masked_first: int) -> int:
+        """Run erasure request.
+
+        Any further arguments are the outputs of the collections that must be masked before this one
+        (see `erasure_dependencies`); they are only there to order the tasks.
+        """
+        if not self.can_run_erasure():
             return 0
 
-        output = self.connector.mask_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            retrieved_data,
-        )
+        with connection_limiter.limit(self.connector.configuration):
+            output = self.connector.mask_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                retrieved_data,
+            )
         self.log_end(ActionType.erasure)
         return output
 
+    @retry(action_type=ActionType.erasure, default_return=0)
+    async def aerasure_request(
+        self, retrieved_data: List[Row], *_masked_first: int
+    ) -> int:
+        """Run erasure request, awaiting the connector"""
+        if not await run_in_thread(self.can_run_erasure):
+            return 0
+
+        async with connection_limiter.alimit(self.connector.configuration):
+            output = await self.connector.amask_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                retrieved_data,
+            )
+        await run_in_thread(self.log_end, ActionType.erasure)
+        return output
+
 
 def collect_queries(
     traversal: Traversal, resources: TaskResources
@@ -417,12 +699,58 @@ def run_access_request(
         env: Dict[CollectionAddress, Any] = {}
         end_nodes = traversal.traverse(env, collect_tasks_fn)
 
-        dsk = {k: (t.access_request, *t.input_keys) for k, t in env.items()}
+        use_asyncio = is_async_executor()
+        dsk = {
+            k: (t.aaccess_request if use_asyncio else t.access_request, *t.input_keys)
+            for k, t in env.items()
+        }
+        skip_completed_access_tasks(dsk, resources)
         dsk[ROOT_COLLECTION_ADDRESS] = (start_function(traversal.seed_data),)
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *end_nodes)
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
+        return get_scheduler()(dsk, TERMINATOR_ADDRESS)
+
+
+def skip_completed_access_tasks(
+    dsk: Dict[CollectionAddress, Any], resources: TaskResources
+) -> None:
+    """Checkpoints: if this request is being resumed or re-run, collections that already
+    completed are not queried again. Their children are seeded from the cached results."""
+
+    def cached_function(rows: List[Row]) -> Callable[[], List[Row]]:
+        """Return a function that returns the cached results of a completed traversal_node."""
+
+        def g() -> List[Row]:
+            return rows
+
+        return g
+
+    completed = resources.get_completed_collections(ActionType.access)
+    if not completed:
+        return
+    cached_results = resources.get_all_cached_objects()
+    for k in dsk:
+        if k in completed and str(k) in cached_results:
+            logger.info(
+                f"Skipping {k} for {resources.request.id}, using cached results"
+            )
+            dsk[k] = (cached_function(cached_results[str(k)]),)
+
 
-        return v.compute()
+def skip_completed_erasure_tasks(
+    dsk: Dict[CollectionAddress, Any],
+    resources: TaskResources,
+    masked_first: Dict[CollectionAddress, Set[CollectionAddress]],
+) -> None:
+    """Checkpoints: collections already masked by an earlier run of this request are not masked again"""
+    for k in resources.get_completed_collections(ActionType.erasure):
+        if k in dsk:
+            logger.info(f"Skipping erasure of {k} for {resources.request.id}")
+            dsk[k] = (skipped_erasure, *sorted(masked_first[k], key=str))
+
+
+def skipped_erasure(*_masked_first: int) -> int:
+    """Placeholder task for a collection that was masked by an earlier run: no records are updated."""
+    return 0
 
 
 def get_cached_data_for_erasures(
@@ -440,6 +768,67 @@ def get_cached_data_for_erasures(
     return {k.split("__")[-1]: v for k, v in value_dict.items()}
 
 
+def erasure_dependencies(
+    traversal_nodes: Dict[CollectionAddress, TraversalNode], policy: Policy
+) -> Dict[CollectionAddress, Set[CollectionAddress]]:
+    """Map each collection to the collections that must be masked before it.
+
+    A field referencing a field in another collection of the same dataset is treated as a foreign key.
+    If the policy masks either end of that key, the referencing (child) collection is masked before
+    the collection it references, so child rows are rewritten before the parent keys they point to.
+    Keys that aren't masked, and references between datasets, which don't live in the same database,
+    don't constrain the order. A reference that would make the order circular is ignored.
+    Collections with no constraints between them are masked concurrently.
+    """
+    masked_first: Dict[CollectionAddress, Set[CollectionAddress]] = {
+        address: set() for address in traversal_nodes
+    }
+    masked_fields: Set[str] = {
+        field_log["path"]
+        for traversal_node in traversal_nodes.values()
+        for field_log in build_affected_field_logs(
+            traversal_node.node, policy, ActionType.erasure
+        )
+    }
+
+    def waits_for(start: CollectionAddress, target: CollectionAddress) -> bool:
+        """True if start already has to wait, directly or indirectly, for target"""
+        stack, seen = [start], set()
+        while stack:
+            address = stack.pop()
+            if address == target:
+                return True
+            if address not in seen:
+                seen.add(address)
+                stack.extend(masked_first[address])
+        return False
+
+    for child in sorted(traversal_nodes, key=str):
+        collection = traversal_nodes[child].node.collection
+        for field_path in sorted(collection.references(), key=str):
+            for field_address, _ in collection.references()[field_path]:
+                parent = field_address.collection_address()
+                if (
+                    parent == child
+                    or parent not in masked_first
+                    or parent.dataset != child.dataset
+                    or child in masked_first[parent]
+                ):
+                    continue
+                if (
+                    child.field_address(field_path).value not in masked_fields
+                    and field_address.value not in masked_fields
+                ):
+                    continue
+                if waits_for(child, parent):
+                    logger.warning(
+                        f"Ignoring circular reference from {child} to {parent} when ordering erasures"
+                    )
+                    continue
+                masked_first[parent].add(child)
+    return masked_first
+
+
 def run_erasure(  # pylint: disable = too-many-arguments
     privacy_request: PrivacyRequest,
     policy: Policy,
@@ -471,21 +860,26 @@ def run_erasure(  # pylint: disable = too-many-arguments
             The termination function just returns this tuple of ints."""
             return dependent_values
 
+        use_asyncio = is_async_executor()
+        # Collections are masked concurrently, except that children are masked before the parents they reference
+        masked_first: Dict[
+            CollectionAddress, Set[CollectionAddress]
+        ] = erasure_dependencies({k: t.traversal_node for k, t in env.items()}, policy)
         dsk: Dict[CollectionAddress, Any] = {
-            k: (t.erasure_request, access_request_data[str(k)]) for k, t in env.items()
+            k: (
+                t.aerasure_request if use_asyncio else t.erasure_request,
+                access_request_data[str(k)],
+                *sorted(masked_first[k], key=str),
+            )
+            for k, t in env.items()
         }
+        skip_completed_erasure_tasks(dsk, resources, masked_first)
         # terminator function waits for all keys
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *env.keys())
-        v = dask.delayed(get(dsk, TERMINATOR_ADDRESS))
-
-        update_cts: Tuple[int, ...] = v.compute()
+        update_cts: Tuple[int, ...] = get_scheduler()(dsk, TERMINATOR_ADDRESS)
         # we combine the output of the termination function with the input keys to provide
         # a map of {collection_name: records_updated}:
-        erasure_update_map: Dict[str, int] = dict(
-            zip([str(x) for x in env], update_cts)
-        )
-
-        return erasure_update_map
+        return dict(zip([str(x) for x in env], update_cts))
 
 
 def build_affected_field_logs(
@@ -0,0 +1,59 @@
+from collections import deque
+from threading import Condition
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple
+
+from fidesops.graph.config import CollectionAddress
+from fidesops.util.collection_util import Row
+
+
+class RowStream:
+    """A bounded inbox of row batches sent to one traversal_node by its parent nodes.
+
+    Every parent sends its rows in batches as it retrieves them, then closes the stream.
+    Iterating the stream yields (parent address, batch) pairs in the order they arrive,
+    and ends once every parent has closed it.
+
+    Once the stream is being read, senders block while `max_batches` batches are waiting to
+    be read, so a fast parent can't buffer an unbounded number of rows ahead of a slow child.
+    Until then, batches are buffered without blocking: the child may be waiting for a thread
+    that's held by one of its senders.
+    """
+
+    def __init__(self, senders: Iterable[CollectionAddress], max_batches: int):
+        self.open_senders: Set[CollectionAddress] = set(senders)
+        self.max_batches = max_batches
+        self.batches: Deque[Tuple[CollectionAddress, Optional[List[Row]]]] = deque()
+        self.reading = False
+        self.condition = Condition()
+
+    def send(self, sender: CollectionAddress, rows: List[Row]) -> None:
+        """Send a batch of rows, waiting for room in the stream if necessary"""
+        self._put(sender, rows)
+
+    def close(self, sender: CollectionAddress) -> None:
+        """Mark that the sender has no more rows to send"""
+        self._put(sender, None)
+
+    def _put(self, sender: CollectionAddress, rows: Optional[List[Row]]) -> None:
+        with self.condition:
+            self.condition.wait_for(
+                lambda: not self.reading or len(self.batches) < self.max_batches
+            )
+            self.batches.append((sender, rows))
+            self.condition.notify_all()
+
+    def _get(self) -> Tuple[CollectionAddress, Optional[List[Row]]]:
+        with self.condition:
+            self.reading = True
+            self.condition.wait_for(lambda: bool(self.batches))
+            batch = self.batches.popleft()
+            self.condition.notify_all()
+            return batch
+
+    def __iter__(self) -> Iterator[Tuple[CollectionAddress, List[Row]]]:
+        while self.open_senders:
+            sender, rows = self._get()
+            if rows is None:
+                self.open_senders.discard(sender)
+            else:
+                yield sender, rows
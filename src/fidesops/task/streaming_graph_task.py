@@ -0,0 +1,232 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import BoundedSemaphore
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set
+
+from fidesops.core.config import config
+from fidesops.graph.config import CollectionAddress, ROOT_COLLECTION_ADDRESS
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.traversal import Traversal, TraversalNode
+from fidesops.models.connectionconfig import ConnectionConfig
+from fidesops.models.policy import ActionType, Policy
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.task.batch_graph_task import split_batch_results
+from fidesops.task.connection_limiter import connection_limiter
+from fidesops.task.graph_task import GraphTask, call_with_retries
+from fidesops.task.row_stream import RowStream
+from fidesops.task.task_resources import TaskResources
+from fidesops.util.collection_util import NodeInput, Row, chunk_values, value_key
+
+
+class StreamingGraphTask(GraphTask):
+    """A task that queries one traversal_node as batches of its parents' rows arrive, passing
+    the rows it reads on to its children in batches. See `run_access_request_streaming`.
+    """
+
+    def retrieve_data_batches(
+        self, formatted_input_data: NodeInput, query_slots: BoundedSemaphore
+    ) -> Iterator[List[Row]]:
+        """Retrieve data from the connector in batches, holding one of the privacy request's
+        query slots (and a slot on the connection) only while each batch is being read.
+
+        As in `retrieve_data`, input values over MAX_QUERY_INPUT_VALUES are queried in batches."""
+        for input_batch in chunk_values(
+            formatted_input_data, config.execution.MAX_QUERY_INPUT_VALUES
+        ):
+            batches: Iterator[List[Row]] = self.connector.retrieve_data_batches(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                input_batch,
+                config.execution.STREAM_BATCH_SIZE,
+            )
+            while True:
+                with query_slots, connection_limiter.limit(
+                    self.connector.configuration
+                ):
+                    batch: Optional[List[Row]] = next(batches, None)
+                if batch is None:
+                    break
+                yield batch
+
+    def new_stream_input(
+        self,
+        sender: CollectionAddress,
+        rows: List[Row],
+        queried_values: Dict[str, Set[Hashable]],
+    ) -> NodeInput:
+        """The input values in a batch of rows from one of this node's parents that haven't been
+        queried yet. queried_values is updated with the values returned."""
+        formatted_input_data: NodeInput = self.pre_process_input_data(
+            *[rows if key == sender else [] for key in self.input_keys]
+        )
+        new_input_data: NodeInput = {}
+        for field_path, values in formatted_input_data.items():
+            seen: Set[Hashable] = queried_values.setdefault(field_path, set())
+            new_values = [v for v in values if value_key(v) not in seen]
+            seen.update(value_key(v) for v in new_values)
+            if new_values:
+                new_input_data[field_path] = new_values
+        return new_input_data
+
+    def stream_rows(  # pylint: disable=too-many-arguments
+        self,
+        input_data: NodeInput,
+        query_slots: BoundedSemaphore,
+        outboxes: List[RowStream],
+        output: List[Row],
+        row_keys: Set[Hashable],
+    ) -> None:
+        """Query this node for input_data, adding the rows that haven't been retrieved yet to output
+        and sending them on to every child as each batch is read."""
+        for batch in self.retrieve_data_batches(input_data, query_slots):
+            # a row may match input values from more than one batch
+            new_rows = self.merge_rows(output, row_keys, batch)
+            for outbox in outboxes:
+                outbox.send(self.key, new_rows)
+            if self.truncated:
+                return
+
+    def stream_access_request(
+        self,
+        inbox: RowStream,
+        outboxes: List[RowStream],
+        query_slots: BoundedSemaphore,
+    ) -> List[Row]:
+        """
+        Run an access request on a single node, passing rows on to its children as they are read.
+
+        Each batch of parent rows that arrives in the inbox is queried as soon as it is received, for just
+        the input values that haven't been queried yet. New rows are sent on to every child in batches,
+        so children can start querying before this node has finished.
+
+        Returns all the rows retrieved, without post-processing: rows are matched to their inputs
+        and post-processed once the whole traversal is complete.  As with `access_request`, each query
+        is retried with backoff (see `call_with_retries`), and if it keeps failing the node returns no rows.
+        The node waits on its thread while it backs off, since its children are waiting on its rows,
+        but it releases its query and connection slots first.
+        """
+        output: List[Row] = []
+        row_keys: Set[Hashable] = set()
+        queried_values: Dict[str, Set[Hashable]] = {}
+
+        def fail(ex: BaseException) -> None:
+            raise ex
+
+        try:
+            self.log_start(ActionType.access)
+            for sender, rows in inbox:
+                if self.truncated:
+                    # keep reading so that parents aren't left waiting on a full inbox
+                    continue
+                new_input_data = self.new_stream_input(sender, rows, queried_values)
+                if new_input_data:
+                    call_with_retries(
+                        self,
+                        ActionType.access,
+                        "stream_access_request",
+                        partial(
+                            self.stream_rows,
+                            new_input_data,
+                            query_slots,
+                            outboxes,
+                            output,
+                            row_keys,
+                        ),
+                        fail,
+                    )
+            self.log_end(ActionType.access)
+            return output
+        except BaseException as ex:  # pylint: disable=W0703
+            self.log_end(ActionType.access, ex)
+            # keep reading so that parents aren't left waiting on a full inbox
+            for _ in inbox:
+                pass
+            return []
+        finally:
+            for outbox in outboxes:
+                outbox.close(self.key)
+
+
+def run_access_request_streaming(
+    privacy_request: PrivacyRequest,
+    policy: Policy,
+    graph: DatasetGraph,
+    connection_configs: List[ConnectionConfig],
+    identity: Dict[str, Any],
+) -> Dict[str, List[Row]]:
+    """Run the access request, streaming rows between nodes in batches as they are read.
+
+    Each node runs on a thread, reading batches of its parents' rows from a bounded RowStream
+    and querying for them as they arrive, so dependent collections are queried while their
+    parents are still being read.  Both the number of nodes running and the number of batches
+    being read at once are bounded by `TASK_CONCURRENCY`.
+
+    Once every node has finished, the rows are post-processed and cached in traversal order
+    exactly as in `run_access_request`, so both return the same results. Unlike
+    `run_access_request`, every collection is queried, even one that completed in an earlier
+    run of the request, so a request being resumed is run with `run_access_request` instead.
+    """
+    traversal: Traversal = Traversal(graph, identity)
+    with TaskResources(privacy_request, policy, connection_configs) as resources:
+
+        def collect_tasks_fn(
+            tn: TraversalNode, data: Dict[CollectionAddress, StreamingGraphTask]
+        ) -> None:
+            """Run the traversal, as an action creating a StreamingGraphTask for each traversal_node."""
+            if not tn.is_root_node():
+                data[tn.address] = StreamingGraphTask(tn, resources)
+
+        env: Dict[CollectionAddress, StreamingGraphTask] = {}
+        traversal.traverse(env, collect_tasks_fn)
+        streamed_rows: Dict[CollectionAddress, List[Row]] = stream_rows_between_tasks(
+            env, identity
+        )
+
+    return split_batch_results(
+        privacy_request,
+        policy,
+        [t.traversal_node for t in env.values()],
+        connection_configs,
+        identity,
+        streamed_rows,
+    )
+
+
+def stream_rows_between_tasks(
+    env: Dict[CollectionAddress, StreamingGraphTask], identity: Dict[str, Any]
+) -> Dict[CollectionAddress, List[Row]]:
+    """Run every task on a thread, connecting each to its children with a RowStream, and
+    return the rows each task retrieved, including the identity data as the root's rows."""
+    inboxes: Dict[CollectionAddress, RowStream] = {
+        k: RowStream(t.input_keys, config.execution.STREAM_BUFFER_SIZE)
+        for k, t in env.items()
+    }
+    outboxes: Dict[CollectionAddress, List[RowStream]] = {ROOT_COLLECTION_ADDRESS: []}
+    for k, t in env.items():
+        for input_key in t.input_keys:
+            outboxes.setdefault(input_key, []).append(inboxes[k])
+
+    query_slots = BoundedSemaphore(config.execution.TASK_CONCURRENCY)
+    # Nodes start in traversal order as threads free up, so a node never waits on a parent that
+    # hasn't started. Rows sent to a node that hasn't started yet wait in its inbox.
+    with ThreadPoolExecutor(
+        max_workers=max(min(len(env), config.execution.TASK_CONCURRENCY), 1)
+    ) as pool:
+        futures = {
+            k: pool.submit(
+                t.stream_access_request,
+                inboxes[k],
+                outboxes.get(k, []),
+                query_slots,
+            )
+            for k, t in env.items()
+        }
+        for outbox in outboxes[ROOT_COLLECTION_ADDRESS]:
+            outbox.send(ROOT_COLLECTION_ADDRESS, [identity])
+            outbox.close(ROOT_COLLECTION_ADDRESS)
+        streamed_rows: Dict[CollectionAddress, List[Row]] = {
+            k: future.result() for k, future in futures.items()
+        }
+    streamed_rows[ROOT_COLLECTION_ADDRESS] = [identity]
+    return streamed_rows
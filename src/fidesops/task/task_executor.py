@@ -0,0 +1,305 @@
+import asyncio
+import enum
+import heapq
+import inspect
+import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from fidesops.core.config import config
+from fidesops.util.async_util import run_in_thread
+
+logger = logging.getLogger(__name__)
+
+Scheduler = Callable[[Dict[Any, Any], Any], Any]
+"""A dask-style `get(dsk, key)` function that runs a task graph and returns the value at key"""
+
+
+_execution_slots: ContextVar[Optional[asyncio.Semaphore]] = ContextVar(
+    "execution_slots", default=None
+)
+"""The slots bounding the number of coroutine tasks running at once, if the current task holds one"""
+
+_can_defer: ContextVar[bool] = ContextVar("can_defer", default=False)
+"""True while a task is run by `get_deferring`, which can re-queue it to run again later"""
+
+
+_sequence = count()
+"""Orders delayed tasks that are due at the same time"""
+
+
+class Deferred(NamedTuple):
+    """Returned by a task to be run again after a delay, rather than waiting on its worker (see `retry_after`)"""
+
+    delay: float
+    continuation: Callable[[], Any]
+
+
+class ExecutorType(enum.Enum):
+    """The backends available to run the GraphTasks of a single privacy request"""
+
+    threads = "threads"
+    synchronous = "synchronous"
+    asyncio = "asyncio"
+
+
+def get_scheduler(
+    executor_type: Optional[str] = None, concurrency: Optional[int] = None
+) -> Scheduler:
+    """Return a function that executes a dask task graph on the configured backend.
+
+    - threads: run up to `concurrency` independent collections at once on a thread pool.
+      Almost all of our nodes are I/O bound database or HTTP calls, so this pool is sized
+      independently of the CPU count.
+    - synchronous: run every collection in turn on the calling thread. Useful for debugging.
+    - asyncio: run the graph on an event loop, awaiting up to `concurrency` collections at
+      once. Tasks may be coroutine functions; see `get_async`.
+
+    Both settings default to the values in `config.execution`.
+    """
+    executor: ExecutorType = ExecutorType(
+        executor_type or config.execution.TASK_EXECUTOR
+    )
+    concurrency = concurrency or config.execution.TASK_CONCURRENCY
+
+    if executor == ExecutorType.synchronous:
+
+        def sync_scheduler(dsk: Dict[Any, Any], key: Any) -> Any:
+            """Run the task graph on the calling thread, one task at a time"""
+            return get_deferring(dsk, key)
+
+        return sync_scheduler
+
+    if executor == ExecutorType.asyncio:
+
+        def async_scheduler(dsk: Dict[Any, Any], key: Any) -> Any:
+            """Run the task graph on an event loop that only lives as long as this request"""
+            return asyncio.run(get_async(dsk, key, concurrency))  # type: ignore
+
+        return async_scheduler
+
+    def scheduler(dsk: Dict[Any, Any], key: Any) -> Any:
+        """Run the task graph on a thread pool that only lives as long as this request.
+
+        Tasks waiting to retry are re-queued rather than waiting on a thread (see `retry_after`),
+        so `concurrency` threads can always run that many tasks.
+        """
+        logger.debug(f"Running {len(dsk)} tasks, {concurrency} at a time")
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return get_deferring(dsk, key, pool)
+
+    return scheduler
+
+
+def _is_task(task: Any) -> bool:
+    """True if a dask graph value is a task, a tuple of (callable, *args), rather than a literal"""
+    return isinstance(task, tuple) and bool(task) and callable(task[0])
+
+
+def _dependencies(dsk: Dict[Any, Any], key: Any) -> Dict[Any, Set[Any]]:
+    """Map key, and every task it depends on directly or indirectly, to the keys of the tasks it depends on"""
+    dependencies: Dict[Any, Set[Any]] = {}
+    stack: List[Any] = [key]
+    while stack:
+        task_key = stack.pop()
+        if task_key in dependencies:
+            continue
+        task = dsk[task_key]
+        dependencies[task_key] = (
+            {arg for arg in task[1:] if _is_key(arg, dsk)} if _is_task(task) else set()
+        )
+        stack.extend(dependencies[task_key])
+    return dependencies
+
+
+class _DeferringRun:
+    """The state of one run of a task graph by `get_deferring`"""
+
+    def __init__(
+        self, dsk: Dict[Any, Any], key: Any, pool: Optional[ThreadPoolExecutor]
+    ) -> None:
+        self.dsk = dsk
+        self.pool = pool
+        self.dependencies: Dict[Any, Set[Any]] = _dependencies(dsk, key)
+        self.dependents: Dict[Any, List[Any]] = {}
+        for task_key, task_dependencies in self.dependencies.items():
+            for dependency in task_dependencies:
+                self.dependents.setdefault(dependency, []).append(task_key)
+        self.results: Dict[Any, Any] = {}
+        self.finished: "queue.Queue[Tuple[Any, Any, Optional[BaseException]]]" = (
+            queue.Queue()
+        )
+        # a heap of (due time, sequence number, key, continuation)
+        self.delayed: List[Tuple[float, int, Any, Callable[[], Any]]] = []
+
+    def run(self, task_key: Any, call: Callable[[], Any]) -> None:
+        """Call a task, passing its outcome to the thread running the graph"""
+        token = _can_defer.set(True)
+        try:
+            self.finished.put((task_key, call(), None))
+        except BaseException as ex:  # pylint: disable=W0703
+            self.finished.put((task_key, None, ex))
+        finally:
+            _can_defer.reset(token)
+
+    def start(self, task_key: Any, call: Callable[[], Any]) -> None:
+        """Run a task on the thread pool, or straight away if there isn't one"""
+        if self.pool:
+            self.pool.submit(self.run, task_key, call)
+        else:
+            self.run(task_key, call)
+
+    def start_task(self, task_key: Any) -> None:
+        """Start a task whose dependencies have all finished"""
+        task = self.dsk[task_key]
+        if not _is_task(task):
+            self.finished.put((task_key, task, None))  # a literal value
+            return
+        func, *args = task
+        values = [self.results[arg] if _is_key(arg, self.dsk) else arg for arg in args]
+        self.start(task_key, lambda: func(*values))
+
+    def next_outcome(self) -> Optional[Tuple[Any, Any, Optional[BaseException]]]:
+        """Wait for a task to finish, or for a delayed task to be due. Returns the finished task's outcome,
+        or starts the delayed task and returns None."""
+        timeout = (
+            max(self.delayed[0][0] - time.monotonic(), 0) if self.delayed else None
+        )
+        try:
+            return self.finished.get(timeout=timeout)
+        except queue.Empty:
+            _, _, task_key, continuation = heapq.heappop(self.delayed)
+            self.start(task_key, continuation)
+            return None
+
+    def get(self, key: Any) -> Any:
+        """Run the tasks that key depends on, and key itself, and return its value"""
+        for task_key, task_dependencies in self.dependencies.items():
+            if not task_dependencies:
+                self.start_task(task_key)
+        while key not in self.results:
+            outcome = self.next_outcome()
+            if outcome is None:
+                continue
+            task_key, value, ex = outcome
+            if ex is not None:
+                raise ex
+            if isinstance(value, Deferred):
+                due = time.monotonic() + value.delay
+                heapq.heappush(
+                    self.delayed,
+                    (due, next(_sequence), task_key, value.continuation),
+                )
+                continue
+            self.results[task_key] = value
+            for dependent in self.dependents.get(task_key, []):
+                if self.dependencies[dependent].issubset(self.results):
+                    self.start_task(dependent)
+        return self.results[key]
+
+
+def get_deferring(
+    dsk: Dict[Any, Any], key: Any, pool: Optional[ThreadPoolExecutor] = None
+) -> Any:
+    """Run a dask-style task graph and return the value at key.
+
+    Each task is a tuple of (callable, *args); any other value is a literal. Any argument that is itself
+    a key in the graph is replaced by that task's output. A task is started as soon as the tasks it
+    depends on have finished, on the thread pool if there is one and otherwise on the calling thread.
+
+    A task may return a `Deferred` to be run again after a delay. Until then it waits in a queue of
+    delayed tasks instead of on a thread, so other tasks can run meanwhile.
+    """
+    return _DeferringRun(dsk, key, pool).get(key)
+
+
+def retry_after(delay: float, continuation: Callable[[], Any]) -> Any:
+    """Retry a task by running continuation after delay, and return the task's result.
+
+    On the threaded and synchronous executors, the task is re-queued to run again once the delay
+    is up, so it doesn't hold a worker while it waits: a `Deferred` is returned, which the task
+    must return in turn. Anywhere else, such as on a streaming node, this waits on the current
+    thread with `sleep_without_slot` and returns the result of continuation.
+    """
+    if _can_defer.get():
+        return Deferred(delay, continuation)
+    sleep_without_slot(delay)
+    return continuation()
+
+
+def sleep_without_slot(delay: float) -> None:
+    """Wait on the current thread before retrying a task that can't be re-queued (see `retry_after`).
+
+    Only tasks that don't hold a slot on the executor wait this way: a streaming node, whose query
+    and connection slots are released before it retries, or a task called outside of an executor.
+    """
+    time.sleep(delay)
+
+
+async def asleep_without_slot(delay: float) -> None:
+    """Wait before retrying a coroutine task, letting other tasks run in its slot meanwhile."""
+    slots = _execution_slots.get()
+    if not isinstance(slots, asyncio.Semaphore):
+        await asyncio.sleep(delay)
+        return
+    slots.release()
+    try:
+        await asyncio.sleep(delay)
+    finally:
+        await slots.acquire()
+
+
+def is_async_executor(executor_type: Optional[str] = None) -> bool:
+    """True if the graph will be run on an event loop, so its tasks should be coroutine functions"""
+    return (
+        ExecutorType(executor_type or config.execution.TASK_EXECUTOR)
+        == ExecutorType.asyncio
+    )
+
+
+def _is_key(arg: Any, dsk: Dict[Any, Any]) -> bool:
+    """True if the task argument refers to the output of another task in the graph"""
+    try:
+        return arg in dsk
+    except TypeError:  # unhashable arguments are plain values
+        return False
+
+
+async def get_async(dsk: Dict[Any, Any], key: Any, concurrency: int) -> Any:
+    """Await a dask-style task graph and return the value at key.
+
+    Each task is a tuple of (callable, *args); any other value is a literal. Any argument that is itself a key in the
+    graph is replaced by that task's output. A task starts as soon as the tasks it depends
+    on have finished, and at most `concurrency` tasks run at a time (tasks waiting to retry
+    don't count; see `asleep_without_slot`).  Coroutine functions are awaited; plain functions
+    are called on a worker thread, so they don't block the event loop.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    futures: Dict[Any, "asyncio.Future[Any]"] = {}
+
+    def schedule(task_key: Any) -> "asyncio.Future[Any]":
+        if task_key not in futures:
+            futures[task_key] = asyncio.ensure_future(run(task_key))
+        return futures[task_key]
+
+    async def run(task_key: Any) -> Any:
+        task = dsk[task_key]
+        if not _is_task(task):
+            return task  # a literal value
+        func, *args = task
+        dependencies = [schedule(arg) for arg in args if _is_key(arg, dsk)]
+        await asyncio.gather(*dependencies)
+        values = [futures[arg].result() if _is_key(arg, dsk) else arg for arg in args]
+        async with semaphore:
+            # set within this task's own context, so it's only seen by this task
+            _execution_slots.set(semaphore)
+            if inspect.iscoroutinefunction(func):
+                return await func(*values)
+            # plain functions may block, on the database or the cache for instance
+            return await run_in_thread(func, *values)
+
+    return await schedule(key)
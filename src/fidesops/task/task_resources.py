@@ -1,9 +1,10 @@
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Set
 
 from fidesops.schemas.shared_schemas import FidesOpsKey
 
 from fidesops.common_exceptions import ConnectorNotFoundException
+from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.graph.config import (
     CollectionAddress,
@@ -24,11 +25,26 @@ from fidesops.service.connectors import (
     BigQueryConnector,
     SaaSConnector,
 )
+from fidesops.service.connector_registry import connector_registry
+from fidesops.task.execution_log_writer import ExecutionLogWriter
 from fidesops.util.cache import get_cache
 
 logger = logging.getLogger(__name__)
 
 
+def completed_collections(logs: Iterable[ExecutionLog]) -> Set[CollectionAddress]:
+    """Return the collections whose latest log, in the order given, is complete"""
+    latest_status: Dict[CollectionAddress, ExecutionLogStatus] = {
+        CollectionAddress(log.dataset_name, log.collection_name): log.status
+        for log in logs
+    }
+    return {
+        address
+        for address, status in latest_status.items()
+        if status == ExecutionLogStatus.complete
+    }
+
+
 class Connections:
     """Temporary container for connections. This will be replaced."""
 
@@ -37,10 +53,15 @@ class Connections:
 
     def get_connector(self, connection_config: ConnectionConfig) -> BaseConnector:
         """Return the connector corresponding to this config. Will return the existing
-        connector or create one if it does not yet exist."""
+        connector or create one if it does not yet exist.
+
+        Connectors with connection pools get their client from the connector registry, so they
+        share open connections with other privacy requests."""
         key = connection_config.key
         if key not in self.connections:
             connector = Connections.build_connector(connection_config)
+            if connector.shared_client:
+                connector.client_registry = connector_registry
             self.connections[key] = connector
         return self.connections[key]
 
@@ -72,9 +93,13 @@ class Connections:
         )
 
     def close(self) -> None:
-        """Close all held connection resources."""
+        """Close all held connection resources. Clients shared through the connector registry
+        are released there instead, and left open for later privacy requests."""
         for connector in self.connections.values():
-            connector.close()
+            if connector.client_registry is None:
+                connector.close()
+            else:
+                connector.client_registry.release(connector)
 
 
 class TaskResources:
@@ -84,6 +109,7 @@ class TaskResources:
      - the policy
      - redis connection
      -  configurations to any outside resources the task will require to run
+     - a writer that inserts the task's execution logs in batches
     """
 
     def __init__(
@@ -100,6 +126,10 @@ class TaskResources:
             c.key: c for c in connection_configs
         }
         self.connections = Connections()
+        self.execution_log_writer = ExecutionLogWriter(
+            config.execution.EXECUTION_LOG_BATCH_SIZE,
+            config.execution.EXECUTION_LOG_FLUSH_INTERVAL,
+        )
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' usage for closing resources"""
@@ -134,23 +164,38 @@ class TaskResources:
         status: ExecutionLogStatus,
         message: str = None,
     ) -> Any:
-        """Store in application db. Return the created or written-to id field value."""
+        """Queue an ExecutionLog to be stored in the application db. Logs are inserted in batches
+        in the background, and all of them have been inserted once the resources are closed."""
+        self.execution_log_writer.write(
+            dataset_name=collection_address.dataset,
+            collection_name=collection_address.collection,
+            fields_affected=fields_affected,
+            action_type=action_type,
+            status=status,
+            privacy_request_id=self.request.id,
+            message=message,
+        )
+
+    def get_completed_collections(
+        self, action_type: ActionType
+    ) -> Set[CollectionAddress]:
+        """Return the collections whose most recent ExecutionLog for this request and action type
+        is complete. These don't need to be run again when the request is resumed or re-run."""
+        self.execution_log_writer.flush()
         SessionLocal = get_db_session()
         db = SessionLocal()
 
-        ExecutionLog.create(
-            db=db,
-            data={
-                "dataset_name": collection_address.dataset,
-                "collection_name": collection_address.collection,
-                "fields_affected": fields_affected,
-                "action_type": action_type,
-                "status": status,
-                "privacy_request_id": self.request.id,
-                "message": message,
-            },
+        logs = (
+            ExecutionLog.query(db=db)
+            .filter(
+                ExecutionLog.privacy_request_id == self.request.id,
+                ExecutionLog.action_type == action_type,
+            )
+            .order_by(ExecutionLog.created_at)
         )
+        completed = completed_collections(logs)
         db.close()
+        return completed
 
     def get_connector(self, key: FidesOpsKey) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
@@ -161,4 +206,44 @@ class TaskResources:
     def close(self) -> None:
         """Close any held resources"""
         logger.debug(f"Closing all task resources for {self.request.id}")
-        self.connections.close()
+        try:
+            self.execution_log_writer.close()
+        finally:
+            self.connections.close()
+
+
+class BatchTaskResources(TaskResources):
+    """TaskResources for a traversal run on behalf of several privacy requests at once.
+
+    The first request in the batch stands in wherever a single request is expected
+    (connector calls, log messages). Execution logs are written for every request in the batch.
+    """
+
+    def __init__(
+        self,
+        requests: List[PrivacyRequest],
+        policy: Policy,
+        connection_configs: List[ConnectionConfig],
+    ):
+        super().__init__(requests[0], policy, connection_configs)
+        self.requests = requests
+
+    def write_execution_log(  # pylint: disable=too-many-arguments
+        self,
+        collection_address: CollectionAddress,
+        fields_affected: Any,
+        action_type: ActionType,
+        status: ExecutionLogStatus,
+        message: Optional[str] = None,
+    ) -> Any:
+        """Queue the same ExecutionLog to be stored in the application db for each request in the batch."""
+        for request in self.requests:
+            self.execution_log_writer.write(
+                dataset_name=collection_address.dataset,
+                collection_name=collection_address.collection,
+                fields_affected=fields_affected,
+                action_type=action_type,
+                status=status,
+                privacy_request_id=request.id,
+                message=message,
+            )
@@ -4,15 +4,20 @@ from typing import Optional
 from apscheduler.jobstores.base import JobLookupError
 from fidesops.schemas.shared_schemas import FidesOpsKey
 
+from fidesops.core.config import config
 from fidesops.db.session import get_db_session
 from fidesops.models.storage import StorageConfig
 from fidesops.schemas.storage.storage import StorageType, StorageDetails
 from fidesops.service.privacy_request.onetrust_service import OneTrustService
+from fidesops.service.privacy_request.request_runner_service import (
+    run_pending_privacy_requests,
+)
 from fidesops.tasks.scheduled.scheduler import scheduler
 
 logger = logging.getLogger(__name__)
 
 ONETRUST_INTAKE_TASK = "onetrust_intake"
+PRIVACY_REQUEST_BATCH_TASK = "privacy_request_batch"
 
 
 def initiate_scheduled_request_intake() -> None:
@@ -51,3 +56,25 @@ def initiate_scheduled_request_intake() -> None:
 def _intake_onetrust_requests(config_key: FidesOpsKey) -> None:
     """Begins onetrust request intake"""
     OneTrustService.intake_onetrust_requests(config_key)
+
+
+def initiate_scheduled_request_batches() -> None:
+    """Initiates scheduler to run pending privacy requests in batches, if enabled"""
+    if config.execution.REQUEST_BATCH_INTERVAL:
+        logger.info("Initiating batched privacy request execution.")
+        scheduler.add_job(
+            func=run_pending_privacy_requests,
+            id=PRIVACY_REQUEST_BATCH_TASK,
+            # A run that falls due while the previous batch is still running is skipped
+            coalesce=True,
+            max_instances=1,
+            replace_existing=True,
+            trigger="interval",
+            seconds=config.execution.REQUEST_BATCH_INTERVAL,
+        )
+    else:
+        try:
+            scheduler.remove_job(job_id=PRIVACY_REQUEST_BATCH_TASK)
+        except JobLookupError:
+            # This job isn't currently configured on the scheduler, so we don't need to remove it
+            pass
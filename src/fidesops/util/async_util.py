@@ -1,6 +1,7 @@
 import asyncio
 from asyncio import AbstractEventLoop
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TypeVar, Callable, Any, Awaitable, Optional
 import logging
 
@@ -25,6 +26,12 @@ def run_async(task: Callable[[Any], T], *args: Any) -> Awaitable[T]:
     return _loop().run_in_executor(executor, task, *args)
 
 
+async def run_in_thread(task: Callable[..., T], *args: Any) -> T:
+    """Await a blocking callable on the event loop's default executor, so that other coroutines
+    keep running while it waits on the database, the cache or the network"""
+    return await asyncio.get_running_loop().run_in_executor(None, partial(task, *args))
+
+
 def wait_for(t: Awaitable[T]) -> Optional[T]:
     """Wait for the return of a callable. This is mostly intended
     to be used for testing async tasks."""
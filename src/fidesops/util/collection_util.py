@@ -1,5 +1,5 @@
 from functools import reduce
-from typing import List, Dict, TypeVar, Iterable, Callable, Any, Optional
+from typing import List, Dict, TypeVar, Iterable, Callable, Any, Optional, Hashable, Set
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -52,3 +52,84 @@ def filter_nonempty_values(d: Optional[Dict[Any, Any]]) -> Dict[Any, Any]:
     if d:
         return {e[0]: e[1] for e in d.items() if e[1]}
     return {}
+
+
+def value_key(value: Any) -> Hashable:
+    """A hashable key for a value that may not be hashable itself, such as a dict.
+
+    Values of different types have different keys, so 1, 1.0 and "1" are told apart
+    even though some of them are equal.
+    """
+    try:
+        hash(value)
+        return type(value), value
+    except TypeError:
+        return type(value), repr(value)
+
+
+def unique(values: Iterable[T]) -> List[T]:
+    """The distinct values in the input, in the order they first appear.
+
+    unique([2, 1, 2, "2"]) => [2, 1, "2"]
+    """
+    seen = set()
+    out: List[T] = []
+    for value in values:
+        key = value_key(value)
+        if key not in seen:
+            seen.add(key)
+            out.append(value)
+    return out
+
+
+def chunk_values(d: Dict[T, List[U]], max_values: int) -> List[Dict[T, List[U]]]:
+    """Split a dictionary of value lists into dictionaries holding at most max_values values
+    in total, across all keys. A dictionary that is already small enough is returned as is.
+
+    chunk_values({"A": [1, 2, 3], "B": [4]}, 2) => [{"A": [1, 2]}, {"A": [3], "B": [4]}]
+    """
+    if sum(len(values) for values in d.values()) <= max_values:
+        return [d]
+    chunks: List[Dict[T, List[U]]] = []
+    chunk: Dict[T, List[U]] = {}
+    chunk_size = 0
+    for key, values in d.items():
+        for value in values:
+            if chunk_size == max_values:
+                chunks.append(chunk)
+                chunk, chunk_size = {}, 0
+            chunk.setdefault(key, []).append(value)
+            chunk_size += 1
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def row_key(primary_keys: List[str], row: Row) -> Optional[Hashable]:
+    """A key identifying a row, used to remove rows returned by more than one query: the row's
+    primary key values if it has them all, otherwise None, as the row can't be told apart from
+    a genuine duplicate."""
+    if primary_keys and all(row.get(key) is not None for key in primary_keys):
+        return value_key(tuple(row[key] for key in primary_keys))
+    return None
+
+
+def unseen_rows(
+    primary_keys: List[str], row_keys: Set[Hashable], rows: Iterable[Row]
+) -> List[Row]:
+    """The rows in the input whose keys (see `row_key`) aren't in row_keys yet, adding their keys
+    to row_keys. Rows without a key are always kept."""
+    out: List[Row] = []
+    for row in rows:
+        key = row_key(primary_keys, row)
+        if key is None:
+            out.append(row)
+        elif key not in row_keys:
+            row_keys.add(key)
+            out.append(row)
+    return out
+
+
+def unique_rows(primary_keys: List[str], rows: Iterable[Row]) -> List[Row]:
+    """The rows in the input, leaving out any row with the same key (see `row_key`) as an earlier one"""
+    return unseen_rows(primary_keys, set(), rows)
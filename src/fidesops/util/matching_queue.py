@@ -1,44 +1,114 @@
 from __future__ import annotations
-from typing import Optional, Callable, TypeVar, Generic
+
+import heapq
+from collections import OrderedDict
+from itertools import count
+from typing import (
+    Optional,
+    Callable,
+    TypeVar,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Dict,
+    Tuple,
+)
 
 T = TypeVar("T")
 
 
 class MatchingQueue(Generic[T]):
-    """A basic LILO queue with the added ability to pop not only the head, but the first value matching a given input function."""
+    """A basic LILO queue with the added ability to pop not only the head, but the first value matching a given input function.
+
+    Values are unique and held in an ordered set, so membership checks and pops from the head are O(1).
+
+    A value can also be pushed as blocked on some keys, and is only "ready" once every one of those keys has
+    been released. `pop_first_ready` pops the ready value that was pushed first, without re-checking the
+    values that are still blocked.
+    """
 
     def __init__(self, *values: T):
-        self.data = list(values)
+        self._sequence = count()
+        # queued values mapped to the order they were pushed in
+        self._queued: OrderedDict[T, int] = OrderedDict()
+        # heap of (push order, value) for values that aren't blocked. Entries for values that have since
+        # been popped are skipped when they reach the top.
+        self._ready: List[Tuple[int, T]] = []
+        # blocked values mapped to the number of keys they are still waiting for
+        self._blocked: Dict[T, int] = {}
+        # keys mapped to the (value, push order) pairs waiting for them
+        self._waiting: Dict[Hashable, List[Tuple[T, int]]] = {}
+        for value in values:
+            self.push(value)
 
-    def push(self, t: T) -> None:
-        """insert into the queue"""
-        self.data.append(t)
+    @property
+    def data(self) -> List[T]:
+        """The queued values, in order"""
+        return list(self._queued)
 
-    def push_if_new(self, t: T) -> None:
+    def push(self, t: T, blocked_on: Iterable[Hashable] = ()) -> None:
+        """insert into the queue, blocked until each of the given keys is released. A value that's already
+        in the queue keeps its place."""
+        if t in self._queued:
+            return
+        sequence = next(self._sequence)
+        self._queued[t] = sequence
+        keys = set(blocked_on)
+        if keys:
+            self._blocked[t] = len(keys)
+            for key in keys:
+                self._waiting.setdefault(key, []).append((t, sequence))
+        else:
+            heapq.heappush(self._ready, (sequence, t))
+
+    def push_if_new(self, t: T, blocked_on: Iterable[Hashable] = ()) -> None:
         """insert into the queue only if this value is not already in the queue."""
-        if t not in self.data:
-            self.push(t)
+        self.push(t, blocked_on)
+
+    def release(self, key: Hashable) -> None:
+        """Mark that the key is done: values that were only waiting for this key become ready."""
+        for value, sequence in self._waiting.pop(key, []):
+            if self._queued.get(value) != sequence:
+                continue  # popped since
+            self._blocked[value] -= 1
+            if not self._blocked[value]:
+                del self._blocked[value]
+                heapq.heappush(self._ready, (sequence, value))
+
+    def _remove(self, t: T) -> None:
+        del self._queued[t]
+        self._blocked.pop(t, None)
 
     def pop(self) -> Optional[T]:
         """safely return the next value in the queue, or None if the queue is empty."""
-        if self.data:
-            v = self.data[0]
-            del self.data[0]
+        if self._queued:
+            v, _ = self._queued.popitem(last=False)
+            self._blocked.pop(v, None)
             return v
         return None
 
     def pop_first_match(self, fn: Callable[[T], bool]) -> Optional[T]:
         """Find the first matching value for f and pop it or return None"""
-        for idx, val in enumerate(self.data):
+        for val in self._queued:
             if fn(val):
-                del self.data[idx]
+                self._remove(val)
                 return val
         # if no matching value exists, return None
         return None
 
+    def pop_first_ready(self) -> Optional[T]:
+        """Pop the first value pushed that isn't blocked, or return None if every queued value is blocked"""
+        while self._ready:
+            sequence, val = heapq.heappop(self._ready)
+            if self._queued.get(val) == sequence:
+                self._remove(val)
+                return val
+        return None
+
     def is_empty(self) -> bool:
         """is the queue empty?"""
-        return len(self.data) == 0
+        return len(self._queued) == 0
 
     def __repr__(self) -> str:
         return f"Queue {self.data}"
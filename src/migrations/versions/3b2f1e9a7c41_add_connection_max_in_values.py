@@ -0,0 +1,27 @@
+"""add max in values to connection config
+
+Revision ID: 3b2f1e9a7c41
+Revises: 9c6f62e4c9da
+Create Date: 2022-03-18 10:12:47.215093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3b2f1e9a7c41"
+down_revision = "9c6f62e4c9da"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "connectionconfig",
+        sa.Column("max_in_values", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("connectionconfig", "max_in_values")
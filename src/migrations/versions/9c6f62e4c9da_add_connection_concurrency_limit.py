@@ -0,0 +1,27 @@
+"""add concurrency limit to connection config
+
+Revision ID: 9c6f62e4c9da
+Revises: 5a966cd643d7
+Create Date: 2022-03-15 16:42:11.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9c6f62e4c9da"
+down_revision = "5a966cd643d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "connectionconfig",
+        sa.Column("concurrency_limit", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("connectionconfig", "concurrency_limit")
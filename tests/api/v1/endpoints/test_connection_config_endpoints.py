@@ -408,6 +408,8 @@ class TestGetConnections:
             "name",
             "last_test_timestamp",
             "last_test_succeeded",
+            "concurrency_limit",
+            "max_in_values",
             "key",
             "created_at",
         }
@@ -466,6 +468,8 @@ class TestGetConnection:
             "name",
             "last_test_timestamp",
             "last_test_succeeded",
+            "concurrency_limit",
+            "max_in_values",
             "key",
             "created_at",
         }
@@ -34,6 +34,8 @@ def embedded_http_connection_config(connection_config: ConnectionConfig) -> Dict
         "updated_at": stringify_date(connection_config.updated_at),
         "last_test_timestamp": None,
         "last_test_succeeded": None,
+        "concurrency_limit": None,
+        "max_in_values": None,
     }
 
 
@@ -23,6 +23,7 @@ from fidesops.api.v1.scope_registry import (
     PRIVACY_REQUEST_CALLBACK_RESUME,
     DATASET_CREATE_OR_UPDATE,
 )
+from fidesops.core.config import config
 from fidesops.models.client import ClientDetail
 from fidesops.models.privacy_request import (
     PrivacyRequest,
@@ -78,6 +79,36 @@ class TestCreatePrivacyRequest:
         pr.delete(db=db)
         assert run_access_request_mock.called
 
+    @mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.submit"
+    )
+    def test_create_privacy_request_left_pending_for_batch(
+        self,
+        run_access_request_mock,
+        url,
+        db,
+        api_client: TestClient,
+        policy,
+    ):
+        original_interval = config.execution.REQUEST_BATCH_INTERVAL
+        config.execution.REQUEST_BATCH_INTERVAL = 60
+        data = [
+            {
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_key": policy.key,
+                "identity": {"email": "test@example.com"},
+            }
+        ]
+        resp = api_client.post(url, json=data)
+        config.execution.REQUEST_BATCH_INTERVAL = original_interval
+        assert resp.status_code == 200
+        response_data = resp.json()["succeeded"]
+        assert len(response_data) == 1
+        pr = PrivacyRequest.get(db=db, id=response_data[0]["id"])
+        assert pr.status == PrivacyRequestStatus.pending
+        pr.delete(db=db)
+        assert not run_access_request_mock.called
+
     @mock.patch(
         "fidesops.service.privacy_request.request_runner_service.PrivacyRequestRunner.submit"
     )
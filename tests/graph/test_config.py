@@ -235,6 +235,39 @@ class TestCollection:
             ],  # Applies to a nested field
         }
 
+    def test_field_indexes_are_memoized(self):
+        ds = Collection(
+            name="t3",
+            fields=[
+                ScalarField(name="f1", primary_key=True, identity="email"),
+                ObjectField(
+                    name="f2",
+                    fields={
+                        "f3": ScalarField(
+                            name="f3",
+                            data_categories=["test_category_apple"],
+                            references=[(FieldAddress("d", "e", "f"), None)],
+                        )
+                    },
+                ),
+            ],
+        )
+
+        assert ds.field(FieldPath("f2", "f3")).name == "f3"
+        assert ds.field(FieldPath("f4")) is None
+        assert ds.primary_key_field_paths == {FieldPath("f1"): ds.fields[0]}
+        assert ds.identities() == {FieldPath("f1"): "email"}
+
+        assert ds.field_dict is ds.field_dict
+        assert ds.references() is ds.references()
+        assert ds.identities() is ds.identities()
+        assert ds.field_paths_by_category is ds.field_paths_by_category
+        assert ds.primary_key_field_paths is ds.primary_key_field_paths
+
+        # the indexes are not part of the model's data
+        assert set(ds.dict().keys()) == {"name", "fields", "after"}
+        assert ds == Collection(name="t3", fields=ds.fields)
+
 
 class TestField:
     def test_generate_field(self) -> None:
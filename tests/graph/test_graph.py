@@ -1,8 +1,15 @@
+import asyncio
 from fidesops.core.config import config
 from fidesops.graph.config import *
 from fidesops.graph.traversal import *
 from fidesops.models.policy import ActionType
-from fidesops.task.graph_task import retry
+from fidesops.common_exceptions import (
+    ClientUnsuccessfulException,
+    TraversalError,
+    ValidationError,
+)
+from fidesops.task.graph_task import retry, is_retryable
+from fidesops.task.task_executor import get_scheduler
 from tests.task.traversal_data import integration_db_graph
 
 t1 = Collection(
@@ -100,3 +107,150 @@ def test_retry_decorator():
     assert isinstance(test_obj.end_called_with[1], KeyError)
     assert test_obj.start_logged == 1
     assert test_obj.retry_logged == 5
+
+
+def test_retry_decorator_async():
+    graph: DatasetGraph = integration_db_graph("postgres_example")
+    traversal = Traversal(graph, {"email": "X"})
+    payment_card_node = traversal.traversal_node_dict[
+        CollectionAddress("postgres_example", "payment_card")
+    ]
+
+    config.execution.TASK_RETRY_COUNT = 2
+    config.execution.TASK_RETRY_DELAY = 0.1
+    config.execution.TASK_RETRY_BACKOFF = 0.01
+
+    class TestRetryDecorator:
+        def __init__(self):
+            self.traversal_node = payment_card_node
+            self.call_count = 0
+            self.start_logged = 0
+            self.retry_logged = 0
+            self.end_called_with = ()
+
+        def log_end(self, action_type: ActionType, exc: Optional[str] = None):
+            self.end_called_with = (action_type, exc)
+
+        def log_start(self, _: ActionType):
+            self.start_logged += 1
+
+        def log_retry(self, _: ActionType):
+            self.retry_logged += 1
+
+        @retry(action_type=ActionType.erasure, default_return=0)
+        async def test_function(self):
+            self.call_count += 1
+            raise ValueError("failed")
+
+    test_obj = TestRetryDecorator()
+    assert asyncio.run(test_obj.test_function()) == 0
+    assert test_obj.call_count == 3  # called once, with 2 retries
+    assert test_obj.end_called_with[0] == ActionType.erasure
+    assert isinstance(test_obj.end_called_with[1], ValueError)
+    assert test_obj.start_logged == 1
+    assert test_obj.retry_logged == 2
+
+
+def test_retry_decorator_requeues_on_executor():
+    """On the threaded executor, a task waiting to retry doesn't hold up the only worker"""
+    graph: DatasetGraph = integration_db_graph("postgres_example")
+    traversal = Traversal(graph, {"email": "X"})
+    payment_card_node = traversal.traversal_node_dict[
+        CollectionAddress("postgres_example", "payment_card")
+    ]
+
+    config.execution.TASK_RETRY_COUNT = 2
+    config.execution.TASK_RETRY_DELAY = 0.2
+    config.execution.TASK_RETRY_BACKOFF = 1
+    finished = []
+
+    class TestRetryDecorator:
+        def __init__(self):
+            self.traversal_node = payment_card_node
+            self.call_count = 0
+            self.end_called_with = ()
+
+        def log_end(self, action_type: ActionType, exc: Optional[str] = None):
+            self.end_called_with = (action_type, exc)
+
+        def log_start(self, _: ActionType):
+            pass
+
+        def log_retry(self, _: ActionType):
+            pass
+
+        @retry(action_type=ActionType.access, default_return=[])
+        def test_function(self):
+            self.call_count += 1
+            if self.call_count < 3:
+                raise ValueError("failed")
+            finished.append("retried")
+            return [{"id": 1}]
+
+    def quick_task():
+        finished.append("quick")
+        return []
+
+    test_obj = TestRetryDecorator()
+    dsk = {
+        "retried": (test_obj.test_function,),
+        "quick": (quick_task,),
+        "end": (lambda *values: values, "retried", "quick"),
+    }
+    assert get_scheduler("threads", 1)(dsk, "end") == ([{"id": 1}], [])
+    assert test_obj.call_count == 3
+    assert test_obj.end_called_with == ()
+    assert finished == ["quick", "retried"]
+
+
+def test_retry_decorator_fails_fast_on_non_retryable_error():
+    graph: DatasetGraph = integration_db_graph("postgres_example")
+    traversal = Traversal(graph, {"email": "X"})
+    payment_card_node = traversal.traversal_node_dict[
+        CollectionAddress("postgres_example", "payment_card")
+    ]
+
+    config.execution.TASK_RETRY_COUNT = 5
+    config.execution.TASK_RETRY_DELAY = 0.1
+    config.execution.TASK_RETRY_BACKOFF = 0.01
+
+    class TestRetryDecorator:
+        def __init__(self):
+            self.traversal_node = payment_card_node
+            self.call_count = 0
+            self.start_logged = 0
+            self.retry_logged = 0
+            self.end_called_with = ()
+
+        def log_end(self, action_type: ActionType, exc: Optional[str] = None):
+            self.end_called_with = (action_type, exc)
+
+        def log_start(self, _: ActionType):
+            self.start_logged += 1
+
+        def log_retry(self, _: ActionType):
+            self.retry_logged += 1
+
+        @retry(action_type=ActionType.access, default_return=[])
+        def test_function(self):
+            self.call_count += 1
+            raise ClientUnsuccessfulException(status_code=404)
+
+    test_obj = TestRetryDecorator()
+    assert test_obj.test_function() == []
+    assert test_obj.call_count == 1
+    assert isinstance(test_obj.end_called_with[1], ClientUnsuccessfulException)
+    assert test_obj.start_logged == 1
+    assert test_obj.retry_logged == 0
+
+
+def test_is_retryable():
+    assert is_retryable(KeyError("missing"))
+    assert is_retryable(ConnectionError("refused"))
+    assert is_retryable(ClientUnsuccessfulException(status_code=500))
+    assert is_retryable(ClientUnsuccessfulException(status_code=429))
+    assert is_retryable(ClientUnsuccessfulException(status_code=408))
+
+    assert not is_retryable(ClientUnsuccessfulException(status_code=404))
+    assert not is_retryable(ValidationError("bad input"))
+    assert not is_retryable(TraversalError("unreachable"))
@@ -692,3 +692,40 @@ def test_different_seed_alters_traversal() -> None:
         len(Traversal(graph, {"ssn": "1", "email": 1, "user_id": 1}).root_node.children)
         == 4
     )
+
+
+def test_traversal_plan_shared_by_graph_version_and_identity_keys() -> None:
+    t = generate_fully_connected_resources(5)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    field(t, "dr_2", "ds_2", "f1").identity = "user_id"
+    graph = DatasetGraph(*t)
+    graph.version = ("test_traversal_plan", 1)
+    traversal_plan_cache.clear()
+
+    first = Traversal(graph, {"email": "1"})
+    second = Traversal(graph, {"email": "2"})
+    assert second.plan is first.plan
+    assert second.traversal_map() == first.traversal_map()
+    # the nodes of each traversal are still their own
+    assert (
+        second.traversal_node_dict[CollectionAddress("dr_2", "ds_2")]
+        is not first.traversal_node_dict[CollectionAddress("dr_2", "ds_2")]
+    )
+
+    # different identity keys or a different graph version need a new plan
+    assert Traversal(graph, {"user_id": "1"}).plan is not first.plan
+    graph.version = ("test_traversal_plan", 2)
+    assert Traversal(graph, {"email": "1"}).plan is not first.plan
+
+
+def test_traverse_replays_plan() -> None:
+    t = generate_fully_connected_resources(5)
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    traversal = Traversal(DatasetGraph(*t), {"email": "X"})
+
+    visited = []
+    end_nodes = traversal.traverse({}, lambda tn, _: visited.append(tn.address))
+    assert visited == traversal.plan.order
+    assert visited[0] == ROOT_COLLECTION_ADDRESS
+    assert len(visited) == len(set(visited)) == 6
+    assert end_nodes == traversal.plan.end_nodes
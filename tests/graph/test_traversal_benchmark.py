@@ -0,0 +1,93 @@
+"""Benchmarks traversal planning on large generated graphs.
+
+Run directly to print timings for a range of graph sizes:
+
+    python -m tests.graph.test_traversal_benchmark 500 1000 3000
+"""
+import random
+import sys
+import time
+from typing import List
+
+import pytest
+
+from fidesops.graph.config import (
+    Collection,
+    CollectionAddress,
+    Dataset,
+    FieldAddress,
+    ScalarField,
+)
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.traversal import Traversal
+
+
+def generate_warehouse_resources(
+    num_tables: int, references_per_table: int = 3, seed: int = 0
+) -> List[Dataset]:
+    """Generate a warehouse-like schema: an identity table, and tables that each hold a foreign
+    key to an earlier table (so every table is reachable) plus a few references to random tables,
+    spread over several datasets."""
+    rnd = random.Random(seed)
+    datasets: List[List[Collection]] = [[] for _ in range(max(1, num_tables // 100))]
+
+    def address(table: int) -> FieldAddress:
+        return FieldAddress(f"schema_{table % len(datasets)}", f"table_{table}", "id")
+
+    for table in range(num_tables):
+        fields = [ScalarField(name="id", primary_key=True)]
+        if table == 0:
+            fields.append(ScalarField(name="email", identity="email"))
+        else:
+            fields.append(
+                ScalarField(
+                    name="parent_id",
+                    references=[(address(rnd.randrange(table)), "from")],
+                )
+            )
+            for ref in range(references_per_table - 1):
+                other = rnd.randrange(num_tables)
+                if other != table:
+                    fields.append(
+                        ScalarField(
+                            name=f"ref_{ref}", references=[(address(other), None)]
+                        )
+                    )
+        datasets[table % len(datasets)].append(
+            Collection(name=f"table_{table}", fields=fields)
+        )
+    return [
+        Dataset(name=f"schema_{i}", collections=collections, connection_key="warehouse")
+        for i, collections in enumerate(datasets)
+    ]
+
+
+def time_traversal(num_tables: int) -> float:
+    """Seconds taken to plan a traversal of a generated warehouse graph"""
+    graph = DatasetGraph(*generate_warehouse_resources(num_tables))
+    start = time.perf_counter()
+    traversal = Traversal(graph, {"email": "X"})
+    elapsed = time.perf_counter() - start
+    assert len(traversal.traversal_node_dict) == num_tables
+    return elapsed
+
+
+@pytest.mark.parametrize("num_tables", [3000])
+def test_traversal_of_large_graph(num_tables: int) -> None:
+    """Planning is close to linear in the size of the graph; at the sizes of real warehouse
+    schemas it takes well under a second, so this bound is very loose."""
+    assert time_traversal(num_tables) < 10
+
+
+def test_generated_warehouse_traversal_visits_every_table() -> None:
+    graph = DatasetGraph(*generate_warehouse_resources(250))
+    visited = []
+    Traversal(graph, {"email": "X"}).traverse(
+        {}, lambda tn, _: visited.append(tn.address)
+    )
+    assert set(visited) == set(graph.nodes) | {CollectionAddress("__ROOT__", "__ROOT__")}
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or [250, 500, 1000, 2000, 3000]:
+        print(f"{size} tables: {time_traversal(size):.3f}s")
@@ -112,3 +112,29 @@ class TestTraversalNode:
         assert not tn.is_root_node()
 
 
+
+    def test_frozen_edge_data(self) -> None:
+        tn = TraversalNode(generate_node("a", "b", "c", "c2"))
+        child = TraversalNode(generate_node("d", "e", "f", "f2"))
+        tn.add_child(
+            child, Edge(FieldAddress("a", "b", "c"), FieldAddress("d", "e", "f"))
+        )
+
+        assert child.incoming_edges() is child.incoming_edges()
+        assert child.query_field_paths == {FieldPath("f")}
+        assert child.incoming_field_path_map == {
+            CollectionAddress("a", "b"): [(FieldPath("c"), FieldPath("f"))]
+        }
+        assert tn.outgoing_edges() is tn.outgoing_edges()
+
+        # adding another edge refreshes the frozen data of both nodes
+        tn.add_child(
+            child,
+            Edge(FieldAddress("a", "b", "c", "c2"), FieldAddress("d", "e", "f", "f2")),
+        )
+        assert child.query_field_paths == {FieldPath("f"), FieldPath("f", "f2")}
+        assert len(tn.outgoing_edges()) == 2
+        assert sorted(child.incoming_field_path_map[CollectionAddress("a", "b")]) == [
+            (FieldPath("c"), FieldPath("f")),
+            (FieldPath("c", "c2"), FieldPath("f", "f2")),
+        ]
@@ -20,7 +20,7 @@ from fidesops.models.policy import Rule, RuleTarget, ActionType
 from fidesops.models.privacy_request import ExecutionLog, PrivacyRequest
 from fidesops.schemas.dataset import FidesopsDataset
 from fidesops.service.connectors import get_connector
-from fidesops.task import graph_task
+from fidesops.task import batch_graph_task, graph_task, streaming_graph_task
 from fidesops.task.filter_results import filter_data_categories
 from fidesops.task.graph_task import (
     get_cached_data_for_erasures,
@@ -346,6 +346,117 @@ def test_postgres_access_request_task(
     )
 
 
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_postgres_access_request_task_streaming(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    """Streaming rows between collections returns the same results as the default executor"""
+    original_batch_size = config.execution.STREAM_BATCH_SIZE
+    config.execution.STREAM_BATCH_SIZE = 1
+
+    identity = {"email": "customer-1@example.com"}
+    expected = graph_task.run_access_request(
+        PrivacyRequest(id=f"test_postgres_access_request_{random.randint(0, 1000)}"),
+        policy,
+        integration_db_graph("postgres_example"),
+        [integration_postgres_config],
+        identity,
+    )
+    v = streaming_graph_task.run_access_request_streaming(
+        PrivacyRequest(id=f"test_postgres_streaming_{random.randint(0, 1000)}"),
+        policy,
+        integration_db_graph("postgres_example"),
+        [integration_postgres_config],
+        identity,
+    )
+    config.execution.STREAM_BATCH_SIZE = original_batch_size
+
+    assert v.keys() == expected.keys()
+    for address, rows in expected.items():
+        assert sorted(v[address], key=repr) == sorted(rows, key=repr)
+    assert v["postgres_example:customer"][0]["email"] == "customer-1@example.com"
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_postgres_access_request_task_batch(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    """Running access requests as one batch returns each request the same results as running it alone"""
+    identities = {
+        f"test_postgres_batch_{i}_{random.randint(0, 1000)}": {"email": email}
+        for i, email in enumerate(["customer-1@example.com", "customer-2@example.com"])
+    }
+    privacy_requests = [PrivacyRequest(id=id) for id in identities]
+    v = batch_graph_task.run_access_request_batch(
+        privacy_requests,
+        policy,
+        integration_db_graph("postgres_example"),
+        [integration_postgres_config],
+        identities,
+    )
+
+    for privacy_request in privacy_requests:
+        expected = graph_task.run_access_request(
+            PrivacyRequest(id=f"{privacy_request.id}_alone"),
+            policy,
+            integration_db_graph("postgres_example"),
+            [integration_postgres_config],
+            identities[privacy_request.id],
+        )
+        assert v[privacy_request.id].keys() == expected.keys()
+        for address, rows in expected.items():
+            assert sorted(v[privacy_request.id][address], key=repr) == sorted(
+                rows, key=repr
+            )
+        assert [
+            row["email"] for row in v[privacy_request.id]["postgres_example:customer"]
+        ] == [identities[privacy_request.id]["email"]]
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_postgres_access_request_task_resumes_from_checkpoints(
+    db,
+    policy,
+    integration_postgres_config,
+    postgres_integration_db,
+) -> None:
+    """Re-running an access request reuses the cached results of collections that already completed"""
+    privacy_request = PrivacyRequest(
+        id=f"test_postgres_access_request_resume_{random.randint(0, 1000)}"
+    )
+    identity = {"email": "customer-1@example.com"}
+    v = graph_task.run_access_request(
+        privacy_request,
+        policy,
+        integration_db_graph("postgres_example"),
+        [integration_postgres_config],
+        identity,
+    )
+
+    with mock.patch(
+        "fidesops.service.connectors.sql_connector.SQLConnector.retrieve_data"
+    ) as mock_retrieve_data:
+        resumed = graph_task.run_access_request(
+            privacy_request,
+            policy,
+            integration_db_graph("postgres_example"),
+            [integration_postgres_config],
+            identity,
+        )
+
+    assert not mock_retrieve_data.called
+    assert resumed == v
+
+
 @pytest.mark.integration_mssql
 @pytest.mark.integration
 def test_mssql_access_request_task(
@@ -522,6 +633,47 @@ def test_mysql_access_request_task(
     )
 
 
+@pytest.mark.integration_mysql
+@pytest.mark.integration
+def test_mysql_access_request_task_batch(
+    db,
+    policy,
+    connection_config_mysql,
+    mysql_integration_db,
+) -> None:
+    """MySQL compares strings case-insensitively, so batched rows are queried again for each request"""
+    identities = {
+        f"test_mysql_batch_{i}_{random.randint(0, 1000)}": {"email": email}
+        for i, email in enumerate(["CUSTOMER-1@example.com", "customer-2@example.com"])
+    }
+    privacy_requests = [PrivacyRequest(id=id) for id in identities]
+    v = batch_graph_task.run_access_request_batch(
+        privacy_requests,
+        policy,
+        integration_db_graph("my_mysql_db_1"),
+        [connection_config_mysql],
+        identities,
+    )
+
+    for privacy_request in privacy_requests:
+        expected = graph_task.run_access_request(
+            PrivacyRequest(id=f"{privacy_request.id}_alone"),
+            policy,
+            integration_db_graph("my_mysql_db_1"),
+            [connection_config_mysql],
+            identities[privacy_request.id],
+        )
+        assert v[privacy_request.id].keys() == expected.keys()
+        for address, rows in expected.items():
+            assert sorted(v[privacy_request.id][address], key=repr) == sorted(
+                rows, key=repr
+            )
+        assert [
+            row["email"].lower()
+            for row in v[privacy_request.id]["my_mysql_db_1:customer"]
+        ] == [identities[privacy_request.id]["email"].lower()]
+
+
 @pytest.mark.integration_mariadb
 @pytest.mark.integration
 def test_mariadb_access_request_task(
@@ -1,3 +1,8 @@
+import asyncio
+from functools import partial
+from unittest import mock
+
+import httpx
 import pytest
 import requests_mock
 from datetime import (
@@ -364,3 +369,39 @@ class TestPrivacyRequestTriggerWebhooks:
             )
             with pytest.raises(ValidationError):
                 privacy_request.trigger_policy_webhook(webhook)
+
+    def test_atrigger_two_way_policy_webhook(
+        self,
+        db,
+        https_connection_config,
+        privacy_request,
+        policy,
+        policy_pre_execution_webhooks,
+    ):
+        webhook = policy_pre_execution_webhooks[1]
+        identity = PrivacyRequestIdentity(email="customer-1@example.com")
+        privacy_request.cache_identity(identity)
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            assert request.headers["reply-to"] == (
+                f"/privacy-request/{privacy_request.id}/resume"
+            )
+            return httpx.Response(
+                200,
+                json={
+                    "derived_identity": {"phone_number": "555-555-5555"},
+                    "halt": True,
+                },
+            )
+
+        transport = httpx.MockTransport(respond)
+        with mock.patch(
+            "httpx.AsyncClient", partial(httpx.AsyncClient, transport=transport)
+        ):
+            with pytest.raises(PrivacyRequestPaused):
+                asyncio.run(privacy_request.atrigger_policy_webhook(webhook))
+
+        assert privacy_request.get_cached_identity_data() == {
+            "email": "customer-1@example.com",
+            "phone_number": "555-555-5555",
+        }
@@ -1,5 +1,9 @@
+import asyncio
 from collections.abc import Generator
+from functools import partial
+from unittest import mock
 
+import httpx
 import pytest
 import requests_mock
 
@@ -54,3 +58,40 @@ class TestHttpConnectorMethods:
                 connector.execute(request_body, response_expected=True)
 
             assert exc.value.args[0] == "Client call failed with status code '500'"
+
+
+def mock_async_client(status_code: int, json=None, text=None):
+    """Patch httpx.AsyncClient to respond to every request with the given response"""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(status_code, json=json, text=text)
+    )
+    return mock.patch(
+        "httpx.AsyncClient", partial(httpx.AsyncClient, transport=transport)
+    )
+
+
+class TestHttpConnectorAsyncMethods:
+    @pytest.fixture(scope="function")
+    def connector(self, https_connection_config) -> Generator:
+        return HTTPSConnector(configuration=https_connection_config)
+
+    def test_aexecute_response_not_expected(self, connector):
+        with mock_async_client(200, json={"test": "response"}):
+            assert {} == asyncio.run(
+                connector.aexecute({"test": "response"}, response_expected=False)
+            )
+
+    def test_aexecute_response_expected(self, connector):
+        with mock_async_client(200, json={"test": "response"}):
+            assert {"test": "response"} == asyncio.run(
+                connector.aexecute({"test": "response"}, response_expected=True)
+            )
+
+    def test_aexecute_error(self, connector):
+        with mock_async_client(500, text="Error"):
+            with pytest.raises(ClientUnsuccessfulException) as exc:
+                asyncio.run(
+                    connector.aexecute({"test": "response"}, response_expected=True)
+                )
+
+            assert exc.value.args[0] == "Client call failed with status code '500'"
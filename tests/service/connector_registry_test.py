@@ -0,0 +1,142 @@
+from threading import Event, Thread
+from unittest import mock
+
+from sqlalchemy.engine import Engine
+
+from fidesops.core.config import config
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.service.connector_registry import ConnectorRegistry
+from fidesops.service.connectors import PostgreSQLConnector
+from fidesops.task.task_resources import Connections
+
+
+def postgres_config(host: str = "localhost") -> ConnectionConfig:
+    return ConnectionConfig(
+        key="registry_postgres",
+        connection_type=ConnectionType.postgres,
+        secrets={"host": host, "username": "postgres"},
+    )
+
+
+def test_connector_registry_reuses_client() -> None:
+    registry = ConnectorRegistry()
+    engine = registry.client(PostgreSQLConnector(postgres_config()))
+    assert registry.client(PostgreSQLConnector(postgres_config())) is engine
+    registry.close()
+
+
+def test_connector_registry_owner() -> None:
+    """Every connector to a connection gets the same owner, holding the shared client"""
+    registry = ConnectorRegistry()
+    owner = registry.owner(PostgreSQLConnector(postgres_config()))
+    assert registry.owner(PostgreSQLConnector(postgres_config())) is owner
+    assert registry.client(PostgreSQLConnector(postgres_config())) is owner.db_client
+
+    assert (
+        registry.owner(PostgreSQLConnector(postgres_config("db.example.com")))
+        is not owner
+    )
+    registry.close()
+
+
+def test_connector_registry_replaces_client_when_secrets_change() -> None:
+    registry = ConnectorRegistry()
+    engine = registry.client(PostgreSQLConnector(postgres_config()))
+
+    updated = registry.client(PostgreSQLConnector(postgres_config("db.example.com")))
+    assert updated is not engine
+    assert updated.url.host == "db.example.com"
+    registry.close()
+
+
+def test_connector_registry_closes_replaced_client_once_released() -> None:
+    """A client whose secrets change is only closed once the connectors using it are done"""
+    registry = ConnectorRegistry()
+    connector = PostgreSQLConnector(postgres_config())
+    connector.client_registry = registry
+    connector.client()
+    old_owner = registry.owner(connector)
+
+    with mock.patch.object(old_owner, "close") as close:
+        registry.client(PostgreSQLConnector(postgres_config("db.example.com")))
+        close.assert_not_called()
+
+        registry.release(connector)
+        close.assert_called_once()
+    registry.close()
+
+
+def test_connector_registry_closes_unused_client_when_replaced() -> None:
+    registry = ConnectorRegistry()
+    old_owner = registry.owner(PostgreSQLConnector(postgres_config()))
+
+    with mock.patch.object(old_owner, "close") as close:
+        registry.invalidate("registry_postgres")
+        close.assert_called_once()
+
+
+def test_connector_registry_creates_clients_per_connection() -> None:
+    """A connection whose client is slow to create doesn't hold up clients for other connections"""
+    registry = ConnectorRegistry()
+    started, finish = Event(), Event()
+
+    class SlowPostgreSQLConnector(PostgreSQLConnector):
+        def create_client(self) -> Engine:
+            started.set()
+            finish.wait(5)
+            return super().create_client()
+
+    slow = Thread(
+        target=registry.client, args=(SlowPostgreSQLConnector(postgres_config()),)
+    )
+    slow.start()
+    try:
+        assert started.wait(5)
+        other = ConnectionConfig(
+            key="registry_other",
+            connection_type=ConnectionType.postgres,
+            secrets={"host": "localhost", "username": "postgres"},
+        )
+        assert registry.client(PostgreSQLConnector(other)) is not None
+        assert slow.is_alive()
+    finally:
+        finish.set()
+        slow.join()
+    registry.close()
+
+
+def test_connector_registry_invalidate() -> None:
+    registry = ConnectorRegistry()
+    engine = registry.client(PostgreSQLConnector(postgres_config()))
+
+    registry.invalidate("registry_postgres")
+    assert registry.client(PostgreSQLConnector(postgres_config())) is not engine
+    registry.close()
+
+
+def test_connections_leave_shared_clients_open() -> None:
+    connections = Connections()
+    connector = connections.get_connector(postgres_config())
+    engine = connector.client()
+    connections.close()
+
+    # a later privacy request gets the same engine, and so the same connection pool
+    assert Connections().get_connector(postgres_config()).client() is engine
+
+
+def test_pool_options() -> None:
+    connector = PostgreSQLConnector(postgres_config())
+    assert connector.pool_options() == {
+        "pool_size": config.execution.POOL_SIZE,
+        "max_overflow": config.execution.POOL_MAX_OVERFLOW,
+        "pool_recycle": config.execution.POOL_RECYCLE,
+        "pool_pre_ping": config.execution.POOL_PRE_PING,
+    }
+
+    original_overrides = config.execution.POOL_OVERRIDES
+    config.execution.POOL_OVERRIDES = {"postgres": {"POOL_SIZE": 2}}
+    try:
+        assert connector.pool_options()["pool_size"] == 2
+        assert connector.create_client().pool.size() == 2
+    finally:
+        config.execution.POOL_OVERRIDES = original_overrides
@@ -0,0 +1,208 @@
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+from pymongo import UpdateMany, UpdateOne
+
+from fidesops.core.config import config
+from fidesops.graph.config import (
+    Collection,
+    CollectionAddress,
+    Dataset,
+    ScalarField,
+)
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.traversal import Traversal, TraversalNode
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.models.policy import Policy
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.service.connectors import MongoDBConnector
+
+from ...graph.graph_test_util import erasure_policy
+
+
+def customer_node(*primary_keys: str) -> TraversalNode:
+    dataset = Dataset(
+        name="mongo_test",
+        connection_key="mongo_test",
+        collections=[
+            Collection(
+                name="customer",
+                fields=[
+                    ScalarField(name="id", primary_key="id" in primary_keys),
+                    ScalarField(name="region", primary_key="region" in primary_keys),
+                    ScalarField(name="name", data_categories=["A"]),
+                    ScalarField(name="email", identity="email", data_categories=["B"]),
+                ],
+            )
+        ],
+    )
+    return Traversal(DatasetGraph(dataset), {"email": "X"}).traversal_node_dict[
+        CollectionAddress("mongo_test", "customer")
+    ]
+
+
+def mongo_connector() -> MongoDBConnector:
+    connector = MongoDBConnector(
+        ConnectionConfig(key="mongo_test", connection_type=ConnectionType.mongodb)
+    )
+    connector.db_client = MagicMock()
+    collection = connector.db_client["mongo_test"]["customer"]
+    collection.bulk_write.side_effect = lambda operations, ordered: MagicMock(
+        modified_count=len(operations)
+    )
+    return connector
+
+
+class FakeCursor:
+    """Records the options a cursor was given, and yields documents up to its limit"""
+
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self.documents = documents
+        self.options: Dict[str, Any] = {}
+        self.read = 0
+        self.closed = False
+
+    def batch_size(self, batch_size: int) -> "FakeCursor":
+        self.options["batch_size"] = batch_size
+        return self
+
+    def max_time_ms(self, max_time_ms: Optional[int]) -> "FakeCursor":
+        self.options["max_time_ms"] = max_time_ms
+        return self
+
+    def limit(self, limit: int) -> "FakeCursor":
+        self.options["limit"] = limit
+        return self
+
+    def __iter__(self):
+        for document in self.documents[: self.options.get("limit")]:
+            self.read += 1
+            yield document
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def find_documents(connector: MongoDBConnector, count: int) -> FakeCursor:
+    cursor = FakeCursor([{"id": i, "email": "X"} for i in range(count)])
+    connector.db_client["mongo_test"]["customer"].find.return_value = cursor
+    return cursor
+
+
+def test_retrieve_data_cursor_options() -> None:
+    connector = mongo_connector()
+    cursor = find_documents(connector, 5)
+
+    rows = connector.retrieve_data(
+        customer_node("id"), Policy(), PrivacyRequest(id="123"), {"email": ["X"]}
+    )
+
+    assert rows == cursor.documents
+    assert cursor.options == {"batch_size": config.execution.CURSOR_BATCH_SIZE}
+
+
+def test_retrieve_data_limits() -> None:
+    connector = mongo_connector()
+    cursor = find_documents(connector, 5)
+
+    original_max_rows = config.execution.MAX_ROWS_PER_NODE
+    original_max_time_ms = config.execution.MONGO_MAX_TIME_MS
+    config.execution.MAX_ROWS_PER_NODE = 2
+    config.execution.MONGO_MAX_TIME_MS = 500
+    try:
+        rows = connector.retrieve_data(
+            customer_node("id"), Policy(), PrivacyRequest(id="123"), {"email": ["X"]}
+        )
+    finally:
+        config.execution.MAX_ROWS_PER_NODE = original_max_rows
+        config.execution.MONGO_MAX_TIME_MS = original_max_time_ms
+
+    # one document over the limit is read, so the node knows to mark itself truncated
+    assert rows == cursor.documents[:3]
+    assert cursor.options == {
+        "batch_size": config.execution.CURSOR_BATCH_SIZE,
+        "max_time_ms": 500,
+        "limit": 3,
+    }
+
+
+def test_retrieve_data_batches_closes_cursor() -> None:
+    connector = mongo_connector()
+    cursor = find_documents(connector, 5)
+
+    batches = connector.retrieve_data_batches(
+        customer_node("id"), Policy(), PrivacyRequest(id="123"), {"email": ["X"]}, 2
+    )
+    assert next(batches) == cursor.documents[:2]
+    assert cursor.options == {"batch_size": 2}
+
+    # a node that stops reading early doesn't exhaust the cursor
+    batches.close()
+    assert cursor.read == 2
+    assert cursor.closed
+
+
+def bulk_writes(connector: MongoDBConnector) -> List[List[UpdateOne]]:
+    collection = connector.db_client["mongo_test"]["customer"]
+    for call in collection.bulk_write.call_args_list:
+        assert call.kwargs == {"ordered": False}
+    return [call.args[0] for call in collection.bulk_write.call_args_list]
+
+
+def test_mask_data_groups_identical_updates() -> None:
+    connector = mongo_connector()
+    rows = [
+        {"id": i, "region": "us", "name": f"name {i}", "email": f"{i}@example.com"}
+        for i in range(1, 6)
+    ]
+
+    original_batch_size = config.execution.ERASURE_BATCH_SIZE
+    config.execution.ERASURE_BATCH_SIZE = 2
+    try:
+        update_ct = connector.mask_data(
+            customer_node("id"),
+            erasure_policy("A", "B"),
+            PrivacyRequest(id="123"),
+            rows,
+        )
+    finally:
+        config.execution.ERASURE_BATCH_SIZE = original_batch_size
+
+    update = {"$set": {"name": None, "email": None}}
+    assert bulk_writes(connector) == [
+        [
+            UpdateMany({"id": {"$in": [1, 2]}}, update),
+            UpdateMany({"id": {"$in": [3, 4]}}, update),
+        ],
+        [UpdateMany({"id": {"$in": [5]}}, update)],
+    ]
+    assert update_ct == 3
+
+
+def test_mask_data_compound_primary_key() -> None:
+    connector = mongo_connector()
+    rows = [
+        {"id": i, "region": "us", "name": f"name {i}", "email": f"{i}@example.com"}
+        for i in range(1, 4)
+    ]
+
+    original_batch_size = config.execution.ERASURE_BATCH_SIZE
+    config.execution.ERASURE_BATCH_SIZE = 2
+    try:
+        connector.mask_data(
+            customer_node("id", "region"),
+            erasure_policy("A"),
+            PrivacyRequest(id="123"),
+            rows,
+        )
+    finally:
+        config.execution.ERASURE_BATCH_SIZE = original_batch_size
+
+    update = {"$set": {"name": None}}
+    assert bulk_writes(connector) == [
+        [
+            UpdateOne({"id": 1, "region": "us"}, update),
+            UpdateOne({"id": 2, "region": "us"}, update),
+        ],
+        [UpdateOne({"id": 3, "region": "us"}, update)],
+    ]
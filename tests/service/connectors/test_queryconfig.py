@@ -19,8 +19,10 @@ from fidesops.schemas.masking.masking_configuration import HashMaskingConfigurat
 from fidesops.schemas.masking.masking_secrets import MaskingSecretCache, SecretType
 from fidesops.service.connectors.query_config import (
     SQLQueryConfig,
+    MicrosoftSQLServerQueryConfig,
     MongoQueryConfig,
     SaaSQueryConfig,
+    statement_template_cache,
 )
 
 from fidesops.service.masking.strategy.masking_strategy_hash import (
@@ -173,6 +175,71 @@ class TestSQLQueryConfig:
             == "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE customer_id = :customer_id"
         )
 
+    def test_generated_sql_query_reuses_template(self):
+        config = SQLQueryConfig(payment_card_node)
+        first = config.generate_query({"id": ["A", "B"]})
+        second = config.generate_query({"id": ["C", "D", "E"]})
+
+        assert (
+            str(second)
+            == "SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN :id"
+        )
+        assert first.compile().params == {"id": ("A", "B")}
+        assert second.compile().params == {"id": ("C", "D", "E")}
+        # both queries are built from the same cached statement template
+        assert (
+            statement_template_cache.get(
+                (
+                    SQLQueryConfig,
+                    payment_card_node.address,
+                    tuple(config.field_map().keys()),
+                    (("id", None),),
+                )
+            )
+            is not None
+        )
+
+    def test_generated_sql_query_pads_in_lists(self):
+        config = MicrosoftSQLServerQueryConfig(payment_card_node)
+        query = config.generate_query({"id": ["A", "B", "C"], "customer_id": ["V"]})
+
+        in_list = ", ".join(f":id_in_stmt_generated_{i}" for i in range(8))
+        assert (
+            str(query)
+            == f"SELECT id,name,ccn,customer_id,billing_address_id FROM payment_card WHERE id IN ({in_list}) OR customer_id = :customer_id"
+        )
+        assert query.compile().params == {
+            **{f"id_in_stmt_generated_{i}": "C" for i in range(8)},
+            "id_in_stmt_generated_0": "A",
+            "id_in_stmt_generated_1": "B",
+            "customer_id": "V",
+        }
+
+        # any number of values up to the same bucket gives the same statement
+        eight_ids = ["D", "E", "F", "G", "H", "I", "J", "K"]
+        assert str(
+            config.generate_query({"id": eight_ids, "customer_id": ["W"]})
+        ) == str(query)
+
+    def test_generated_sql_query_pads_in_lists_within_bind_param_limit(self):
+        config = MicrosoftSQLServerQueryConfig(payment_card_node)
+        input_data = {
+            "id": [f"id_{i}" for i in range(300)],
+            "customer_id": [f"customer_{i}" for i in range(300)],
+        }
+        assert len(config.generate_query(input_data).compile().params) == 2 * 512
+
+        # IN lists aren't padded if that would take the statement over the parameter limit
+        config.max_bind_params = 1000
+        assert len(config.generate_query(input_data).compile().params) == 2 * 300
+
+    def test_in_list_arity(self):
+        config = MicrosoftSQLServerQueryConfig(payment_card_node)
+        assert [
+            config.in_list_arity(n, pad=True) for n in [1, 2, 8, 9, 64, 65, 512, 513]
+        ] == [1, 8, 8, 64, 64, 512, 512, 513]
+        assert config.in_list_arity(3, pad=False) == 3
+
     def test_update_rule_target_fields(
         self, erasure_policy, example_datasets, connection_config
     ):
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Dict, List
+from unittest import mock
+
+from fidesops.core.config import config
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.service.connectors.saas_connector import SaaSConnector
+
+
+def test_asend_all_bounded_by_task_concurrency(
+    example_saas_configs: Dict[str, Dict]
+) -> None:
+    connector = SaaSConnector(
+        ConnectionConfig(
+            key="mailchimp",
+            connection_type=ConnectionType.saas,
+            saas_config=example_saas_configs["mailchimp"],
+            secrets={"domain": "example.com", "username": "user", "api_key": "key"},
+        )
+    )
+    in_flight: List[int] = []
+    max_in_flight = [0]
+
+    async def asend(session, request_params):
+        in_flight.append(1)
+        max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return request_params[1]
+
+    original_concurrency = config.execution.TASK_CONCURRENCY
+    config.execution.TASK_CONCURRENCY = 2
+    try:
+        with mock.patch.object(connector.client(), "asend", side_effect=asend):
+            responses = asyncio.run(
+                connector.asend_all([("GET", f"/{i}", {}, None) for i in range(6)])
+            )
+    finally:
+        config.execution.TASK_CONCURRENCY = original_concurrency
+
+    assert responses == [f"/{i}" for i in range(6)]
+    assert max_in_flight[0] == 2
@@ -0,0 +1,387 @@
+import threading
+import time
+from typing import List
+
+import pytest
+from sqlalchemy import String, bindparam, create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.types import TypeDecorator
+
+from fidesops.core.config import config
+from fidesops.graph.config import (
+    Collection,
+    CollectionAddress,
+    Dataset,
+    ScalarField,
+)
+from fidesops.graph.graph import DatasetGraph
+from fidesops.graph.traversal import Traversal, TraversalNode
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.models.policy import Policy
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.service.connector_registry import ConnectorRegistry
+from fidesops.service.connectors import (
+    BigQueryConnector,
+    MicrosoftSQLServerConnector,
+    PostgreSQLConnector,
+)
+from fidesops.service.connectors.query_config import (
+    MicrosoftSQLServerQueryConfig,
+    SQLQueryConfig,
+)
+from fidesops.task.connection_limiter import connection_limiter
+from fidesops.util.collection_util import Row
+
+from ...graph.graph_test_util import erasure_policy
+from ...task.traversal_data import integration_db_graph
+
+traversal = Traversal(integration_db_graph("postgres_example"), {"email": "X"})
+customer_node = traversal.traversal_node_dict[
+    CollectionAddress("postgres_example", "customer")
+]
+
+
+class RecordingPostgreSQLConnector(PostgreSQLConnector):
+    """Returns a row per queried email instead of querying a database. Every query also
+    returns the same row with id 0."""
+
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        self.queried: List[List[str]] = []
+
+    def execute_query(self, stmt: TextClause) -> List[Row]:
+        params = stmt.compile().params
+        emails = list(params["email"])
+        self.queried.append(emails)
+        return [{"id": 0, "email": "shared"}] + [
+            {"id": int(email), "email": email} for email in emails
+        ]
+
+
+def retrieve(connector: RecordingPostgreSQLConnector, emails: List[str]) -> List[Row]:
+    return connector.retrieve_data(
+        customer_node, Policy(), PrivacyRequest(id="123"), {"email": emails}
+    )
+
+
+def test_max_in_values() -> None:
+    assert (
+        PostgreSQLConnector(ConnectionConfig(key="pg")).max_in_values is None
+    )
+    assert (
+        MicrosoftSQLServerConnector(ConnectionConfig(key="mssql")).max_in_values
+        == 2000
+    )
+    assert (
+        MicrosoftSQLServerConnector(
+            ConnectionConfig(key="mssql", max_in_values=500)
+        ).max_in_values
+        == 500
+    )
+
+
+def test_retrieve_data_in_one_query() -> None:
+    connector = RecordingPostgreSQLConnector(
+        ConnectionConfig(key="pg", connection_type=ConnectionType.postgres)
+    )
+    rows = retrieve(connector, ["1", "2", "3"])
+    assert connector.queried == [["1", "2", "3"]]
+    assert len(rows) == 4
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_retrieve_data_in_chunks(concurrency: int) -> None:
+    connector = RecordingPostgreSQLConnector(
+        ConnectionConfig(
+            key="pg",
+            connection_type=ConnectionType.postgres,
+            secrets={"host": "localhost"},
+            max_in_values=2,
+        )
+    )
+    original_concurrency = config.execution.QUERY_CHUNK_CONCURRENCY
+    config.execution.QUERY_CHUNK_CONCURRENCY = concurrency
+    try:
+        rows = retrieve(connector, ["1", "2", "3", "4", "5"])
+    finally:
+        config.execution.QUERY_CHUNK_CONCURRENCY = original_concurrency
+
+    assert sorted(connector.queried) == [["1", "2"], ["3", "4"], ["5"]]
+    # the row returned by every chunk is only returned once
+    assert rows == [
+        {"id": 0, "email": "shared"},
+        {"id": 1, "email": "1"},
+        {"id": 2, "email": "2"},
+        {"id": 3, "email": "3"},
+        {"id": 4, "email": "4"},
+        {"id": 5, "email": "5"},
+    ]
+
+
+class SlowRecordingPostgreSQLConnector(RecordingPostgreSQLConnector):
+    """Records the most queries that were in flight at once"""
+
+    def __init__(self, configuration: ConnectionConfig):
+        super().__init__(configuration)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def execute_query(self, stmt: TextClause) -> List[Row]:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return super().execute_query(stmt)
+
+
+@pytest.mark.parametrize("concurrency_limit,max_in_flight", [(2, 2), (1, 1), (None, 3)])
+def test_retrieve_data_in_chunks_within_concurrency_limit(
+    concurrency_limit, max_in_flight
+) -> None:
+    """Chunks run at once each hold a slot on the connection, besides the caller's own"""
+    connector = SlowRecordingPostgreSQLConnector(
+        ConnectionConfig(
+            key=f"pg_chunks_limited_to_{concurrency_limit}",
+            connection_type=ConnectionType.postgres,
+            secrets={"host": "localhost"},
+            max_in_values=1,
+            concurrency_limit=concurrency_limit,
+        )
+    )
+    original_concurrency = config.execution.QUERY_CHUNK_CONCURRENCY
+    config.execution.QUERY_CHUNK_CONCURRENCY = 3
+    try:
+        with connection_limiter.limit(connector.configuration):
+            rows = retrieve(connector, ["1", "2", "3", "4", "5"])
+    finally:
+        config.execution.QUERY_CHUNK_CONCURRENCY = original_concurrency
+
+    assert len(connector.queried) == 5
+    assert len(rows) == 6
+    assert connector.max_in_flight == max_in_flight
+
+
+class SQLiteConnector(PostgreSQLConnector):
+    """Runs against an in-memory sqlite database"""
+
+    def create_client(self) -> Engine:
+        return create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+    def query_config(self, node: TraversalNode) -> SQLQueryConfig:
+        # sqlite can't bind a tuple of values, so bind each one separately
+        return MicrosoftSQLServerQueryConfig(node)
+
+
+@pytest.fixture
+def sqlite_connector() -> SQLiteConnector:
+    connector = SQLiteConnector(ConnectionConfig(key="sqlite"))
+    with connector.client().begin() as connection:
+        connection.execute(
+            "CREATE TABLE customer (id INTEGER PRIMARY KEY, name TEXT, email TEXT)"
+        )
+        connection.execute(
+            "INSERT INTO customer VALUES (1, 'A', 'a@example.com'), (2, 'B', NULL), (3, 'C', 'c@example.com')"
+        )
+    yield connector
+    connector.close()
+
+
+def sqlite_customer_node() -> TraversalNode:
+    dataset = Dataset(
+        name="sqlite",
+        connection_key="sqlite",
+        collections=[
+            Collection(
+                name="customer",
+                fields=[
+                    ScalarField(name="id", primary_key=True),
+                    ScalarField(name="name", data_categories=["A"]),
+                    ScalarField(name="email", identity="email", data_categories=["B"]),
+                ],
+            )
+        ],
+    )
+    return Traversal(DatasetGraph(dataset), {"email": "X"}).traversal_node_dict[
+        CollectionAddress("sqlite", "customer")
+    ]
+
+
+def test_retrieve_data_streams_rows(sqlite_connector: SQLiteConnector) -> None:
+    original_batch_size = config.execution.CURSOR_BATCH_SIZE
+    config.execution.CURSOR_BATCH_SIZE = 2
+    try:
+        rows = sqlite_connector.retrieve_data(
+            sqlite_customer_node(),
+            Policy(),
+            PrivacyRequest(id="123"),
+            {"email": ["a@example.com", "c@example.com"]},
+        )
+    finally:
+        config.execution.CURSOR_BATCH_SIZE = original_batch_size
+
+    assert rows == [
+        {"id": 1, "name": "A", "email": "a@example.com"},
+        {"id": 3, "name": "C", "email": "c@example.com"},
+    ]
+
+
+def test_retrieve_data_batches(sqlite_connector: SQLiteConnector) -> None:
+    with sqlite_connector.client().begin() as connection:
+        connection.execute(
+            "INSERT INTO customer VALUES (4, 'D', 'a@example.com'), (5, 'E', 'a@example.com')"
+        )
+
+    batches = sqlite_connector.retrieve_data_batches(
+        sqlite_customer_node(),
+        Policy(),
+        PrivacyRequest(id="123"),
+        {"email": ["a@example.com"]},
+        2,
+    )
+    assert list(batches) == [
+        [
+            {"id": 1, "name": "A", "email": "a@example.com"},
+            {"id": 4, "name": "D", "email": "a@example.com"},
+        ],
+        [{"id": 5, "name": "E", "email": "a@example.com"}],
+    ]
+
+
+def test_retrieve_data_batches_releases_connection(
+    sqlite_connector: SQLiteConnector,
+) -> None:
+    """No connection is held while the caller handles a batch"""
+    with sqlite_connector.client().begin() as connection:
+        connection.execute(
+            "INSERT INTO customer VALUES (4, 'D', 'a@example.com'), (5, 'E', 'a@example.com')"
+        )
+    checked_out = []
+    engine = sqlite_connector.client()
+    event.listen(engine, "checkout", lambda *args: checked_out.append(1))
+    event.listen(engine, "checkin", lambda *args: checked_out.pop())
+
+    batches = sqlite_connector.retrieve_data_batches(
+        sqlite_customer_node(),
+        Policy(),
+        PrivacyRequest(id="123"),
+        {"email": ["a@example.com"]},
+        2,
+    )
+    for _ in batches:
+        assert checked_out == []
+
+
+def test_mask_data(sqlite_connector: SQLiteConnector) -> None:
+    node = sqlite_customer_node()
+    rows = [
+        {"id": 1, "name": "A", "email": "a@example.com"},
+        {"id": 2, "name": "B", "email": None},
+        {"id": 3, "name": "C", "email": "c@example.com"},
+        {"id": 4, "name": "D", "email": "d@example.com"},
+    ]
+
+    update_ct = sqlite_connector.mask_data(
+        node, erasure_policy("A", "B"), PrivacyRequest(id="123"), rows
+    )
+
+    # row 4 doesn't exist, so isn't counted
+    assert update_ct == 3
+    with sqlite_connector.client().connect() as connection:
+        assert list(connection.execute("SELECT * FROM customer ORDER BY id")) == [
+            (1, None, None),
+            (2, None, None),
+            (3, None, None),
+        ]
+
+
+def test_execute_updates_keeps_bind_types(sqlite_connector: SQLiteConnector) -> None:
+    """Updates sent together with executemany still process their values with their bind types"""
+
+    class Upper(TypeDecorator):
+        impl = String
+        cache_ok = True
+
+        def process_bind_param(self, value, dialect):
+            return value.upper()
+
+    update_stmts = [
+        text("UPDATE customer SET name = :name WHERE id = :id")
+        .bindparams(bindparam("name", type_=Upper))
+        .params(name=name, id=id)
+        for id, name in [(1, "x"), (2, "y")]
+    ]
+    with sqlite_connector.client().begin() as connection:
+        assert sqlite_connector.execute_updates(connection, update_stmts) == 2
+    with sqlite_connector.client().connect() as connection:
+        assert list(connection.execute("SELECT name FROM customer ORDER BY id")) == [
+            ("X",),
+            ("Y",),
+            ("C",),
+        ]
+
+
+def test_bigquery_mask_data(sqlite_connector: SQLiteConnector) -> None:
+    """BigQueryConnector reflects the table once, and masks rows that get the same values together"""
+    connector = BigQueryConnector(
+        ConnectionConfig(key="bigquery", connection_type=ConnectionType.bigquery)
+    )
+    connector.db_client = sqlite_connector.client()
+    node = sqlite_customer_node()
+    rows = [
+        {"id": 1, "name": "A", "email": "a@example.com"},
+        {"id": 2, "name": "B", "email": None},
+        {"id": 3, "name": "C", "email": "c@example.com"},
+    ]
+
+    table = connector.table(node)
+    assert connector.table(node) is table
+    update_stmts = connector.query_config(node).generate_updates(
+        rows, erasure_policy("A", "B"), PrivacyRequest(id="123"), table, 2
+    )
+    # masked to NULL in batches of 2 ids
+    assert [stmt.compile().params for stmt in update_stmts] == [
+        {"id_1": [1, 2]},
+        {"id_1": [3]},
+    ]
+
+    update_ct = connector.mask_data(
+        node, erasure_policy("A", "B"), PrivacyRequest(id="123"), rows
+    )
+    assert update_ct == 3
+    with sqlite_connector.client().connect() as connection:
+        assert list(connection.execute("SELECT * FROM customer ORDER BY id")) == [
+            (1, None, None),
+            (2, None, None),
+            (3, None, None),
+        ]
+
+
+def test_bigquery_tables_shared_through_registry(
+    sqlite_connector: SQLiteConnector,
+) -> None:
+    """Tables reflected for one privacy request are reused by later ones sharing the client"""
+
+    class SQLiteBigQueryConnector(BigQueryConnector):
+        def create_client(self) -> Engine:
+            return sqlite_connector.client()
+
+    registry = ConnectorRegistry()
+    connection_config = ConnectionConfig(
+        key="bigquery_shared", connection_type=ConnectionType.bigquery
+    )
+    first = SQLiteBigQueryConnector(connection_config)
+    first.client_registry = registry
+    second = SQLiteBigQueryConnector(connection_config)
+    second.client_registry = registry
+
+    node = sqlite_customer_node()
+    assert second.table(node) is first.table(node)
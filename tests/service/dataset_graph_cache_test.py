@@ -0,0 +1,66 @@
+from sqlalchemy.orm import Session
+
+from fidesops.graph.config import CollectionAddress
+from fidesops.models.datasetconfig import DatasetConfig
+from fidesops.service.dataset_graph_cache import DatasetGraphCache
+
+
+def test_dataset_graph_cache_reuses_graph(
+    dataset_config: DatasetConfig, db: Session
+) -> None:
+    cache = DatasetGraphCache()
+    graph = cache.get(db)
+    assert (
+        CollectionAddress("postgres_example_subscriptions_dataset", "subscriptions")
+        in graph.nodes
+    )
+    assert graph.version is not None
+    assert cache.get(db) is graph
+
+    cache.invalidate()
+    rebuilt = cache.get(db)
+    assert rebuilt is not graph
+    assert rebuilt.version == graph.version
+
+
+def test_dataset_graph_cache_rebuilds_after_dataset_changes(
+    dataset_config: DatasetConfig, db: Session
+) -> None:
+    cache = DatasetGraphCache()
+    graph = cache.get(db)
+
+    # changes made elsewhere, e.g. by another worker, are noticed without invalidating
+    dataset_config.dataset["collections"][0]["name"] = "renamed_subscriptions"
+    dataset_config.dataset = {**dataset_config.dataset}
+    dataset_config.save(db=db)
+
+    updated = cache.get(db)
+    assert updated is not graph
+    assert updated.version != graph.version
+    assert (
+        CollectionAddress(
+            "postgres_example_subscriptions_dataset", "renamed_subscriptions"
+        )
+        in updated.nodes
+    )
+
+
+def test_dataset_graph_cache_rebuilds_after_dataset_deleted(
+    dataset_config: DatasetConfig, db: Session
+) -> None:
+    other_dataset_config = DatasetConfig.create(
+        db=db,
+        data={
+            "connection_config_id": dataset_config.connection_config_id,
+            "fides_key": "other_dataset",
+            "dataset": {**dataset_config.dataset, "fides_key": "other_dataset"},
+        },
+    )
+    cache = DatasetGraphCache()
+    graph = cache.get(db)
+    assert CollectionAddress("other_dataset", "subscriptions") in graph.nodes
+
+    other_dataset_config.delete(db)
+
+    updated = cache.get(db)
+    assert CollectionAddress("other_dataset", "subscriptions") not in updated.nodes
@@ -1,4 +1,3 @@
-
 import pytest
 import time
 from typing import Any, Dict, List, Set
@@ -18,7 +17,7 @@ from pydantic import ValidationError
 from fidesops.common_exceptions import PrivacyRequestPaused, ClientUnsuccessfulException
 from fidesops.core.config import config
 from fidesops.models.policy import PolicyPreWebhook, ActionType
-from fidesops.models.privacy_request import PrivacyRequestStatus
+from fidesops.models.privacy_request import ExecutionLogStatus, PrivacyRequestStatus
 from fidesops.schemas.external_https import SecondPartyResponseFormat
 from fidesops.db.session import get_db_session
 from fidesops.models.privacy_request import PrivacyRequest, ExecutionLog
@@ -35,7 +34,13 @@ from fidesops.service.connectors.sql_connector import (
 )
 from fidesops.service.masking.strategy.masking_strategy_factory import get_strategy
 from fidesops.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
-from fidesops.service.privacy_request.request_runner_service import PrivacyRequestRunner
+from fidesops.service.privacy_request.request_runner_service import (
+    PrivacyRequestRunner,
+    run_pending_privacy_requests,
+    run_privacy_request_batch,
+)
+from fidesops.task.batch_graph_task import run_access_request_batch
+from fidesops.task.graph_task import run_access_request
 from fidesops.util.async_util import wait_for
 from fidesops.util.data_category import DataCategory
 
@@ -182,6 +187,145 @@ def test_create_and_process_access_request(
     assert ExecutionLog.get(db, id=log_id).privacy_request_id == pr_id
 
 
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_run_privacy_request_batch(
+    postgres_example_test_dataset_config_read_access,
+    postgres_integration_db,
+    db,
+    cache,
+    policy,
+):
+    """Access requests that share a policy are run as one traversal, and each request
+    gets the results for its own identity"""
+    emails = ["customer-1@example.com", "customer-2@example.com"]
+    privacy_requests: List[PrivacyRequest] = []
+    for email in emails:
+        privacy_request = PrivacyRequest.create(
+            db=db,
+            data={
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_id": policy.id,
+                "status": "pending",
+            },
+        )
+        privacy_request.cache_identity({"email": email})
+        privacy_requests.append(privacy_request)
+
+    with mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.run_access_request_batch",
+        wraps=run_access_request_batch,
+    ) as batch_mock, mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.run_access_request"
+    ) as run_access_request_mock:
+        run_privacy_request_batch([pr.id for pr in privacy_requests])
+
+    assert batch_mock.call_count == 1
+    assert not run_access_request_mock.called
+    for privacy_request, email in zip(privacy_requests, emails):
+        pr = PrivacyRequest.get(db=db, id=privacy_request.id)
+        assert pr.status == PrivacyRequestStatus.complete
+        results = pr.get_results()
+        customer_key = (
+            f"EN_{pr.id}__access_request__postgres_example_test_dataset:customer"
+        )
+        assert [row["email"] for row in results[customer_key]] == [email]
+        pr.delete(db=db)
+
+
+@pytest.mark.integration_postgres
+@pytest.mark.integration
+def test_run_privacy_request_batch_resumes_requests_alone(
+    postgres_example_test_dataset_config_read_access,
+    postgres_integration_db,
+    db,
+    cache,
+    policy,
+):
+    """A request that logged access progress in an earlier run isn't batched, so it can be
+    resumed from its checkpoints"""
+    emails = [
+        "customer-1@example.com",
+        "customer-2@example.com",
+        "jane@example.com",
+    ]
+    privacy_requests: List[PrivacyRequest] = []
+    for email in emails:
+        privacy_request = PrivacyRequest.create(
+            db=db,
+            data={
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_id": policy.id,
+                "status": "pending",
+            },
+        )
+        privacy_request.cache_identity({"email": email})
+        privacy_requests.append(privacy_request)
+    resumed = privacy_requests[2]
+    ExecutionLog.create(
+        db=db,
+        data={
+            "dataset_name": "postgres_example_test_dataset",
+            "collection_name": "customer",
+            "action_type": ActionType.access,
+            "status": ExecutionLogStatus.error,
+            "privacy_request_id": resumed.id,
+        },
+    )
+
+    with mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.run_access_request_batch",
+        wraps=run_access_request_batch,
+    ) as batch_mock, mock.patch(
+        "fidesops.service.privacy_request.request_runner_service.run_access_request",
+        wraps=run_access_request,
+    ) as run_access_request_mock:
+        run_privacy_request_batch([pr.id for pr in privacy_requests])
+
+    assert [pr.id for pr in batch_mock.call_args.kwargs["privacy_requests"]] == [
+        pr.id for pr in privacy_requests[:2]
+    ]
+    assert run_access_request_mock.call_count == 1
+    assert run_access_request_mock.call_args.kwargs["privacy_request"].id == resumed.id
+    for privacy_request in privacy_requests:
+        pr = PrivacyRequest.get(db=db, id=privacy_request.id)
+        assert pr.status == PrivacyRequestStatus.complete
+        pr.delete(db=db)
+
+
+@mock.patch(
+    "fidesops.service.privacy_request.request_runner_service.run_privacy_request_batch"
+)
+def test_run_pending_privacy_requests(
+    run_privacy_request_batch_mock: Mock,
+    db,
+    policy,
+):
+    privacy_requests: List[PrivacyRequest] = [
+        PrivacyRequest.create(
+            db=db,
+            data={
+                "requested_at": "2021-08-30T16:09:37.359Z",
+                "policy_id": policy.id,
+                "status": status,
+            },
+        )
+        for status in ["pending", "in_processing", "pending"]
+    ]
+
+    run_pending_privacy_requests()
+
+    assert run_privacy_request_batch_mock.call_count == 1
+    batch_ids: List[str] = run_privacy_request_batch_mock.call_args[0][0]
+    # the oldest pending requests are run first
+    assert [id for id in batch_ids if id in {pr.id for pr in privacy_requests}] == [
+        privacy_requests[0].id,
+        privacy_requests[2].id,
+    ]
+    for privacy_request in privacy_requests:
+        privacy_request.delete(db=db)
+
+
 @pytest.mark.integration
 @mock.patch("fidesops.models.privacy_request.PrivacyRequest.trigger_policy_webhook")
 def test_create_and_process_access_request_mssql(
@@ -352,7 +496,7 @@ def test_create_and_process_erasure_request_saas(
     erasure_policy_hmac,
     generate_auth_header,
     mailchimp_account_email,
-    reset_mailchimp_data
+    reset_mailchimp_data,
 ):
     customer_email = mailchimp_account_email
     data = {
@@ -1002,10 +1146,10 @@ def test_create_and_process_erasure_request_redshift(
 @pytest.mark.integration_external
 @pytest.mark.integration_bigquery
 def test_create_and_process_access_request_bigquery(
-        bigquery_resources,
-        db,
-        cache,
-        policy,
+    bigquery_resources,
+    db,
+    cache,
+    policy,
 ):
     customer_email = bigquery_resources["email"]
     customer_name = bigquery_resources["name"]
@@ -1039,12 +1183,12 @@ def test_create_and_process_access_request_bigquery(
 @pytest.mark.integration_external
 @pytest.mark.integration_bigquery
 def test_create_and_process_erasure_request_bigquery(
-        bigquery_example_test_dataset_config,
-        bigquery_resources,
-        integration_config: Dict[str, str],
-        db,
-        cache,
-        erasure_policy,
+    bigquery_example_test_dataset_config,
+    bigquery_resources,
+    integration_config: Dict[str, str],
+    db,
+    cache,
+    erasure_policy,
 ):
     customer_email = bigquery_resources["email"]
     data = {
@@ -0,0 +1,143 @@
+from unittest import mock
+
+import pytest
+
+from fidesops.core.config import config
+from fidesops.graph.config import CollectionAddress, ROOT_COLLECTION_ADDRESS
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.models.policy import Policy
+from fidesops.models.privacy_request import PrivacyRequest
+from fidesops.task.batch_graph_task import BatchGraphTask, split_batch_results
+from fidesops.task.graph_task import GraphTask
+from fidesops.task.task_resources import BatchTaskResources
+from .traversal_data import sample_traversal
+
+connection_configs = [
+    ConnectionConfig(key="mysql", connection_type=ConnectionType.postgres),
+    ConnectionConfig(key="postgres", connection_type=ConnectionType.postgres),
+    ConnectionConfig(key="mssql", connection_type=ConnectionType.mssql),
+]
+
+
+class TestSplitBatchResults:
+    @pytest.fixture
+    def customer_node(self):
+        t = sample_traversal()
+        return t.traversal_node_dict[CollectionAddress("mysql", "Customer")]
+
+    @pytest.fixture
+    def batch_rows(self):
+        return {
+            ROOT_COLLECTION_ADDRESS: [{"email": "A@x"}, {"email": "b@x"}],
+            CollectionAddress("mysql", "Customer"): [
+                {"customer_id": 1, "email": "a@x"},
+                {"customer_id": 2, "email": "b@x"},
+            ],
+        }
+
+    def test_split_batch_results_exact_match(self, customer_node, batch_rows) -> None:
+        """Rows are narrowed down to those matching the request's own input"""
+        with mock.patch.object(GraphTask, "retrieve_data") as retrieve_data:
+            results = split_batch_results(
+                PrivacyRequest(id="test_split_batch_results_exact_match"),
+                Policy(),
+                [customer_node],
+                connection_configs,
+                {"email": "b@x"},
+                batch_rows,
+            )
+        assert not retrieve_data.called
+        assert results == {"mysql:Customer": [{"customer_id": 2, "email": "b@x"}]}
+
+    def test_split_batch_results_loose_match(self, customer_node, batch_rows) -> None:
+        """A datastore comparing strings case-insensitively is queried again for the request"""
+        mysql_config = ConnectionConfig(
+            key="mysql", connection_type=ConnectionType.mysql
+        )
+        with mock.patch.object(
+            GraphTask,
+            "retrieve_data",
+            return_value=[{"customer_id": 1, "email": "a@x"}],
+        ) as retrieve_data:
+            results = split_batch_results(
+                PrivacyRequest(id="test_split_batch_results_loose_match"),
+                Policy(),
+                [customer_node],
+                [mysql_config],
+                {"email": "A@x"},
+                batch_rows,
+            )
+        retrieve_data.assert_called_once_with({"email": ["A@x"]})
+        assert results == {"mysql:Customer": [{"customer_id": 1, "email": "a@x"}]}
+
+    def test_split_batch_results_same_input(self, customer_node) -> None:
+        """Rows queried with the request's input alone are kept as they are"""
+        mysql_config = ConnectionConfig(
+            key="mysql", connection_type=ConnectionType.mysql
+        )
+        batch_rows = {
+            ROOT_COLLECTION_ADDRESS: [{"email": "A@x"}],
+            CollectionAddress("mysql", "Customer"): [
+                {"customer_id": 1, "email": "a@x"}
+            ],
+        }
+        with mock.patch.object(GraphTask, "retrieve_data") as retrieve_data:
+            results = split_batch_results(
+                PrivacyRequest(id="test_split_batch_results_same_input"),
+                Policy(),
+                [customer_node],
+                [mysql_config],
+                {"email": "A@x"},
+                batch_rows,
+            )
+        assert not retrieve_data.called
+        assert results == {"mysql:Customer": [{"customer_id": 1, "email": "a@x"}]}
+
+    def test_split_batch_results_max_rows(self, customer_node) -> None:
+        """MAX_ROWS_PER_NODE applies to each request's rows, not to the rows of the whole batch"""
+        privacy_requests = [
+            PrivacyRequest(id="test_split_batch_results_max_rows_a"),
+            PrivacyRequest(id="test_split_batch_results_max_rows_b"),
+        ]
+        customer_rows = [
+            {"customer_id": 1, "email": "a@x"},
+            {"customer_id": 2, "email": "a@x"},
+            {"customer_id": 3, "email": "a@x"},
+            {"customer_id": 4, "email": "b@x"},
+        ]
+        original_max_rows = config.execution.MAX_ROWS_PER_NODE
+        config.execution.MAX_ROWS_PER_NODE = 2
+        try:
+            task = BatchGraphTask(
+                customer_node,
+                BatchTaskResources(privacy_requests, Policy(), connection_configs),
+            )
+            task.connector.retrieve_data = lambda *args: customer_rows
+            batch_rows = {
+                ROOT_COLLECTION_ADDRESS: [{"email": "a@x"}, {"email": "b@x"}],
+                CollectionAddress("mysql", "Customer"): task.retrieve_data(
+                    {"email": ["a@x", "b@x"]}
+                ),
+            }
+            assert not task.truncated
+
+            results = [
+                split_batch_results(
+                    privacy_request,
+                    Policy(),
+                    [customer_node],
+                    connection_configs,
+                    identity,
+                    batch_rows,
+                )
+                for privacy_request, identity in zip(
+                    privacy_requests, batch_rows[ROOT_COLLECTION_ADDRESS]
+                )
+            ]
+        finally:
+            config.execution.MAX_ROWS_PER_NODE = original_max_rows
+
+        assert results == [
+            {"mysql:Customer": customer_rows[:2]},
+            {"mysql:Customer": customer_rows[3:]},
+        ]
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.task.connection_limiter import ConnectionLimiter
+
+
+def run_concurrently(limiter: ConnectionLimiter, config: ConnectionConfig) -> int:
+    """Run 6 simultaneous queries against the connection and return the max number in flight"""
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = [0]
+
+    def query() -> None:
+        with limiter.limit(config):
+            with lock:
+                in_flight.append(1)
+                max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+
+    threads = [threading.Thread(target=query) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return max_in_flight[0]
+
+
+class TestConnectionLimiter:
+    def test_limit(self) -> None:
+        limiter = ConnectionLimiter()
+        config = ConnectionConfig(
+            key="limited_postgres",
+            connection_type=ConnectionType.postgres,
+            concurrency_limit=2,
+        )
+        assert run_concurrently(limiter, config) == 2
+
+    def test_no_limit(self) -> None:
+        limiter = ConnectionLimiter()
+        config = ConnectionConfig(
+            key="unlimited_postgres", connection_type=ConnectionType.postgres
+        )
+        assert run_concurrently(limiter, config) == 6
+
+    def test_limit_shared_by_key(self) -> None:
+        """Separate ConnectionConfig instances for the same connection share one limit"""
+        limiter = ConnectionLimiter()
+        config_a = ConnectionConfig(key="shared", concurrency_limit=1)
+        config_b = ConnectionConfig(key="shared", concurrency_limit=1)
+        acquired = []
+
+        def query_b() -> None:
+            with limiter.limit(config_b):
+                acquired.append(1)
+
+        with limiter.limit(config_a):
+            thread = threading.Thread(target=query_b)
+            thread.start()
+            thread.join(timeout=0.1)
+            assert acquired == []
+        thread.join()
+        assert acquired == [1]
+
+    def test_changed_limit_takes_effect(self) -> None:
+        limiter = ConnectionLimiter()
+        config = ConnectionConfig(key="changing", concurrency_limit=1)
+        assert run_concurrently(limiter, config) == 1
+        config.concurrency_limit = 3
+        assert run_concurrently(limiter, config) == 3
+
+    def test_limit_additional(self) -> None:
+        """Only free slots are taken, without waiting for more"""
+        limiter = ConnectionLimiter()
+        config = ConnectionConfig(key="additional", concurrency_limit=3)
+        with limiter.limit(config):
+            with limiter.limit_additional(config, 5) as held:
+                assert held == 2
+                with limiter.limit_additional(config, 1) as held_elsewhere:
+                    assert held_elsewhere == 0
+            with limiter.limit_additional(config, 1) as held:
+                assert held == 1
+
+    def test_limit_additional_no_limit(self) -> None:
+        limiter = ConnectionLimiter()
+        config = ConnectionConfig(key="additional_unlimited")
+        with limiter.limit_additional(config, 5) as held:
+            assert held == 5
+
+
+def test_async_limit_shares_slots_with_sync_limit() -> None:
+    limiter = ConnectionLimiter()
+    config = ConnectionConfig(
+        key="limited_saas",
+        connection_type=ConnectionType.saas,
+        concurrency_limit=2,
+    )
+    in_flight = []
+    max_in_flight = [0]
+
+    async def query() -> None:
+        async with limiter.alimit(config):
+            in_flight.append(1)
+            max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.pop()
+
+    async def run_queries() -> None:
+        await asyncio.gather(*[query() for _ in range(6)])
+
+    asyncio.run(run_queries())
+    assert max_in_flight[0] == 2
+
+    # a slot held by a synchronous query leaves one for async queries
+    with limiter.limit(config):
+        max_in_flight[0] = 0
+        asyncio.run(run_queries())
+    assert max_in_flight[0] == 1
+
+
+def test_async_limit_cancelled_while_waiting_frees_its_slot() -> None:
+    limiter = ConnectionLimiter()
+    config = ConnectionConfig(
+        key="cancelled_saas",
+        connection_type=ConnectionType.saas,
+        concurrency_limit=1,
+    )
+
+    async def query() -> None:
+        async with limiter.alimit(config):
+            pass
+
+    async def cancel_waiting_query() -> None:
+        with limiter.limit(config):
+            waiting = asyncio.ensure_future(query())
+            await asyncio.sleep(0.05)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+        # the slot freed above is taken by the cancelled query's worker thread, then given back
+        await asyncio.wait_for(query(), timeout=1)
+
+    asyncio.run(cancel_waiting_query())
@@ -0,0 +1,130 @@
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from fidesops.task.execution_log_writer import ExecutionLogWriter
+
+
+class RecordingExecutionLogWriter(ExecutionLogWriter):
+    """Records batches instead of inserting them into the application db"""
+
+    def __init__(self, batch_size: int, flush_interval: float):
+        super().__init__(batch_size, flush_interval)
+        self.batches: List[List[Dict[str, Any]]] = []
+
+    def insert(self, batch: List[Dict[str, Any]]) -> None:
+        self.batches.append(batch)
+
+
+def test_execution_log_writer_batches_logs_in_order() -> None:
+    writer = RecordingExecutionLogWriter(batch_size=3, flush_interval=60)
+    for i in range(7):
+        writer.write(message=str(i))
+    writer.close()
+
+    assert [len(batch) for batch in writer.batches] == [3, 3, 1]
+    logs = [log for batch in writer.batches for log in batch]
+    assert [log["message"] for log in logs] == [str(i) for i in range(7)]
+    # logs sort by creation time in the order they were written
+    assert [log["created_at"] for log in logs] == sorted(
+        {log["created_at"] for log in logs}
+    )
+
+
+def test_execution_log_writer_flush() -> None:
+    writer = RecordingExecutionLogWriter(batch_size=100, flush_interval=60)
+    writer.write(message="a")
+    writer.write(message="b")
+    writer.flush()
+    assert [[log["message"] for log in batch] for batch in writer.batches] == [
+        ["a", "b"]
+    ]
+
+    writer.flush()
+    assert len(writer.batches) == 1
+    writer.close()
+
+
+def test_execution_log_writer_flush_interval() -> None:
+    writer = RecordingExecutionLogWriter(batch_size=100, flush_interval=0.01)
+    writer.write(message="a")
+    for _ in range(100):
+        if writer.batches:
+            break
+        time.sleep(0.01)
+    assert [[log["message"] for log in batch] for batch in writer.batches] == [["a"]]
+    writer.close()
+
+
+def test_execution_log_writer_is_reusable_after_close() -> None:
+    writer = RecordingExecutionLogWriter(batch_size=100, flush_interval=60)
+    writer.close()
+    writer.write(message="a")
+    writer.close()
+    writer.write(message="b")
+    writer.close()
+    assert [[log["message"] for log in batch] for batch in writer.batches] == [
+        ["a"],
+        ["b"],
+    ]
+
+
+def test_execution_log_writer_from_many_threads() -> None:
+    writer = RecordingExecutionLogWriter(batch_size=7, flush_interval=0.01)
+
+    def write_logs(thread: int) -> None:
+        for i in range(50):
+            writer.write(message=f"{thread}-{i}")
+
+    threads = [threading.Thread(target=write_logs, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    messages = [log["message"] for batch in writer.batches for log in batch]
+    assert len(messages) == 200
+    for t in range(4):
+        assert [m for m in messages if m.startswith(f"{t}-")] == [
+            f"{t}-{i}" for i in range(50)
+        ]
+
+
+class FailingExecutionLogWriter(RecordingExecutionLogWriter):
+    """Fails to insert any batch containing a log with the message 'fail'"""
+
+    def insert(self, batch: List[Dict[str, Any]]) -> None:
+        if any(log["message"] == "fail" for log in batch):
+            raise ConnectionError("database unavailable")
+        super().insert(batch)
+
+
+def test_execution_log_writer_flush_raises_failed_insert() -> None:
+    writer = FailingExecutionLogWriter(batch_size=1, flush_interval=60)
+    writer.write(message="a")
+    writer.write(message="fail")
+    writer.write(message="b")
+    with pytest.raises(ConnectionError):
+        writer.flush()
+    # the rest of the logs are still inserted, and the error is only raised once
+    assert [[log["message"] for log in batch] for batch in writer.batches] == [
+        ["a"],
+        ["b"],
+    ]
+    writer.flush()
+    writer.close()
+
+
+def test_execution_log_writer_close_logs_failed_insert(caplog) -> None:
+    writer = FailingExecutionLogWriter(batch_size=100, flush_interval=60)
+    writer.write(message="fail")
+    # the error is logged rather than raised, so it can't hide one raised by the privacy request
+    writer.close()
+    assert "Not every execution log was written to the database" in caplog.text
+
+    writer.write(message="a")
+    writer.close()
+    assert [[log["message"] for log in batch] for batch in writer.batches] == [["a"]]
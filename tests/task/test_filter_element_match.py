@@ -6,6 +6,7 @@ from fidesops.graph.config import FieldPath
 from fidesops.task.filter_element_match import (
     _expand_array_paths_to_preserve,
     filter_element_match,
+    filter_element_match_views,
     _remove_paths_from_row,
 )
 from fidesops.util.collection_util import FIDESOPS_DO_NOT_MASK_INDEX
@@ -263,6 +264,57 @@ class TestFilterElementMatchReplaceIndices:
         }
 
 
+class TestFilterElementMatchViews:
+    def test_no_array_match_shares_row(self):
+        row = {"A": "B", "C": {"D": ["E", "F"]}}
+        query_paths = {FieldPath("A"): ["B"]}
+        placeholder_row, filtered_row = filter_element_match_views(row, query_paths)
+        assert placeholder_row is row
+        assert filtered_row is row
+
+    def test_array_match(self):
+        row = {
+            "A": ["b", "c", "d", "e"],
+            "C": {"D": {"E": ["g", "h", "i", "j"], "G": "H"}},
+            "J": ["K", "L", "M"],
+        }
+        original = copy.deepcopy(row)
+        query_paths = {FieldPath("A"): ["c", "d"], FieldPath("C", "D", "E"): ["h", "i"]}
+        placeholder_row, filtered_row = filter_element_match_views(row, query_paths)
+
+        assert placeholder_row == filter_element_match(
+            copy.deepcopy(row), query_paths, delete_elements=False
+        )
+        assert filtered_row == filter_element_match(copy.deepcopy(row), query_paths)
+        assert row == original
+
+        # only filtered arrays and what contains them are copied
+        assert placeholder_row["J"] is row["J"]
+        assert filtered_row["J"] is row["J"]
+        assert filtered_row["C"] is not row["C"]
+
+    def test_filter_element_large_data(self, sample_data):
+        incoming_paths = {
+            FieldPath(
+                "F",
+            ): ["a"],
+            FieldPath("snacks"): ["pizza"],
+            FieldPath("thread", "comment"): ["com_0002"],
+        }
+        original = copy.deepcopy(sample_data)
+        placeholder_row, filtered_row = filter_element_match_views(
+            sample_data, incoming_paths
+        )
+
+        assert placeholder_row == filter_element_match(
+            copy.deepcopy(sample_data), incoming_paths, delete_elements=False
+        )
+        assert filtered_row == filter_element_match(
+            copy.deepcopy(sample_data), incoming_paths
+        )
+        assert sample_data == original
+
+
 class TestRemovePathsFromRowDeleteElements:
     """Test sub-method remove_paths_from_row. Non-matching targeted array elements are removed."""
 
@@ -3,21 +3,42 @@ import pytest
 import dask
 from bson import ObjectId
 
+from fidesops.core.config import config
 from fidesops.graph.config import (
+    ROOT_COLLECTION_ADDRESS,
+    TERMINATOR_ADDRESS,
+    Collection,
     CollectionAddress,
+    Dataset,
+    FieldAddress,
     FieldPath,
+    ScalarField,
 )
 from fidesops.graph.graph import DatasetGraph
 from fidesops.graph.traversal import Traversal
 from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
 from fidesops.models.policy import Policy, ActionType, RuleTarget, Rule
+from fidesops.models.privacy_request import (
+    ExecutionLog,
+    ExecutionLogStatus,
+    PrivacyRequest,
+)
 from fidesops.task.graph_task import (
     collect_queries,
     TaskResources,
     EMPTY_REQUEST,
     build_affected_field_logs,
+    erasure_dependencies,
+    skip_completed_access_tasks,
+    skip_completed_erasure_tasks,
+)
+from fidesops.task.task_executor import get_scheduler
+from fidesops.task.task_resources import completed_collections
+from .traversal_data import (
+    sample_traversal,
+    combined_mongo_postgresql_graph,
+    integration_db_graph,
 )
-from .traversal_data import sample_traversal, combined_mongo_postgresql_graph
 from ..graph.graph_test_util import (
     MockSqlTask,
     MockMongoTask,
@@ -35,9 +56,7 @@ connection_configs = [
 
 
 @pytest.fixture(scope="function")
-def combined_traversal_node_dict(
-    integration_mongodb_config, connection_config
-):
+def combined_traversal_node_dict(integration_mongodb_config, connection_config):
     mongo_dataset, postgres_dataset = combined_mongo_postgresql_graph(
         connection_config, integration_mongodb_config
     )
@@ -231,6 +250,154 @@ class TestPreProcessInputData:
             "thread.comment": ["com_0001", "com_0003", "com_0005", "com_0007"],
         }
 
+    def test_pre_process_input_data_deduplicates_values(self) -> None:
+        t = sample_traversal()
+        n = t.traversal_node_dict[CollectionAddress("mysql", "Address")]
+
+        task = MockSqlTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        customers_data = [
+            {"contact_address_id": 32},
+            {"contact_address_id": 31},
+            {"contact_address_id": 32},
+        ]
+        orders_data = [
+            {"billing_address_id": 31, "shipping_address_id": "31"},
+            {"billing_address_id": 1, "shipping_address_id": 32},
+        ]
+        # values are kept in the order they're first seen; values of different types are kept apart
+        assert task.pre_process_input_data(customers_data, orders_data) == {
+            "id": [32, 31, "31", 1]
+        }
+
+
+class TestRetrieveData:
+    @pytest.fixture
+    def task(self):
+        t = sample_traversal()
+        n = t.traversal_node_dict[CollectionAddress("mysql", "Address")]
+        task = MockSqlTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        task.queried = []
+
+        def retrieve_data(node, policy, privacy_request, input_data):
+            task.queried.append(input_data)
+            # a row matching every id queried, and one shared by every query
+            return [{"id": v} for v in input_data["id"]] + [{"id": 0}]
+
+        task.connector.retrieve_data = retrieve_data
+        return task
+
+    def test_retrieve_data(self, task) -> None:
+        assert task.retrieve_data({"id": [1, 2, 3]}) == [
+            {"id": 1},
+            {"id": 2},
+            {"id": 3},
+            {"id": 0},
+        ]
+        assert task.queried == [{"id": [1, 2, 3]}]
+
+    def test_retrieve_data_in_batches(self, task) -> None:
+        original_max_values = config.execution.MAX_QUERY_INPUT_VALUES
+        config.execution.MAX_QUERY_INPUT_VALUES = 2
+        try:
+            rows = task.retrieve_data({"id": [1, 2, 3, 4, 5]})
+        finally:
+            config.execution.MAX_QUERY_INPUT_VALUES = original_max_values
+
+        assert task.queried == [{"id": [1, 2]}, {"id": [3, 4]}, {"id": [5]}]
+        # without a primary key, a row returned by each batch can't be told apart from a
+        # genuine duplicate, so it's kept every time
+        assert rows == [
+            {"id": 1},
+            {"id": 2},
+            {"id": 0},
+            {"id": 3},
+            {"id": 4},
+            {"id": 0},
+            {"id": 5},
+            {"id": 0},
+        ]
+
+    def test_retrieve_data_in_batches_by_primary_key(self, task) -> None:
+        """A row returned by more than one batch is only kept once, even if its other values differ"""
+        task.traversal_node.node.collection.fields[0].primary_key = True
+        task.connector.retrieve_data = lambda node, policy, request, input_data: [
+            {"id": 0, "queried": input_data["id"]}
+        ]
+        original_max_values = config.execution.MAX_QUERY_INPUT_VALUES
+        config.execution.MAX_QUERY_INPUT_VALUES = 2
+        try:
+            rows = task.retrieve_data({"id": [1, 2, 3]})
+        finally:
+            config.execution.MAX_QUERY_INPUT_VALUES = original_max_values
+
+        assert rows == [{"id": 0, "queried": [1, 2]}]
+
+    def test_retrieve_data_max_rows(self, task) -> None:
+        original_max_rows = config.execution.MAX_ROWS_PER_NODE
+        config.execution.MAX_ROWS_PER_NODE = 2
+        try:
+            assert task.retrieve_data({"id": [1]}) == [{"id": 1}, {"id": 0}]
+            assert not task.truncated
+
+            assert task.retrieve_data({"id": [1, 2]}) == [{"id": 1}, {"id": 2}]
+            assert task.truncated
+        finally:
+            config.execution.MAX_ROWS_PER_NODE = original_max_rows
+
+    def test_retrieve_data_in_batches_max_rows(self, task) -> None:
+        original_max_values = config.execution.MAX_QUERY_INPUT_VALUES
+        original_max_rows = config.execution.MAX_ROWS_PER_NODE
+        config.execution.MAX_QUERY_INPUT_VALUES = 2
+        config.execution.MAX_ROWS_PER_NODE = 4
+        try:
+            rows = task.retrieve_data({"id": [1, 2, 3, 4, 5]})
+        finally:
+            config.execution.MAX_QUERY_INPUT_VALUES = original_max_values
+            config.execution.MAX_ROWS_PER_NODE = original_max_rows
+
+        # no more batches are queried once the node is truncated
+        assert task.queried == [{"id": [1, 2]}, {"id": [3, 4]}]
+        assert rows == [{"id": 1}, {"id": 2}, {"id": 0}, {"id": 3}]
+        assert task.truncated
+
+
+class TestFilterRowsByInput:
+    def test_filter_rows_by_input(self) -> None:
+        """Rows retrieved for a whole batch are narrowed down to those one request's input would match"""
+        t = sample_traversal()
+        n = t.traversal_node_dict[CollectionAddress("mysql", "Address")]
+
+        task = MockSqlTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        batch_rows = [
+            {"id": 1, "street": "A"},
+            {"id": 2, "street": "B"},
+            {"id": 31, "street": "C"},
+            {"id": 32, "street": "D"},
+        ]
+        request_input = task.pre_process_input_data(
+            [{"contact_address_id": 31}],
+            [{"billing_address_id": 1, "shipping_address_id": 1}],
+        )
+        assert task.filter_rows_by_input(request_input, batch_rows) == [
+            {"id": 1, "street": "A"},
+            {"id": 31, "street": "C"},
+        ]
+
+    def test_filter_rows_by_input_no_input(self) -> None:
+        t = sample_traversal()
+        n = t.traversal_node_dict[CollectionAddress("mysql", "Address")]
+
+        task = MockSqlTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        assert task.filter_rows_by_input({}, [{"id": 1, "street": "A"}]) == []
+
 
 class TestPostProcessInputData:
     def test_post_process_input_data_filter_match(
@@ -371,6 +538,98 @@ def test_mongo_dry_run_queries() -> None:
     )
 
 
+def test_erasure_dependencies() -> None:
+    """Collections are masked before the collections their masked keys reference"""
+    customers = Collection(
+        name="customer",
+        fields=[
+            ScalarField(name="id", primary_key=True),
+            ScalarField(name="email", identity="email", data_categories=["A"]),
+            ScalarField(
+                name="address_id",
+                references=[(FieldAddress("db", "address", "id"), "to")],
+            ),
+        ],
+    )
+    addresses = Collection(
+        name="address",
+        fields=[
+            ScalarField(name="id", primary_key=True),
+            ScalarField(name="street", data_categories=["A"]),
+        ],
+    )
+    orders = Collection(
+        name="orders",
+        fields=[
+            ScalarField(name="id", primary_key=True),
+            ScalarField(
+                name="customer_id",
+                references=[(FieldAddress("db", "customer", "id"), "from")],
+                data_categories=["A"],
+            ),
+            ScalarField(
+                name="shipping_address_id",
+                references=[(FieldAddress("db", "address", "id"), "to")],
+            ),
+        ],
+    )
+    graph = DatasetGraph(
+        Dataset(
+            name="db",
+            collections=[customers, addresses, orders],
+            connection_key="mysql",
+        )
+    )
+    traversal = Traversal(graph, {"email": "X"})
+    nodes = {
+        k: v for k, v in traversal.traversal_node_dict.items() if not v.is_root_node()
+    }
+
+    def address(collection: str) -> CollectionAddress:
+        return CollectionAddress("db", collection)
+
+    # only orders.customer_id is a masked key
+    assert erasure_dependencies(nodes, erasure_policy("A")) == {
+        address("customer"): {address("orders")},
+        address("address"): set(),
+        address("orders"): set(),
+    }
+    assert erasure_dependencies(nodes, erasure_policy("B")) == {
+        address("customer"): set(),
+        address("address"): set(),
+        address("orders"): set(),
+    }
+
+
+def test_erasure_dependencies_unmasked_keys() -> None:
+    """None of the keys of the example tables are masked, so none of them are ordered"""
+    traversal = Traversal(integration_db_graph("postgres_example"), {"email": "X"})
+    nodes = {
+        k: v for k, v in traversal.traversal_node_dict.items() if not v.is_root_node()
+    }
+    assert all(
+        not dependencies
+        for dependencies in erasure_dependencies(nodes, erasure_policy("A")).values()
+    )
+
+
+def test_erasure_dependencies_ignore_circular_references() -> None:
+    traversal = sample_traversal()
+    nodes = {
+        k: v for k, v in traversal.traversal_node_dict.items() if not v.is_root_node()
+    }
+    # mask every field, so every reference between collections is a masked key
+    for traversal_node in nodes.values():
+        for field in traversal_node.node.collection.field_dict.values():
+            field.data_categories = ["A"]
+
+    masked_first = erasure_dependencies(nodes, erasure_policy("A"))
+    assert any(masked_first.values())
+    for collection, dependencies in masked_first.items():
+        for dependency in dependencies:
+            assert collection not in masked_first[dependency]
+
+
 class TestBuildAffectedFieldLogs:
     @pytest.fixture(scope="function")
     def node_fixture(self):
@@ -483,3 +742,105 @@ class TestBuildAffectedFieldLogs:
                 "data_categories": ["A"],
             }
         ]
+
+
+class CheckpointResources:
+    """Stands in for the TaskResources of a privacy request resumed after a partial failure"""
+
+    def __init__(self, completed, cached_results) -> None:
+        self.request = PrivacyRequest(id="resumed")
+        self.completed = completed
+        self.cached_results = cached_results
+
+    def get_completed_collections(self, action_type: ActionType):
+        return self.completed.get(action_type, set())
+
+    def get_all_cached_objects(self):
+        return self.cached_results
+
+
+class TestCheckpoints:
+    customer = CollectionAddress("db", "customer")
+    address = CollectionAddress("db", "address")
+    orders = CollectionAddress("db", "orders")
+
+    def test_resume_access_request(self) -> None:
+        """Only the collections that didn't complete are queried again, seeded from the cached
+        results of the ones that did"""
+        queried = []
+
+        def query(address: CollectionAddress):
+            def run(*inputs):
+                queried.append(address)
+                return [{"collection": str(address), "inputs": list(inputs)}]
+
+            return run
+
+        dsk = {
+            ROOT_COLLECTION_ADDRESS: (lambda: [{"email": "customer-1@example.com"}],),
+            self.customer: (query(self.customer), ROOT_COLLECTION_ADDRESS),
+            self.address: (query(self.address), self.customer),
+            self.orders: (query(self.orders), self.customer),
+        }
+        customer_rows = [{"id": 1, "email": "customer-1@example.com"}]
+        resources = CheckpointResources(
+            # orders completed too, but its results weren't cached, so it runs again
+            {ActionType.access: {self.customer, self.orders}},
+            {str(self.customer): customer_rows},
+        )
+
+        skip_completed_access_tasks(dsk, resources)
+        dsk[TERMINATOR_ADDRESS] = (lambda *rows: rows, self.address, self.orders)
+        results = get_scheduler("synchronous")(dsk, TERMINATOR_ADDRESS)
+
+        assert sorted(queried, key=str) == [self.address, self.orders]
+        assert results[0] == [{"collection": "db:address", "inputs": [customer_rows]}]
+
+    def test_resume_erasure_request(self) -> None:
+        """Collections that were already masked are skipped, and the collections masked after
+        them still run"""
+        masked = []
+
+        def mask(address: CollectionAddress):
+            def run(_access_data, *_masked_first):
+                masked.append(address)
+                return 1
+
+            return run
+
+        masked_first = {
+            self.customer: {self.orders},
+            self.address: set(),
+            self.orders: set(),
+        }
+        dsk = {
+            k: (mask(k), [], *sorted(masked_first[k], key=str)) for k in masked_first
+        }
+        resources = CheckpointResources({ActionType.erasure: {self.orders}}, {})
+
+        skip_completed_erasure_tasks(dsk, resources, masked_first)
+        dsk[TERMINATOR_ADDRESS] = (lambda *counts: counts, *masked_first)
+        results = get_scheduler("synchronous")(dsk, TERMINATOR_ADDRESS)
+
+        assert sorted(masked, key=str) == [self.address, self.customer]
+        assert results == (1, 1, 0)
+
+    def test_completed_collections(self) -> None:
+        """A collection counts as completed only if its latest log is complete"""
+
+        def log(address: CollectionAddress, status: ExecutionLogStatus) -> ExecutionLog:
+            return ExecutionLog(
+                dataset_name=address.dataset,
+                collection_name=address.collection,
+                status=status,
+            )
+
+        logs = [
+            log(self.customer, ExecutionLogStatus.in_processing),
+            log(self.customer, ExecutionLogStatus.complete),
+            log(self.address, ExecutionLogStatus.complete),
+            # failed when the request was re-run
+            log(self.address, ExecutionLogStatus.error),
+            log(self.orders, ExecutionLogStatus.error),
+        ]
+        assert completed_collections(logs) == {self.customer}
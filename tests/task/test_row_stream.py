@@ -0,0 +1,57 @@
+import threading
+
+from fidesops.graph.config import CollectionAddress
+from fidesops.task.row_stream import RowStream
+
+parent_a = CollectionAddress("db", "a")
+parent_b = CollectionAddress("db", "b")
+
+
+def test_row_stream_ends_when_all_senders_close() -> None:
+    stream = RowStream([parent_a, parent_b], max_batches=10)
+    stream.send(parent_a, [{"id": 1}])
+    stream.close(parent_a)
+    stream.send(parent_b, [{"id": 2}])
+    stream.send(parent_b, [{"id": 3}])
+    stream.close(parent_b)
+
+    assert list(stream) == [
+        (parent_a, [{"id": 1}]),
+        (parent_b, [{"id": 2}]),
+        (parent_b, [{"id": 3}]),
+    ]
+
+
+def test_row_stream_bounds_buffered_batches() -> None:
+    stream = RowStream([parent_a], max_batches=2)
+    batches = iter(stream)
+    stream.send(parent_a, [{"id": 0}])
+    assert next(batches) == (parent_a, [{"id": 0}])
+    sent = []
+
+    def sender() -> None:
+        for i in range(1, 6):
+            stream.send(parent_a, [{"id": i}])
+            sent.append(i)
+        stream.close(parent_a)
+
+    thread = threading.Thread(target=sender)
+    thread.start()
+    thread.join(timeout=0.2)
+    # once the stream is being read, the sender is blocked until there's room
+    assert thread.is_alive()
+    assert len(sent) == 2
+
+    assert [rows for _, rows in batches] == [[{"id": i}] for i in range(1, 6)]
+    thread.join()
+    assert len(sent) == 5
+
+
+def test_row_stream_buffers_batches_until_read() -> None:
+    """Senders don't wait on a stream whose reader hasn't started"""
+    stream = RowStream([parent_a], max_batches=2)
+    for i in range(5):
+        stream.send(parent_a, [{"id": i}])
+    stream.close(parent_a)
+
+    assert [rows for _, rows in stream] == [[{"id": i}] for i in range(5)]
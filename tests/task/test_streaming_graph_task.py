@@ -0,0 +1,78 @@
+from threading import BoundedSemaphore
+from unittest import mock
+
+from fidesops.graph.config import CollectionAddress
+from fidesops.models.connectionconfig import ConnectionConfig, ConnectionType
+from fidesops.models.policy import Policy
+from fidesops.task.row_stream import RowStream
+from fidesops.task.streaming_graph_task import StreamingGraphTask
+from fidesops.task.task_resources import TaskResources
+from fidesops.task.graph_task import EMPTY_REQUEST
+from .traversal_data import sample_traversal
+
+connection_configs = [
+    ConnectionConfig(key="mysql", connection_type=ConnectionType.postgres),
+    ConnectionConfig(key="postgres", connection_type=ConnectionType.postgres),
+    ConnectionConfig(key="mssql", connection_type=ConnectionType.mssql),
+]
+
+
+class TestStreamAccessRequest:
+    def test_stream_access_request_closes_outboxes_on_error(self) -> None:
+        """Children aren't left waiting if the node fails before it has started reading"""
+        t = sample_traversal()
+        n = t.traversal_node_dict[CollectionAddress("mysql", "Address")]
+        task = StreamingGraphTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        inbox = RowStream(task.input_keys, max_batches=1)
+        for input_key in task.input_keys:
+            inbox.close(input_key)
+        outbox = RowStream([task.key], max_batches=1)
+
+        with mock.patch.object(
+            task, "log_start", side_effect=Exception("failed to log")
+        ), mock.patch.object(task, "log_end") as log_end:
+            assert (
+                task.stream_access_request(inbox, [outbox], BoundedSemaphore(1)) == []
+            )
+        assert log_end.called
+        assert list(outbox) == []
+
+    def test_stream_access_request_retries_queries(self) -> None:
+        """A failed query is retried the way other node functions are, without sleeping on the thread"""
+        t = sample_traversal()
+        n = t.traversal_node_dict[CollectionAddress("mysql", "Address")]
+        task = StreamingGraphTask(
+            n, TaskResources(EMPTY_REQUEST, Policy(), connection_configs)
+        )
+        inbox = RowStream(task.input_keys, max_batches=2)
+        sender = task.input_keys[0]
+        inbox.send(sender, [{"contact_address_id": 1}])
+        for input_key in task.input_keys:
+            inbox.close(input_key)
+        outbox = RowStream([task.key], max_batches=2)
+        attempts = []
+
+        def retrieve_data_batches(input_data, query_slots):
+            attempts.append(input_data)
+            if len(attempts) == 1:
+                raise Exception("connection dropped")
+            yield [{"id": 1}]
+
+        with mock.patch.object(
+            task, "retrieve_data_batches", side_effect=retrieve_data_batches
+        ), mock.patch.object(task, "log_start"), mock.patch.object(
+            task, "log_retry"
+        ) as log_retry, mock.patch.object(
+            task, "log_end"
+        ), mock.patch(
+            "fidesops.task.task_executor.sleep_without_slot"
+        ) as sleep_without_slot:
+            rows = task.stream_access_request(inbox, [outbox], BoundedSemaphore(1))
+
+        assert rows == [{"id": 1}]
+        assert attempts == [{"id": [1]}, {"id": [1]}]
+        assert log_retry.call_count == 1
+        assert sleep_without_slot.call_count == 1
+        assert list(outbox) == [(task.key, [{"id": 1}])]
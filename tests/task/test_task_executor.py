@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from operator import add
+from unittest import mock
+
+import pytest
+
+from fidesops.task.task_executor import (
+    asleep_without_slot,
+    get_scheduler,
+    is_async_executor,
+    retry_after,
+)
+
+
+def simple_graph():
+    return {"a": 1, "b": 2, "c": (add, "a", "b"), "d": (add, "c", "a")}
+
+
+@pytest.mark.parametrize("executor_type", ["threads", "synchronous", "asyncio"])
+def test_get_scheduler_runs_graph(executor_type) -> None:
+    scheduler = get_scheduler(executor_type, 2)
+    assert scheduler(simple_graph(), "d") == 4
+
+
+def test_get_scheduler_invalid_type() -> None:
+    with pytest.raises(ValueError):
+        get_scheduler("not_a_backend", 2)
+
+
+def test_threaded_scheduler_bounded_by_concurrency() -> None:
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def task() -> int:
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+        return 1
+
+    dsk = {f"t{i}": (task,) for i in range(8)}
+    dsk["end"] = (lambda *vals: sum(vals), *[f"t{i}" for i in range(8)])
+
+    assert get_scheduler("threads", 3)(dsk, "end") == 8
+    assert max(max_running) == 3
+
+    max_running.clear()
+    assert get_scheduler("synchronous", 3)(dsk, "end") == 8
+    assert max(max_running) == 1
+
+
+@pytest.mark.parametrize("executor_type", ["threads", "synchronous"])
+def test_scheduler_tasks_waiting_to_retry_release_their_worker(executor_type) -> None:
+    finished = []
+
+    def waiting_task() -> int:
+        def continuation() -> int:
+            finished.append("waiting")
+            return 1
+
+        return retry_after(0.3, continuation)
+
+    def quick_task() -> int:
+        finished.append("quick")
+        return 1
+
+    dsk = {"waiting": (waiting_task,), "quick": (quick_task,)}
+    dsk["end"] = (lambda *vals: sum(vals), "waiting", "quick")
+
+    # with a single worker, the quick task runs while the other waits
+    assert get_scheduler(executor_type, 1)(dsk, "end") == 2
+    assert finished == ["quick", "waiting"]
+
+
+def test_retry_after_outside_executor_waits() -> None:
+    with mock.patch(
+        "fidesops.task.task_executor.sleep_without_slot"
+    ) as sleep_without_slot:
+        assert retry_after(0.3, lambda: 1) == 1
+    sleep_without_slot.assert_called_once_with(0.3)
+
+
+def test_threaded_scheduler_raises_task_errors() -> None:
+    def failing_task() -> int:
+        raise ValueError("failed")
+
+    dsk = {"a": 1, "b": (failing_task,), "end": (add, "a", "b")}
+    with pytest.raises(ValueError):
+        get_scheduler("threads", 2)(dsk, "end")
+
+
+def test_async_scheduler_tasks_waiting_to_retry_release_their_slot() -> None:
+    finished = []
+
+    async def waiting_task() -> int:
+        await asleep_without_slot(0.2)
+        finished.append("waiting")
+        return 1
+
+    async def quick_task() -> int:
+        finished.append("quick")
+        return 1
+
+    async def total(*values: int) -> int:
+        return sum(values)
+
+    dsk = {"waiting": (waiting_task,), "quick": (quick_task,)}
+    dsk["end"] = (total, "waiting", "quick")
+
+    assert get_scheduler("asyncio", 1)(dsk, "end") == 2
+    assert finished == ["quick", "waiting"]
+
+
+def test_async_scheduler_awaits_coroutines_concurrently() -> None:
+    running = []
+    max_running = []
+
+    async def task(value: int) -> int:
+        running.append(1)
+        max_running.append(len(running))
+        await asyncio.sleep(0.05)
+        running.pop()
+        return value
+
+    async def total(*values: int) -> int:
+        return sum(values)
+
+    dsk = {f"t{i}": (task, i) for i in range(8)}
+    dsk["input"] = (task, [1, 2])  # unhashable arguments are passed through as values
+    dsk["end"] = (total, *[f"t{i}" for i in range(8)])
+
+    assert get_scheduler("asyncio", 3)(dsk, "end") == sum(range(8))
+    assert max(max_running) == 3
+    assert get_scheduler("asyncio", 3)(dsk, "input") == [1, 2]
+
+
+def test_is_async_executor() -> None:
+    assert is_async_executor("asyncio")
+    assert not is_async_executor("threads")
+    assert not is_async_executor("synchronous")
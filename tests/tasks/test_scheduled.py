@@ -1,6 +1,10 @@
+from datetime import timedelta
+
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from fidesops.core.config import config
 from fidesops.models.privacy_request import PrivacyRequestStatus
 from fidesops.schemas.storage.storage import (
     StorageDetails,
@@ -10,8 +14,10 @@ from fidesops.service.privacy_request.request_runner_service import (
 )
 from fidesops.tasks.scheduled.scheduler import scheduler
 from fidesops.tasks.scheduled.tasks import (
+    initiate_scheduled_request_batches,
     initiate_scheduled_request_intake,
     ONETRUST_INTAKE_TASK,
+    PRIVACY_REQUEST_BATCH_TASK,
 )
 
 
@@ -46,3 +52,18 @@ def test_initiate_scheduled_paused_privacy_request_followup(
     job = scheduler.get_job(job_id=privacy_request.id)
     assert job is not None
     assert isinstance(job.trigger, DateTrigger)
+
+
+def test_initiate_scheduled_request_batches() -> None:
+    original_interval = config.execution.REQUEST_BATCH_INTERVAL
+    config.execution.REQUEST_BATCH_INTERVAL = 60
+    initiate_scheduled_request_batches()
+    config.execution.REQUEST_BATCH_INTERVAL = original_interval
+    job = scheduler.get_job(job_id=PRIVACY_REQUEST_BATCH_TASK)
+    assert job is not None
+    assert isinstance(job.trigger, IntervalTrigger)
+    assert job.trigger.interval == timedelta(seconds=60)
+
+    # batches aren't run unless REQUEST_BATCH_INTERVAL is set
+    initiate_scheduled_request_batches()
+    assert scheduler.get_job(job_id=PRIVACY_REQUEST_BATCH_TASK) is None
@@ -2,9 +2,13 @@ from typing import Dict, List
 
 from fidesops.util.collection_util import (
     append,
+    chunk_values,
     partition,
     filter_nonempty_values,
     merge_dicts,
+    row_key,
+    unique,
+    unique_rows,
 )
 
 
@@ -47,3 +51,36 @@ def test_filter_nonempty_values() -> None:
     assert filter_nonempty_values({"B": None}) == {}
     assert filter_nonempty_values({}) == {}
     assert filter_nonempty_values(None) == {}
+
+
+def test_unique() -> None:
+    assert unique([2, 1, 2, "2", 1.0]) == [2, 1, "2", 1.0]
+    assert unique([{"A": 1}, {"A": 1}, [1], [1]]) == [{"A": 1}, [1]]
+    assert unique([]) == []
+
+
+def test_chunk_values() -> None:
+    values = {"A": [1, 2, 3], "B": [4]}
+    assert chunk_values(values, 4) == [values]
+    assert chunk_values(values, 2) == [{"A": [1, 2]}, {"A": [3], "B": [4]}]
+    assert chunk_values(values, 3) == [{"A": [1, 2, 3]}, {"B": [4]}]
+    assert chunk_values({}, 1) == [{}]
+
+
+def test_row_key() -> None:
+    assert row_key(["id"], {"id": 1, "name": "A"}) == row_key(["id"], {"id": 1})
+    assert row_key(["id"], {"id": 1}) != row_key(["id"], {"id": "1"})
+    # rows missing a primary key value can't be told apart from genuine duplicates
+    assert row_key(["id"], {"name": "A"}) is None
+    assert row_key([], {"id": 1, "name": "A"}) is None
+
+
+def test_unique_rows() -> None:
+    rows = [{"id": 1, "name": "A"}, {"id": 1, "name": "B"}, {"id": 2}]
+    assert unique_rows(["id"], rows) == [{"id": 1, "name": "A"}, {"id": 2}]
+    # duplicate rows are kept when there is no primary key to compare
+    assert unique_rows([], rows + rows) == rows + rows
+    assert unique_rows(["id"], [{"name": "A"}, {"name": "A"}]) == [
+        {"name": "A"},
+        {"name": "A"},
+    ]
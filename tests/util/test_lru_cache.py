@@ -0,0 +1,19 @@
+from fidesops.util.lru_cache import LRUCache
+
+
+def test_lru_cache() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    assert cache.get("A") is None
+    cache.set("A", 1)
+    cache.set("B", 2)
+    assert cache.get("A") == 1
+    # "B" is now the least recently used value, so it is dropped first
+    cache.set("C", 3)
+    assert len(cache) == 2
+    assert cache.get("B") is None
+    assert cache.get("A") == 1
+    assert cache.get("C") == 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("A") is None
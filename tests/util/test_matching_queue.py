@@ -14,3 +14,58 @@ def test_queue() -> None:
     queue.pop()
     queue.push_if_new("C")
     assert queue.data == ["C"]
+
+
+def test_queue_values_are_unique() -> None:
+    queue = MatchingQueue("A", "B")
+    queue.push("A")
+    queue.push_if_new("B")
+    assert queue.data == ["A", "B"]
+    assert repr(queue) == "Queue ['A', 'B']"
+
+
+def test_queue_pop_first_ready() -> None:
+    queue = MatchingQueue("A")
+    queue.push("B", blocked_on=["x"])
+    queue.push("C", blocked_on=["x", "y"])
+    queue.push("D")
+
+    assert queue.pop_first_ready() == "A"
+    assert queue.pop_first_ready() == "D"
+    assert queue.pop_first_ready() is None
+    assert queue.data == ["B", "C"]
+
+    queue.release("x")
+    queue.release("unknown")
+    assert queue.pop_first_ready() == "B"
+    assert queue.pop_first_ready() is None
+
+    queue.release("y")
+    assert queue.pop_first_ready() == "C"
+    assert queue.is_empty()
+
+
+def test_queue_ready_values_keep_push_order() -> None:
+    queue = MatchingQueue()
+    queue.push("A", blocked_on=["x"])
+    queue.push("B")
+    queue.push("C", blocked_on=["x"])
+    queue.release("x")
+    assert [queue.pop_first_ready() for _ in range(3)] == ["A", "B", "C"]
+
+
+def test_queue_blocked_values_can_be_popped_directly() -> None:
+    queue = MatchingQueue()
+    queue.push("A", blocked_on=["x"])
+    assert queue.pop() == "A"
+    queue.release("x")
+    assert queue.pop_first_ready() is None
+
+    # a value pushed again waits on its new keys only
+    queue.push("A", blocked_on=["y"])
+    queue.push("B")
+    queue.release("x")
+    assert queue.pop_first_ready() == "B"
+    assert queue.pop_first_ready() is None
+    queue.release("y")
+    assert queue.pop_first_ready() == "A"